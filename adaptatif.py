@@ -0,0 +1,279 @@
+from typing import Iterable, Iterator, Tuple, Union
+from arbre_tableau import ArbreTableau, NoeudTableau
+from ecrivain_bits import EcrivainBits
+
+
+class HuffmanAdaptatif:
+    """
+    Huffman adaptatif (algorithme FGK) : l'arbre est mis à jour après
+    chaque symbole, de la même façon à l'encodage et au décodage. Aucune
+    table n'est stockée et le texte est lu une seule fois, ce qui convient
+    aux tubes et aux flux qu'on ne peut pas relire.
+
+    Un symbole jamais vu est écrit comme le code de la feuille NYT
+    ("not yet transmitted", poids 0) suivi de sa valeur brute : 21 bits
+    (point de code Unicode) en mode texte, 9 bits en mode octets. La valeur
+    brute maximale (tous les bits à 1) marque la fin du flux.
+
+    Les nœuds sont rangés par poids décroissants (propriété de fratrie) :
+    ordre[rang] donne le nœud d'un rang, la racine a le rang 0 et la feuille
+    NYT le dernier rang. Avant d'incrémenter un nœud, on l'échange avec le
+    premier nœud de même poids pour garder cet ordre.
+
+    Une instance sert soit à encoder, soit à décoder un flux.
+    """
+
+    def __init__(self, octets: bool = False):
+        """
+        Args:
+            octets: Symboles = octets bruts (bytes) au lieu de caractères
+        """
+        self.octets = octets
+        self.largeur = 9 if octets else 21
+        self.fin = (1 << self.largeur) - 1
+        self.vide = b"" if octets else ""
+
+        self.arbre = ArbreTableau()
+        self.nyt = self.arbre.ajouter()  # La racine est d'abord la feuille NYT
+        self.ordre = [self.nyt]          # Nœud de chaque rang
+        self.rangs = [0]                 # Rang de chaque nœud
+        self.chefs = {0: 0}              # Poids -> premier rang ayant ce poids
+        self.feuilles = {}               # Symbole -> feuille
+
+        self.ecrivain = EcrivainBits()
+        self.nb_symboles = 0
+
+        # État du décodage entre deux morceaux
+        self._noeud = 0
+        self._nb_brut = self.largeur     # Bits bruts restant à lire (0 : dans l'arbre)
+        self._brut = 0
+        self.termine = False
+
+    @property
+    def racine(self) -> NoeudTableau:
+        """Vue sur la racine de l'arbre courant (même interface que NoeudHuffman)"""
+        return NoeudTableau(self.arbre, 0)
+
+    def encoder(self, morceau: Union[str, bytes]) -> bytes:
+        """
+        Encode un morceau et met l'arbre à jour symbole par symbole.
+
+        Returns:
+            Les octets complets produits : seuls les bits du dernier octet
+            incomplet (moins de 8) restent en attente
+        """
+        sortie = bytearray()
+        ecrire = self.ecrivain.ecrire
+
+        for symbole in morceau:
+            feuille = self.feuilles.get(symbole)
+            if feuille is None:
+                sortie += ecrire(*self._chemin(self.nyt))
+                sortie += ecrire(symbole if self.octets else ord(symbole), self.largeur)
+            else:
+                sortie += ecrire(*self._chemin(feuille))
+            self._mettre_a_jour(symbole)
+
+        self.nb_symboles += len(morceau)
+        return bytes(sortie)
+
+    def terminer(self) -> Tuple[bytes, int]:
+        """
+        Écrit la marque de fin et complète le dernier octet.
+
+        Returns:
+            (derniers octets, nombre de bits de bourrage ajoutés)
+        """
+        sortie = self.ecrivain.ecrire(*self._chemin(self.nyt))
+        sortie += self.ecrivain.ecrire(self.fin, self.largeur)
+        dernier, bourrage = self.ecrivain.terminer()
+        return sortie + dernier, bourrage
+
+    def encoder_flux(self, morceaux: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+        """Encode des morceaux successifs, marque de fin comprise"""
+        for morceau in morceaux:
+            octets = self.encoder(morceau)
+            if octets:
+                yield octets
+        yield self.terminer()[0]
+
+    def decoder(self, donnees: bytes) -> Union[str, bytes]:
+        """
+        Décode un morceau de données encodées. Un code peut être coupé entre
+        deux morceaux : l'état du décodage est conservé d'un appel à l'autre.
+        Les bits qui suivent la marque de fin sont ignorés (voir termine).
+
+        Returns:
+            Les symboles décodés dans ce morceau
+
+        Raises:
+            ValueError: si les données sont corrompues
+        """
+        gauches = self.arbre.gauches
+        droites = self.arbre.droites
+        symboles = self.arbre.symboles
+        decodes = bytearray() if self.octets else []
+        ajouter = decodes.append
+        noeud, nb_brut, brut = self._noeud, self._nb_brut, self._brut
+
+        for octet in donnees:
+            if self.termine:
+                break
+            for decalage in range(7, -1, -1):
+                bit = (octet >> decalage) & 1
+
+                if nb_brut:
+                    # Valeur brute d'un nouveau symbole (après le code NYT)
+                    brut = (brut << 1) | bit
+                    nb_brut -= 1
+                    if nb_brut:
+                        continue
+                    if brut == self.fin:
+                        self.termine = True
+                        break
+                    symbole = brut if self.octets else self._caractere(brut)
+                else:
+                    noeud = droites[noeud] if bit else gauches[noeud]
+                    if noeud < 0:
+                        raise ValueError("Données encodées corrompues")
+                    if gauches[noeud] >= 0:
+                        continue
+                    if noeud == self.nyt:
+                        nb_brut, brut = self.largeur, 0
+                        continue
+                    symbole = symboles[noeud]
+
+                ajouter(symbole)
+                self._mettre_a_jour(symbole)
+                noeud, brut = 0, 0
+                # Tant que la racine est la feuille NYT, aucun bit de chemin
+                nb_brut = self.largeur if noeud == self.nyt else 0
+
+        self._noeud, self._nb_brut, self._brut = noeud, nb_brut, brut
+        self.nb_symboles += len(decodes)
+        return bytes(decodes) if self.octets else ''.join(decodes)
+
+    def decoder_flux(self, morceaux: Iterable[bytes]) -> Iterator[Union[str, bytes]]:
+        """
+        Décode des morceaux successifs jusqu'à la marque de fin.
+
+        Raises:
+            ValueError: si le flux s'arrête avant la marque de fin
+        """
+        for morceau in morceaux:
+            texte = self.decoder(morceau)
+            if texte:
+                yield texte
+            if self.termine:
+                return
+        raise ValueError("Flux adaptatif tronqué : marque de fin absente")
+
+    def _caractere(self, point: int) -> str:
+        """Caractère d'une valeur brute décodée"""
+        if point > 0x10FFFF:
+            raise ValueError("Données encodées corrompues")
+        return chr(point)
+
+    def _chemin(self, noeud: int) -> Tuple[int, int]:
+        """Code courant d'un nœud : (valeur, longueur), lu de la feuille à la racine"""
+        parents = self.arbre.parents
+        droites = self.arbre.droites
+        valeur = 0
+        longueur = 0
+        parent = parents[noeud]
+        while parent >= 0:
+            if droites[parent] == noeud:
+                valeur |= 1 << longueur
+            longueur += 1
+            noeud = parent
+            parent = parents[noeud]
+        return valeur, longueur
+
+    def _mettre_a_jour(self, symbole):
+        """Incrémente le poids du symbole et de ses ancêtres (FGK)"""
+        arbre = self.arbre
+        feuille = self.feuilles.get(symbole)
+
+        if feuille is None:
+            # La feuille NYT devient un nœud interne : nouvelle NYT à gauche,
+            # feuille du symbole à droite (les deux derniers rangs)
+            ancienne = self.nyt
+            feuille = self._ajouter_noeud(symbole)
+            self.nyt = self._ajouter_noeud(None)
+            arbre.gauches[ancienne] = self.nyt
+            arbre.droites[ancienne] = feuille
+            arbre.parents[self.nyt] = ancienne
+            arbre.parents[feuille] = ancienne
+            self.feuilles[symbole] = feuille
+
+        poids = arbre.frequences
+        parents = arbre.parents
+        ordre = self.ordre
+        chefs = self.chefs
+        nb_noeuds = len(ordre)
+        noeud = feuille
+
+        while noeud >= 0:
+            w = poids[noeud]
+            parent = parents[noeud]
+            chef = chefs[w]
+
+            if ordre[chef] == parent:
+                # Frère de la NYT : le parent a le même poids et doit rester
+                # devant. On se place juste derrière lui, puis les deux
+                # passent ensemble au poids w + 1.
+                if ordre[chef + 1] != noeud:
+                    self._echanger(noeud, ordre[chef + 1])
+                poids[noeud] = w + 1
+                poids[parent] = w + 1
+                noeud = parent
+                suivant = chef + 2
+            else:
+                if ordre[chef] != noeud:
+                    self._echanger(noeud, ordre[chef])
+                poids[noeud] = w + 1
+                suivant = chef + 1
+
+            if suivant < nb_noeuds and poids[ordre[suivant]] == w:
+                chefs[w] = suivant
+            else:
+                del chefs[w]
+            # Les nœuds de poids w + 1 ont tous un rang plus petit
+            if w + 1 not in chefs:
+                chefs[w + 1] = chef
+            noeud = parents[noeud]
+
+        chefs[0] = self.rangs[self.nyt]
+
+    def _ajouter_noeud(self, symbole) -> int:
+        """Ajoute un nœud de poids 0 au dernier rang"""
+        noeud = self.arbre.ajouter(symbole, 0)
+        self.rangs.append(len(self.ordre))
+        self.ordre.append(noeud)
+        return noeud
+
+    def _echanger(self, a: int, b: int):
+        """Échange deux nœuds (et leurs sous-arbres) dans l'arbre et dans l'ordre"""
+        rangs = self.rangs
+        rang_a, rang_b = rangs[a], rangs[b]
+        self.ordre[rang_a], self.ordre[rang_b] = b, a
+        rangs[a], rangs[b] = rang_b, rang_a
+
+        parents = self.arbre.parents
+        gauches = self.arbre.gauches
+        droites = self.arbre.droites
+        parent_a, parent_b = parents[a], parents[b]
+
+        if parent_a == parent_b:
+            gauches[parent_a], droites[parent_a] = droites[parent_a], gauches[parent_a]
+            return
+
+        if gauches[parent_a] == a:
+            gauches[parent_a] = b
+        else:
+            droites[parent_a] = b
+        if gauches[parent_b] == b:
+            gauches[parent_b] = a
+        else:
+            droites[parent_b] = a
+        parents[a], parents[b] = parent_b, parent_a
@@ -73,16 +73,19 @@ class Affichage:
     
     @staticmethod
     def construction_arbre(historique: list):
-        """Affiche l'historique de construction de l'arbre"""
+        """
+        Affiche l'historique de construction de l'arbre
+        (liste des fusions (fréquence gauche, fréquence droite))
+        """
         Affichage.section("🌳 CONSTRUCTION DE L'ARBRE")
         
         print(f"\nNombre d'itérations : {len(historique)}")
         print(f"\n{'Itération':<12} {'Fusion':<30} {'Résultat'}")
         print("-" * Affichage.LARGEUR)
         
-        for etape in historique[:5]:  # Afficher les 5 premières
-            fusion = f"{etape['gauche_freq']} + {etape['droite_freq']}"
-            print(f"{etape['iteration']:<12} {fusion:<30} {etape['parent_freq']}")
+        for iteration, (gauche_freq, droite_freq) in enumerate(historique[:5], 1):  # Afficher les 5 premières
+            fusion = f"{gauche_freq} + {droite_freq}"
+            print(f"{iteration:<12} {fusion:<30} {gauche_freq + droite_freq}")
         
         if len(historique) > 5:
             print(f"... et {len(historique) - 5} autres itérations")
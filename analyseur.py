@@ -1,5 +1,5 @@
 from collections import Counter
-from typing import Dict
+from typing import Dict, Iterable, List
 
 
 class AnalyseurFrequences:
@@ -18,9 +18,87 @@ class AnalyseurFrequences:
         """
         return dict(Counter(texte))
     
+    @staticmethod
+    def calculer_frequences_flux(morceaux: Iterable[str]) -> Dict[str, int]:
+        """
+        Compte les caractères d'un texte fourni morceau par morceau
+        (seul le morceau courant est gardé en mémoire).
+        
+        Args:
+            morceaux: Morceaux successifs du texte (ou leurs fréquences
+                      déjà comptées, sous forme de dictionnaires)
+            
+        Returns:
+            Dictionnaire {caractère: fréquence}
+        """
+        compteur = Counter()
+        for morceau in morceaux:
+            compteur.update(morceau)
+        return dict(compteur)
+    
+    @staticmethod
+    def calculer_frequences_octets(morceaux: Iterable[bytes]) -> List[int]:
+        """
+        Compte les octets (0 à 255) de données binaires fournies morceau
+        par morceau.
+        
+        Args:
+            morceaux: Morceaux successifs des données
+            
+        Returns:
+            Tableau de 256 fréquences (indice = valeur de l'octet)
+        """
+        compteur = Counter()
+        for morceau in morceaux:
+            compteur.update(morceau)
+        
+        frequences = [0] * 256
+        for octet, freq in compteur.items():
+            frequences[octet] = freq
+        return frequences
+    
+    @staticmethod
+    def estimer_frequences(echantillons: Iterable, octets: bool = False,
+                           facteur: float = 1.0, plancher: int = 1) -> Dict:
+        """
+        Estime les fréquences d'un texte à partir d'échantillons.
+        
+        Les comptes des échantillons sont multipliés par `facteur` (taille
+        du texte / taille des échantillons). Les symboles que le texte peut
+        contenir sans qu'ils apparaissent dans les échantillons reçoivent
+        la fréquence `plancher`, pour avoir quand même un code : les 256
+        octets en mode octets, les caractères ASCII en mode texte (les
+        autres caractères seulement s'ils figurent dans les échantillons,
+        pour ne pas allonger la table des codes).
+        
+        Args:
+            echantillons: Échantillons du texte (bytes en mode octets)
+            octets: Symboles octets (0-255) au lieu de caractères
+            facteur: Rapport entre la taille du texte et celle des échantillons
+            plancher: Fréquence des symboles absents des échantillons
+            
+        Returns:
+            Dictionnaire {symbole: fréquence estimée}
+        """
+        if octets:
+            tableau = AnalyseurFrequences.calculer_frequences_octets(echantillons)
+            comptes = {octet: freq for octet, freq in enumerate(tableau) if freq}
+            absents = range(256)
+        else:
+            comptes = AnalyseurFrequences.calculer_frequences_flux(echantillons)
+            absents = map(chr, range(128))
+        
+        frequences = {symbole: max(plancher, round(freq * facteur))
+                      for symbole, freq in comptes.items()}
+        for symbole in absents:
+            frequences.setdefault(symbole, plancher)
+        return frequences
+    
     @staticmethod
     def afficher_caractere(caractere: str) -> str:
         """Retourne une représentation lisible d'un caractère"""
+        if isinstance(caractere, int):
+            return f"0x{caractere:02X}"
         representations = {
             ' ': '␣ (espace)',
             '\n': '↵ (retour ligne)',
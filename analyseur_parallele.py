@@ -0,0 +1,195 @@
+import codecs
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from analyseur import AnalyseurFrequences
+from backend_numpy import BackendNumpy
+
+
+class AnalyseurParallele:
+    """
+    Analyse des fréquences répartie sur plusieurs processus.
+
+    Le texte (ou le fichier, par plages d'octets) est découpé en morceaux
+    comptés chacun dans un processus, puis les tables des fréquences sont
+    additionnées. Les morceaux sont fusionnés dans l'ordre : le résultat est
+    identique à celui d'AnalyseurFrequences, ordre de première apparition
+    compris.
+
+    Dans un fichier, les limites des plages sont avancées jusqu'au début
+    d'un caractère UTF-8 et ne séparent jamais \\r de \\n, ce qui donne les
+    mêmes caractères qu'une lecture en mode texte (fins de ligne converties).
+    """
+
+    # En dessous de cette taille (en caractères ou en octets), un seul
+    # processus est plus rapide que le lancement du pool
+    TAILLE_MIN = 8 * 1024 * 1024
+
+    # Nombre de morceaux par processus, pour équilibrer la charge
+    MORCEAUX_PAR_PROCESSUS = 4
+
+    # Taille des lectures dans une plage (en octets)
+    TAILLE_LECTURE = 1024 * 1024
+
+    @staticmethod
+    def calculer_frequences(texte: Union[str, bytes], nb_processus: Optional[int] = None,
+                            backend: str = "python") -> Dict:
+        """
+        Compte les symboles d'un texte en mémoire sur plusieurs processus.
+
+        Args:
+            texte: Texte (str) ou données binaires (bytes)
+            nb_processus: Nombre de processus (None : un par cœur, 1 : aucun)
+            backend: "python" ou "numpy", utilisé dans chaque processus
+
+        Returns:
+            Dictionnaire {symbole: fréquence}
+        """
+        nb_morceaux = AnalyseurParallele._nb_morceaux(len(texte), nb_processus)
+        taille = -(-len(texte) // nb_morceaux) if texte else 1
+        resultats = AnalyseurParallele._executer(
+            AnalyseurParallele._compter,
+            [(texte[debut:debut + taille], backend) for debut in range(0, len(texte), taille)],
+            nb_processus
+        )
+        return AnalyseurFrequences.calculer_frequences_flux(resultats)
+
+    @staticmethod
+    def calculer_frequences_fichier(fichier: str, octets: bool = False,
+                                    nb_processus: Optional[int] = None,
+                                    backend: str = "python") -> Union[Dict[str, int], List[int]]:
+        """
+        Compte les caractères d'un fichier texte UTF-8 (ou ses octets) sur
+        plusieurs processus, chacun lisant lui-même sa plage du fichier.
+
+        Args:
+            fichier: Chemin du fichier
+            octets: Compter les octets bruts au lieu des caractères
+            nb_processus: Nombre de processus (None : un par cœur, 1 : aucun)
+            backend: "python" ou "numpy", utilisé dans chaque processus
+
+        Returns:
+            Dictionnaire {caractère: fréquence}, ou tableau de 256 fréquences
+            en mode octets (comme AnalyseurFrequences.calculer_frequences_octets)
+        """
+        nb_plages = AnalyseurParallele._nb_morceaux(os.path.getsize(fichier), nb_processus)
+        resultats = AnalyseurParallele._executer(
+            AnalyseurParallele._compter_plage,
+            [(fichier, debut, fin, octets, backend)
+             for debut, fin in AnalyseurParallele.plages(fichier, nb_plages, octets)],
+            nb_processus
+        )
+        if octets:
+            return [sum(comptes) for comptes in zip([0] * 256, *resultats)]
+        return AnalyseurFrequences.calculer_frequences_flux(resultats)
+
+    @staticmethod
+    def plages(fichier: str, nb_plages: int, octets: bool = False) -> List[Tuple[int, int]]:
+        """
+        Découpe un fichier en plages d'octets de tailles proches.
+
+        Args:
+            fichier: Chemin du fichier
+            nb_plages: Nombre de plages voulu
+            octets: Couper n'importe où (sinon, seulement au début d'un
+                    caractère UTF-8 et pas au milieu d'un \\r\\n)
+
+        Returns:
+            Liste de (début, fin) : plages non vides, contiguës, dans l'ordre
+        """
+        taille = os.path.getsize(fichier)
+        limites = [0]
+        with open(fichier, 'rb') as f:
+            for i in range(1, nb_plages):
+                limite = max(taille * i // nb_plages, limites[-1])
+                if not octets:
+                    limite = AnalyseurParallele._debut_caractere(f, limite, taille)
+                limites.append(limite)
+        limites.append(taille)
+        return [(debut, fin) for debut, fin in zip(limites, limites[1:]) if fin > debut]
+
+    @staticmethod
+    def _debut_caractere(f, position: int, taille: int) -> int:
+        """Avance une position jusqu'au début d'un caractère UTF-8, sans séparer \\r\\n"""
+        if position <= 0:
+            return 0
+        f.seek(position - 1)
+        # Octet précédent et octets suivants (un caractère fait au plus 4 octets)
+        fenetre = f.read(6)
+        i = 1
+        # Octets de continuation (10xxxxxx) : le caractère a commencé avant
+        while i < len(fenetre) and fenetre[i] & 0xC0 == 0x80:
+            i += 1
+        # \r\n devient un seul \n à la lecture : les garder dans la même plage
+        if fenetre[i - 1:i + 1] == b"\r\n":
+            i += 1
+        return min(position + i - 1, taille)
+
+    @staticmethod
+    def _nb_morceaux(taille: int, nb_processus: Optional[int]) -> int:
+        """Nombre de morceaux à compter (1 pour une petite entrée ou un seul processus)"""
+        nb_processus = nb_processus or os.cpu_count() or 1
+        if nb_processus == 1 or taille < AnalyseurParallele.TAILLE_MIN:
+            return 1
+        return nb_processus * AnalyseurParallele.MORCEAUX_PAR_PROCESSUS
+
+    @staticmethod
+    def _compter(texte: Union[str, bytes], backend: str) -> Dict:
+        """Compte les symboles d'un morceau"""
+        if backend == "numpy" and BackendNumpy.disponible():
+            return BackendNumpy.calculer_frequences(texte)
+        return AnalyseurFrequences.calculer_frequences(texte)
+
+    @staticmethod
+    def _compter_plage(fichier: str, debut: int, fin: int, octets: bool,
+                       backend: str) -> Union[Dict[str, int], List[int]]:
+        """Compte les caractères (ou les octets) d'une plage du fichier"""
+        morceaux = AnalyseurParallele._lire_plage(fichier, debut, fin, octets)
+        numpy = backend == "numpy" and BackendNumpy.disponible()
+        if octets:
+            if numpy:
+                return BackendNumpy.calculer_frequences_octets(morceaux)
+            return AnalyseurFrequences.calculer_frequences_octets(morceaux)
+        if numpy:
+            morceaux = (BackendNumpy.calculer_frequences(morceau) for morceau in morceaux)
+        return AnalyseurFrequences.calculer_frequences_flux(morceaux)
+
+    @staticmethod
+    def _lire_plage(fichier: str, debut: int, fin: int, octets: bool) -> Iterator[Union[str, bytes]]:
+        """Lit une plage d'octets par morceaux (décodés en texte, sauf en mode octets)"""
+        decodeur = None
+        if not octets:
+            decodeur = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')(), translate=True
+            )
+        with open(fichier, 'rb') as f:
+            f.seek(debut)
+            restant = fin - debut
+            while restant > 0:
+                donnees = f.read(min(AnalyseurParallele.TAILLE_LECTURE, restant))
+                if not donnees:
+                    break
+                restant -= len(donnees)
+                morceau = donnees if octets else decodeur.decode(donnees)
+                if morceau:
+                    yield morceau
+        if decodeur is not None:
+            morceau = decodeur.decode(b"", final=True)
+            if morceau:
+                yield morceau
+
+    @staticmethod
+    def _executer(fonction: Callable, arguments: List[tuple],
+                  nb_processus: Optional[int]) -> List:
+        """
+        Applique la fonction à chaque jeu d'arguments sur un
+        ProcessPoolExecutor et rend les résultats dans l'ordre
+        (dans le processus courant s'il n'y a qu'un jeu d'arguments)
+        """
+        nb_processus = min(nb_processus or os.cpu_count() or 1, len(arguments))
+        if nb_processus <= 1:
+            return [fonction(*jeu) for jeu in arguments]
+
+        with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+            return list(executeur.map(fonction, *zip(*arguments)))
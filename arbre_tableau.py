@@ -0,0 +1,110 @@
+from typing import Dict, List, Optional
+
+
+class ArbreTableau:
+    """
+    Arbre de Huffman stocké dans des tableaux d'entiers plutôt que dans
+    des objets reliés entre eux.
+
+    Le nœud i est décrit par parents[i], gauches[i], droites[i] (-1 si
+    absent), frequences[i] et symboles[i] (None pour un nœud interne).
+    Les feuilles viennent d'abord, puis les nœuds internes dans l'ordre de
+    création : un parent a toujours un indice plus grand que ses enfants,
+    et la racine est le dernier nœud.
+    """
+
+    def __init__(self):
+        self.parents: List[int] = []
+        self.gauches: List[int] = []
+        self.droites: List[int] = []
+        self.frequences: List[int] = []
+        self.symboles: List = []
+
+    def ajouter(self, symbole=None, frequence: int = 0, gauche: int = -1, droite: int = -1) -> int:
+        """
+        Ajoute un nœud et le relie à ses enfants.
+
+        Returns:
+            L'indice du nouveau nœud
+        """
+        indice = len(self.frequences)
+        self.parents.append(-1)
+        self.gauches.append(gauche)
+        self.droites.append(droite)
+        self.frequences.append(frequence)
+        self.symboles.append(symbole)
+        if gauche >= 0:
+            self.parents[gauche] = indice
+        if droite >= 0:
+            self.parents[droite] = indice
+        return indice
+
+    @property
+    def racine(self) -> Optional['NoeudTableau']:
+        """Vue sur la racine (None si l'arbre est vide)"""
+        if not self.frequences:
+            return None
+        return NoeudTableau(self, len(self.frequences) - 1)
+
+    def codes(self) -> Dict:
+        """
+        Codes de chaque symbole (mêmes codes que GenerateurCodes.generer).
+
+        Les nœuds sont parcourus de la racine vers les feuilles par indices
+        décroissants : le code d'un parent est connu avant celui de ses enfants.
+        """
+        nb_noeuds = len(self.frequences)
+        if nb_noeuds == 0:
+            return {}
+        chemins = [''] * nb_noeuds
+        codes = {}
+
+        for indice in range(nb_noeuds - 1, -1, -1):
+            parent = self.parents[indice]
+            if parent >= 0:
+                bit = '0' if self.gauches[parent] == indice else '1'
+                chemins[indice] = chemins[parent] + bit
+            if self.gauches[indice] < 0 and self.droites[indice] < 0:
+                codes[self.symboles[indice]] = chemins[indice] or '0'
+
+        return codes
+
+
+class NoeudTableau:
+    """
+    Vue sur un nœud d'un ArbreTableau, avec la même interface en lecture
+    que NoeudHuffman (caractere, frequence, gauche, droite, est_feuille).
+    """
+
+    __slots__ = ('arbre', 'indice')
+
+    def __init__(self, arbre: ArbreTableau, indice: int):
+        self.arbre = arbre
+        self.indice = indice
+
+    @property
+    def caractere(self):
+        return self.arbre.symboles[self.indice]
+
+    @property
+    def frequence(self) -> int:
+        return self.arbre.frequences[self.indice]
+
+    @property
+    def gauche(self) -> Optional['NoeudTableau']:
+        enfant = self.arbre.gauches[self.indice]
+        return NoeudTableau(self.arbre, enfant) if enfant >= 0 else None
+
+    @property
+    def droite(self) -> Optional['NoeudTableau']:
+        enfant = self.arbre.droites[self.indice]
+        return NoeudTableau(self.arbre, enfant) if enfant >= 0 else None
+
+    def est_feuille(self) -> bool:
+        """Vérifie si le nœud est une feuille (contient un caractère)"""
+        return self.arbre.gauches[self.indice] < 0 and self.arbre.droites[self.indice] < 0
+
+    def __repr__(self):
+        if self.caractere:
+            return f"NoeudTableau('{self.caractere}', {self.frequence})"
+        return f"NoeudTableau(interne, {self.frequence})"
@@ -0,0 +1,128 @@
+from typing import Dict, Iterable, List, Union
+from ecrivain_bits import EcrivainBits
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+
+class BackendNumpy:
+    """
+    Comptage des fréquences et encodage vectorisés avec NumPy.
+
+    Produit exactement les mêmes fréquences (même ordre) et les mêmes octets
+    que les fonctions Python. Si NumPy n'est pas installé, disponible()
+    retourne False et l'appelant garde les fonctions Python.
+    """
+
+    # Nombre de symboles encodés d'un coup (borne la mémoire temporaire)
+    TAILLE_MORCEAU = 1 << 16
+
+    @staticmethod
+    def disponible() -> bool:
+        """Indique si NumPy est installé"""
+        return np is not None
+
+    @staticmethod
+    def calculer_frequences(texte: Union[str, bytes]) -> Dict:
+        """
+        Compte les symboles, dans l'ordre de première apparition
+        (comme AnalyseurFrequences.calculer_frequences).
+
+        Args:
+            texte: Texte (str) ou données binaires (bytes)
+
+        Returns:
+            Dictionnaire {symbole: fréquence}
+        """
+        octets = isinstance(texte, (bytes, bytearray))
+        if octets:
+            valeurs = np.frombuffer(texte, dtype=np.uint8)
+        else:
+            valeurs = np.frombuffer(texte.encode('utf-32-le'), dtype='<u4')
+
+        # Symboles distincts avec l'indice de leur première apparition
+        symboles, premiers, comptes = np.unique(valeurs, return_index=True, return_counts=True)
+        ordre = np.argsort(premiers)
+        symboles = symboles[ordre].tolist()
+        if not octets:
+            symboles = map(chr, symboles)
+        return dict(zip(symboles, comptes[ordre].tolist()))
+
+    @staticmethod
+    def calculer_frequences_octets(morceaux: Iterable[bytes]) -> List[int]:
+        """Tableau de 256 fréquences (comme AnalyseurFrequences.calculer_frequences_octets)"""
+        comptes = np.zeros(256, dtype=np.int64)
+        for morceau in morceaux:
+            comptes += np.bincount(np.frombuffer(morceau, dtype=np.uint8), minlength=256)
+        return comptes.tolist()
+
+    @staticmethod
+    def encoder(texte: Union[str, bytes], codes: Dict, ecrivain: EcrivainBits) -> bytes:
+        """
+        Encode un texte (ou un morceau) à la suite des bits déjà écrits par
+        l'écrivain, comme EcrivainBits.ecrire_texte.
+
+        Pour chaque symbole on récupère la longueur de son code, une somme
+        cumulée des longueurs donne la position de départ de chaque code, puis
+        les bits des codes sont recopiés à leur place et regroupés avec packbits.
+
+        Args:
+            texte: Texte (str) ou données binaires (bytes, memoryview)
+            codes: Dictionnaire {symbole: code_binaire}
+            ecrivain: Écrivain qui garde les bits incomplets entre deux appels
+
+        Returns:
+            Les octets complets produits
+        """
+        if isinstance(texte, (bytes, bytearray, memoryview)):
+            indices = np.frombuffer(texte, dtype=np.uint8)
+            alphabet = range(256)
+        else:
+            # Rang dans l'alphabet de chaque point de code distinct du texte
+            points, inverses = np.unique(
+                np.frombuffer(texte.encode('utf-32-le'), dtype='<u4'), return_inverse=True
+            )
+            alphabet = list(codes)
+            rang = {caractere: i for i, caractere in enumerate(alphabet)}
+            rangs = np.array([rang.get(chr(point), len(alphabet)) for point in points.tolist()],
+                             dtype=np.int64)
+            indices = rangs[inverses.reshape(-1)]
+            alphabet.append(None)  # rang des caractères absents (longueur 0)
+
+        # Tous les codes bout à bout (un octet 0/1 par bit) et leur position
+        codes_alphabet = [codes.get(s, '') for s in alphabet]
+        longueurs = np.array([len(code) for code in codes_alphabet], dtype=np.int64)
+        bits_codes = np.frombuffer(''.join(codes_alphabet).encode('ascii'), dtype=np.uint8) - 48
+        positions = np.cumsum(longueurs) - longueurs
+
+        sortie = bytearray()
+        for debut in range(0, len(indices), BackendNumpy.TAILLE_MORCEAU):
+            morceau = indices[debut:debut + BackendNumpy.TAILLE_MORCEAU]
+            sortie += BackendNumpy._encoder_morceau(
+                longueurs[morceau], positions[morceau], bits_codes, ecrivain
+            )
+        return bytes(sortie)
+
+    @staticmethod
+    def _encoder_morceau(longueurs, positions, bits_codes, ecrivain: EcrivainBits) -> bytes:
+        """Place les bits des codes d'un morceau et retourne les octets complets"""
+        if np.any(longueurs == 0):
+            raise KeyError("Symbole absent de la table des codes")
+
+        fins = np.cumsum(longueurs)
+        total = int(fins[-1]) if len(fins) else 0
+
+        # Bit k de la sortie = bit (k - début du code) du code du symbole
+        sources = np.repeat(positions - (fins - longueurs), longueurs) + np.arange(total)
+        attente = [(ecrivain.reste >> i) & 1 for i in range(ecrivain.nb_reste - 1, -1, -1)]
+        bits = np.concatenate([np.array(attente, dtype=np.uint8), bits_codes[sources]])
+
+        nb_complets = len(bits) // 8 * 8
+        reste = bits[nb_complets:].tolist()
+        ecrivain.reste = int(''.join(map(str, reste)) or '0', 2)
+        ecrivain.nb_reste = len(reste)
+        ecrivain.nb_bits += total
+
+        return np.packbits(bits[:nb_complets]).tobytes()
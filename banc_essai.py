@@ -0,0 +1,310 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from affichage import Affichage
+from analyseur import AnalyseurFrequences
+from constructeur_arbre import ConstructeurArbre
+from generateur_codes import GenerateurCodes
+from encodeur import Encodeur
+from gestion_fichiers import GestionFichiers
+
+
+class BancEssai:
+    """
+    Banc d'essai des étapes de la compression, chacune mesurée séparément
+    sur des textes de taille croissante (1 Ko à 100 Mo par défaut).
+
+    Pour chaque étape et chaque taille, on garde la meilleure durée de
+    plusieurs répétitions, le débit correspondant et le pic de mémoire
+    (tracemalloc, mesuré sur une exécution à part pour ne pas fausser la
+    durée). Les résultats s'enregistrent en JSON et se comparent à une
+    référence enregistrée de la même façon pour signaler les régressions.
+
+    Exemple :
+        python banc_essai.py --tailles 1K 1M 10M --sortie banc.json
+        python banc_essai.py --reference banc.json --tolerance 0.15
+    """
+
+    VERSION = 1
+    ETAPES = ('frequences', 'construction', 'codes', 'encodage', 'decodage',
+              'sauvegarde', 'chargement')
+    TAILLES = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2)
+    MEGA_OCTET = 1024 * 1024
+
+    # Texte d'essai : lettres et ponctuation d'un texte français,
+    # pondérées pour donner un arbre de forme réaliste
+    ALPHABET = "eeeeeeeeaaaaaiiiiisssssnnnnnrrrrrtttttooooollllluuuuddddcccmmmpp" \
+               "éééèàçvqfbghjxyzkw     ,.'\n"
+
+    @staticmethod
+    def generer_texte(taille: int, graine: int = 0) -> str:
+        """
+        Génère un texte d'essai reproductible de `taille` caractères.
+
+        Un motif aléatoire d'au plus 1 Mo est répété : la génération reste
+        rapide pour les grandes tailles sans changer la distribution.
+        """
+        generateur = random.Random(graine)
+        motif = ''.join(generateur.choices(BancEssai.ALPHABET, k=min(taille, BancEssai.MEGA_OCTET)))
+        repetitions, reste = divmod(taille, len(motif)) if motif else (0, 0)
+        return motif * repetitions + motif[:reste]
+
+    @staticmethod
+    def mesurer(fonction: Callable, *args, repetitions: int = 3,
+                memoire: bool = True) -> Tuple[object, float, Optional[int]]:
+        """
+        Mesure une fonction.
+
+        Args:
+            fonction: Fonction à mesurer
+            args: Ses arguments
+            repetitions: Nombre d'exécutions chronométrées (la meilleure est gardée)
+            memoire: Mesurer aussi le pic de mémoire (une exécution de plus)
+
+        Returns:
+            (résultat, meilleure durée en secondes, pic de mémoire en octets
+             ou None)
+        """
+        meilleure = None
+        for _ in range(max(1, repetitions)):
+            debut = time.perf_counter()
+            resultat = fonction(*args)
+            duree = time.perf_counter() - debut
+            if meilleure is None or duree < meilleure:
+                meilleure = duree
+
+        pic = None
+        if memoire:
+            tracemalloc.start()
+            try:
+                fonction(*args)
+                pic = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return resultat, meilleure, pic
+
+    @staticmethod
+    def executer(tailles: Tuple[int, ...] = TAILLES, etapes: Tuple[str, ...] = ETAPES,
+                 repetitions: int = 3, memoire: bool = True,
+                 afficher_details: bool = True) -> dict:
+        """
+        Mesure les étapes demandées sur chaque taille.
+
+        Les étapes s'enchaînent comme dans une compression : chacune reçoit
+        le résultat de la précédente, calculé même si elle n'est pas mesurée.
+
+        Returns:
+            Dictionnaire sérialisable en JSON : environnement et liste des
+            mesures (etape, taille, duree, debit_mo_s, memoire_pic)
+        """
+        inconnues = set(etapes).difference(BancEssai.ETAPES)
+        if inconnues:
+            raise ValueError(f"Étapes inconnues : {', '.join(sorted(inconnues))}")
+
+        mesures = []
+        with tempfile.TemporaryDirectory() as dossier:
+            fichier = os.path.join(dossier, "banc.huff")
+
+            for taille in tailles:
+                texte = BancEssai.generer_texte(taille)
+
+                def etape(nom: str, fonction: Callable, *args):
+                    if nom not in etapes:
+                        return fonction(*args)
+                    resultat, duree, pic = BancEssai.mesurer(
+                        fonction, *args, repetitions=repetitions, memoire=memoire
+                    )
+                    mesures.append({
+                        'etape': nom,
+                        'taille': taille,
+                        'duree': duree,
+                        'debit_mo_s': taille / BancEssai.MEGA_OCTET / duree if duree > 0 else None,
+                        'memoire_pic': pic
+                    })
+                    if afficher_details:
+                        print(f"  {nom:<14} {BancEssai.formater_taille(taille):>8} "
+                              f"{duree * 1000:>12.3f} ms")
+                    return resultat
+
+                frequences = etape('frequences', AnalyseurFrequences.calculer_frequences, texte)
+                racine = etape('construction', ConstructeurArbre.construire, frequences)
+                codes = etape('codes', GenerateurCodes.generer, racine)
+                if 'encodage' in etapes or 'decodage' in etapes:
+                    bits = etape('encodage', Encodeur.encoder, texte, codes)
+                    etape('decodage', Encodeur.decoder, bits, racine)
+                    del bits
+                if 'sauvegarde' in etapes or 'chargement' in etapes:
+                    charge, bourrage = Encodeur.encoder_octets(texte, codes)
+                    etape('sauvegarde', GestionFichiers._sauvegarder_compression,
+                          fichier, charge, bourrage, codes, len(texte))
+                    etape('chargement', GestionFichiers._charger_compression, fichier)
+
+        return {
+            'version': BancEssai.VERSION,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plateforme': platform.platform(),
+            'repetitions': repetitions,
+            'mesures': mesures
+        }
+
+    @staticmethod
+    def comparer(resultats: dict, reference: dict, tolerance: float = 0.10) -> List[dict]:
+        """
+        Compare des résultats à une référence.
+
+        Une mesure régresse si sa durée (ou son pic de mémoire) dépasse celle
+        de la référence de plus de `tolerance` (0.10 = 10 %). Seules les
+        mesures présentes des deux côtés (même étape, même taille) comptent.
+
+        Returns:
+            Liste des régressions : etape, taille, critere ('duree' ou
+            'memoire_pic'), valeur, reference et rapport (valeur / référence)
+        """
+        anciennes = {(m['etape'], m['taille']): m for m in reference.get('mesures', [])}
+        regressions = []
+        for mesure in resultats['mesures']:
+            ancienne = anciennes.get((mesure['etape'], mesure['taille']))
+            if ancienne is None:
+                continue
+            for critere in ('duree', 'memoire_pic'):
+                valeur, valeur_reference = mesure.get(critere), ancienne.get(critere)
+                if not valeur or not valeur_reference:
+                    continue
+                rapport = valeur / valeur_reference
+                if rapport > 1 + tolerance:
+                    regressions.append({
+                        'etape': mesure['etape'],
+                        'taille': mesure['taille'],
+                        'critere': critere,
+                        'valeur': valeur,
+                        'reference': valeur_reference,
+                        'rapport': rapport
+                    })
+        return regressions
+
+    @staticmethod
+    def afficher(resultats: dict):
+        """
+        Affiche le débit de chaque étape en fonction de la taille (courbe de
+        montée en charge) et l'étape la plus lente pour chaque taille.
+        """
+        mesures = resultats['mesures']
+        tailles = sorted({m['taille'] for m in mesures})
+        etapes = [e for e in BancEssai.ETAPES if any(m['etape'] == e for m in mesures)]
+        index = {(m['etape'], m['taille']): m for m in mesures}
+
+        Affichage.section("📈 DÉBIT PAR ÉTAPE (Mo/s)")
+        print(f"{'Étape':<14}" + ''.join(f"{BancEssai.formater_taille(t):>10}" for t in tailles))
+        print("-" * Affichage.LARGEUR)
+        for etape in etapes:
+            ligne = f"{etape:<14}"
+            for taille in tailles:
+                mesure = index.get((etape, taille))
+                debit = mesure['debit_mo_s'] if mesure else None
+                ligne += f"{debit:>10.2f}" if debit is not None else f"{'-':>10}"
+            print(ligne)
+
+        if any(m['memoire_pic'] is not None for m in mesures):
+            Affichage.section("💾 PIC DE MÉMOIRE")
+            print(f"{'Étape':<14}" + ''.join(f"{BancEssai.formater_taille(t):>10}" for t in tailles))
+            print("-" * Affichage.LARGEUR)
+            for etape in etapes:
+                ligne = f"{etape:<14}"
+                for taille in tailles:
+                    mesure = index.get((etape, taille))
+                    pic = mesure['memoire_pic'] if mesure else None
+                    ligne += f"{BancEssai.formater_taille(pic):>10}" if pic is not None else f"{'-':>10}"
+                print(ligne)
+
+        Affichage.section("🐢 ÉTAPE LIMITANTE")
+        for taille in tailles:
+            lente = max((m for m in mesures if m['taille'] == taille), key=lambda m: m['duree'])
+            total = sum(m['duree'] for m in mesures if m['taille'] == taille)
+            part = lente['duree'] / total if total > 0 else 0
+            print(f"{BancEssai.formater_taille(taille):>8} : {lente['etape']} ({part:.0%} du temps)")
+
+    @staticmethod
+    def afficher_regressions(regressions: List[dict]):
+        """Affiche les régressions trouvées par comparer"""
+        Affichage.section("⚖️  COMPARAISON AVEC LA RÉFÉRENCE")
+        if not regressions:
+            print("✓ Aucune régression")
+            return
+        for r in regressions:
+            print(f"❌ {r['etape']:<14} {BancEssai.formater_taille(r['taille']):>8} "
+                  f"{r['critere']:<12} x{r['rapport']:.2f}")
+
+    @staticmethod
+    def formater_taille(octets: int) -> str:
+        """Taille courte : 1K, 10K, 1M, 100M..."""
+        for unite, facteur in (('G', 1024 ** 3), ('M', 1024 ** 2), ('K', 1024)):
+            if octets >= facteur:
+                valeur = octets / facteur
+                return f"{valeur:.0f}{unite}" if valeur == int(valeur) else f"{valeur:.1f}{unite}"
+        return str(octets)
+
+    @staticmethod
+    def lire_taille(texte: str) -> int:
+        """Lit une taille comme « 1K », « 10M » ou « 4096 »"""
+        facteurs = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+        texte = texte.strip().upper()
+        if texte and texte[-1] in facteurs:
+            return int(float(texte[:-1]) * facteurs[texte[-1]])
+        return int(texte)
+
+    @staticmethod
+    def principal(arguments: Optional[List[str]] = None) -> int:
+        """
+        Point d'entrée en ligne de commande.
+
+        Returns:
+            Code de sortie : 1 si une régression est trouvée, 0 sinon
+        """
+        analyseur = argparse.ArgumentParser(description="Banc d'essai des étapes de Huffman")
+        analyseur.add_argument("--tailles", nargs="+", type=BancEssai.lire_taille,
+                               default=list(BancEssai.TAILLES),
+                               help="Tailles des textes (ex. 1K 10M), de 1K à 100M par défaut")
+        analyseur.add_argument("--etapes", nargs="+", choices=BancEssai.ETAPES,
+                               default=list(BancEssai.ETAPES))
+        analyseur.add_argument("--repetitions", type=int, default=3)
+        analyseur.add_argument("--sans-memoire", action="store_true",
+                               help="Ne pas mesurer le pic de mémoire")
+        analyseur.add_argument("--sortie", default=None, help="Fichier JSON des résultats")
+        analyseur.add_argument("--reference", default=None,
+                               help="Fichier JSON de référence à comparer")
+        analyseur.add_argument("--tolerance", type=float, default=0.10,
+                               help="Écart toléré par rapport à la référence (0.10 = 10 %%)")
+        args = analyseur.parse_args(arguments)
+
+        Affichage.titre("⏱️  BANC D'ESSAI")
+        resultats = BancEssai.executer(
+            tuple(args.tailles), tuple(args.etapes), args.repetitions, not args.sans_memoire
+        )
+        BancEssai.afficher(resultats)
+
+        if args.sortie:
+            with open(args.sortie, 'w', encoding='utf-8') as f:
+                json.dump(resultats, f, indent=2)
+            print(f"\n✓ Résultats enregistrés : {args.sortie}")
+
+        if args.reference:
+            with open(args.reference, 'r', encoding='utf-8') as f:
+                reference = json.load(f)
+            regressions = BancEssai.comparer(resultats, reference, args.tolerance)
+            BancEssai.afficher_regressions(regressions)
+            if regressions:
+                return 1
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(BancEssai.principal())
@@ -0,0 +1,152 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+from huffman import CompressionHuffman
+from conteneur import ConteneurHuffman
+from decodeur import DecodeurTable
+from cache import CacheHuffman
+
+
+class CompressionParBlocs:
+    """
+    Compression par blocs indépendants, répartis sur plusieurs processus.
+
+    Chaque bloc a sa propre table des fréquences et sa propre table des
+    codes : les blocs se compressent et se décompressent sans rien partager,
+    donc en parallèle. Les résultats sont rendus dans l'ordre des blocs.
+    """
+
+    # Taille d'un bloc (en caractères, ou en octets en mode octets)
+    TAILLE_BLOC = 1024 * 1024
+
+    # Cache de chaque processus : des blocs de même distribution (données
+    # au format fixe) partagent arbre, codes et tables de décodage
+    _CACHE = CacheHuffman(capacite=64)
+
+    @staticmethod
+    def compresser(blocs: Iterable[Union[str, bytes]], canonique: bool = True,
+                   octets: bool = False, nb_processus: Optional[int] = None,
+                   backend: str = "python",
+                   longueur_max: Optional[int] = None) -> Iterator[Tuple[bytes, int]]:
+        """
+        Compresse une suite de blocs en parallèle.
+
+        Args:
+            blocs: Blocs successifs (str, ou bytes en mode octets)
+            canonique: Utiliser des codes canoniques dans chaque bloc
+            octets: Les blocs sont des octets bruts
+            nb_processus: Nombre de processus (None : un par cœur, 1 : aucun)
+            backend: "python" ou "numpy", utilisé dans chaque processus
+            longueur_max: Longueur maximale des codes (None : pas de limite)
+
+        Returns:
+            Itérateur sur (bloc encodé, nombre de caractères du bloc),
+            dans l'ordre des blocs
+        """
+        drapeaux = CompressionParBlocs.drapeaux(canonique, octets)
+        return CompressionParBlocs._executer(
+            CompressionParBlocs._compresser_bloc,
+            ((bloc, drapeaux, backend, longueur_max) for bloc in blocs),
+            nb_processus
+        )
+
+    @staticmethod
+    def decompresser(blocs: Iterable[bytes], drapeaux: int,
+                     nb_processus: Optional[int] = None) -> Iterator[Union[str, bytes]]:
+        """
+        Décompresse en parallèle des blocs produits par compresser.
+
+        Args:
+            blocs: Blocs encodés successifs
+            drapeaux: Drapeaux du conteneur (canonique, octets)
+            nb_processus: Nombre de processus (None : un par cœur, 1 : aucun)
+
+        Returns:
+            Itérateur sur le texte de chaque bloc (bytes en mode octets)
+        """
+        return CompressionParBlocs._executer(
+            CompressionParBlocs._decompresser_bloc,
+            ((bloc, drapeaux) for bloc in blocs),
+            nb_processus
+        )
+
+    @staticmethod
+    def drapeaux(canonique: bool, octets: bool, controle: bool = True) -> int:
+        """Drapeaux du conteneur correspondant aux options (CRC32 par bloc par défaut)"""
+        drapeaux = ConteneurHuffman.CANONIQUE if canonique else 0
+        if octets:
+            drapeaux |= ConteneurHuffman.OCTETS
+        if controle:
+            drapeaux |= ConteneurHuffman.CONTROLE
+        return drapeaux
+
+    @staticmethod
+    def _compresser_bloc(bloc: Union[str, bytes], drapeaux: int, backend: str,
+                         longueur_max: Optional[int]) -> Tuple[bytes, int]:
+        """Compresse un bloc avec ses propres codes (exécuté dans un processus)"""
+        compression = CompressionHuffman(
+            bloc,
+            canonique=bool(drapeaux & ConteneurHuffman.CANONIQUE),
+            empaqueter=True,
+            backend=backend,
+            longueur_max=longueur_max,
+            constructeur="lineaire",
+            cache=CompressionParBlocs._CACHE
+        )
+        compression.executer(afficher_details=False)
+        nb_bits_dernier = 8 - compression.bits_bourrage if compression.donnees_encodees else 0
+        controle = None
+        if drapeaux & ConteneurHuffman.CONTROLE:
+            controle = ConteneurHuffman.somme_controle(bloc)
+        encode = ConteneurHuffman.encoder_bloc(
+            compression.codes, compression.donnees_encodees, nb_bits_dernier, drapeaux, controle
+        )
+        return encode, len(bloc)
+
+    @staticmethod
+    def _decompresser_bloc(bloc: bytes, drapeaux: int) -> Union[str, bytes]:
+        """
+        Décompresse un bloc (exécuté dans un processus) et vérifie son CRC32
+
+        Raises:
+            ValueError: si le texte décodé ne correspond pas au CRC32 du bloc
+        """
+        donnees = ConteneurHuffman.decoder_bloc(bloc, drapeaux)
+        octets = bool(drapeaux & ConteneurHuffman.OCTETS)
+
+        cle = CacheHuffman.cle_codes(donnees['codes'], octets)
+        entree = CompressionParBlocs._CACHE.obtenir(cle)
+        if entree is None:
+            entree = {'decodeur': DecodeurTable(donnees['codes'], octets=octets)}
+            CompressionParBlocs._CACHE.ajouter(cle, entree)
+        decodeur = entree['decodeur']
+        texte = decodeur.decoder_octets(donnees['charge'], donnees['nb_bits_dernier'])
+        if 'controle' in donnees and ConteneurHuffman.somme_controle(texte) != donnees['controle']:
+            raise ValueError("Bloc corrompu : somme de contrôle incorrecte")
+        return texte
+
+    @staticmethod
+    def _executer(fonction: Callable, arguments: Iterable[tuple],
+                  nb_processus: Optional[int]) -> Iterator:
+        """
+        Applique la fonction à chaque jeu d'arguments sur un ProcessPoolExecutor
+        et rend les résultats dans l'ordre.
+
+        Au plus deux tâches par processus sont en attente : les blocs sont lus
+        au fur et à mesure et la mémoire reste bornée quel que soit le fichier.
+        """
+        nb_processus = nb_processus or os.cpu_count() or 1
+        if nb_processus == 1:
+            for jeu in arguments:
+                yield fonction(*jeu)
+            return
+
+        with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+            en_cours = deque()
+            for jeu in arguments:
+                en_cours.append(executeur.submit(fonction, *jeu))
+                if len(en_cours) >= 2 * nb_processus:
+                    yield en_cours.popleft().result()
+            while en_cours:
+                yield en_cours.popleft().result()
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class CacheHuffman:
+    """
+    Cache LRU des arbres, tables de codes et tables de décodage.
+
+    La clé est la forme canonique d'une table de fréquences (ou d'une
+    table de codes) : deux textes de même distribution réutilisent le même
+    arbre au lieu de le reconstruire. Quand le cache est plein, l'entrée
+    utilisée le moins récemment est retirée.
+    """
+
+    def __init__(self, capacite: int = 128):
+        """
+        Args:
+            capacite: Nombre maximal d'entrées gardées
+        """
+        if capacite < 1:
+            raise ValueError("La capacité du cache doit être au moins 1")
+        self.capacite = capacite
+        self.succes = 0
+        self.echecs = 0
+        self._entrees = OrderedDict()
+
+    @staticmethod
+    def cle(frequences: Dict, *options) -> tuple:
+        """
+        Clé d'une table de fréquences : les paires (symbole, fréquence)
+        triées, suivies des options qui changent le résultat.
+        """
+        return (tuple(sorted(frequences.items())),) + options
+
+    @staticmethod
+    def cle_codes(codes: Dict, *options) -> tuple:
+        """Clé d'une table de codes (pour les tables de décodage)"""
+        return ('codes', tuple(sorted(codes.items()))) + options
+
+    def obtenir(self, cle: Hashable) -> Optional[dict]:
+        """
+        Retourne l'entrée de la clé (None si absente) et compte le succès
+        ou l'échec.
+        """
+        entree = self._entrees.get(cle)
+        if entree is None:
+            self.echecs += 1
+            return None
+        self._entrees.move_to_end(cle)
+        self.succes += 1
+        return entree
+
+    def ajouter(self, cle: Hashable, entree: dict):
+        """Ajoute une entrée et retire la plus ancienne si le cache est plein"""
+        self._entrees[cle] = entree
+        self._entrees.move_to_end(cle)
+        while len(self._entrees) > self.capacite:
+            self._entrees.popitem(last=False)
+
+    def vider(self):
+        """Retire toutes les entrées et remet les compteurs à zéro"""
+        self._entrees.clear()
+        self.succes = 0
+        self.echecs = 0
+
+    def statistiques(self) -> dict:
+        """Compteurs du cache : succès, échecs, taux de succès et taille"""
+        total = self.succes + self.echecs
+        return {
+            'succes': self.succes,
+            'echecs': self.echecs,
+            'taux_succes': self.succes / total if total > 0 else 0,
+            'taille': len(self._entrees),
+            'capacite': self.capacite
+        }
+
+    def __len__(self):
+        return len(self._entrees)
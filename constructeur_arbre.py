@@ -1,27 +1,40 @@
 import heapq
 from typing import Dict
 from noeud import NoeudHuffman
+from generateur_codes import GenerateurCodes
+from arbre_tableau import ArbreTableau, NoeudTableau
 
 class ConstructeurArbre:
     """Classe pour construire l'arbre de Huffman"""
     
     @staticmethod
-    def construire(frequences: Dict[str, int]) -> NoeudHuffman:
+    def construire(frequences: Dict[str, int], historique: bool = False) -> NoeudHuffman:
         """
         Construit l'arbre de Huffman à partir des fréquences.
         
         Args:
             frequences: Dictionnaire {caractère: fréquence}
+            historique: Enregistrer les fusions dans racine.historique,
+                        sous la forme de couples (fréquence gauche, fréquence droite)
             
         Returns:
             La racine de l'arbre de Huffman
         """
         
+        # Cas spécial : texte vide, arbre sans caractère
+        if not frequences:
+            racine = NoeudHuffman(None, 0)
+            if historique:
+                racine.historique = []
+            return racine
+        
         # Cas spécial : un seul caractère
         if len(frequences) == 1:
             caractere, freq = list(frequences.items())[0]
             racine = NoeudHuffman(None, freq)
             racine.gauche = NoeudHuffman(caractere, freq)
+            if historique:
+                racine.historique = []
             return racine
         
         # Créer un min-heap (sélectionner les deux caractères ayant les plus petites fréquences)
@@ -30,8 +43,7 @@ class ConstructeurArbre:
             noeud = NoeudHuffman(caractere, freq)
             heapq.heappush(heap, noeud)
         
-        historique = []
-        iteration = 1
+        fusions = [] if historique else None
         
         # Fusionner les nœuds jusqu'à n'en avoir qu'un(fusionnés dans un nouveau nœud parent dont la fréquence est la somme des deux)
         while len(heap) > 1:
@@ -47,14 +59,170 @@ class ConstructeurArbre:
             # Réinsérer le parent
             heapq.heappush(heap, parent)
             
-            historique.append({
-                'iteration': iteration,
-                'gauche_freq': gauche.frequence,
-                'droite_freq': droite.frequence,
-                'parent_freq': parent.frequence
-            })
-            iteration += 1
+            if fusions is not None:
+                fusions.append((gauche.frequence, droite.frequence))
         
         racine = heap[0]
-        racine.historique = historique
+        if fusions is not None:
+            racine.historique = fusions
+        return racine
+    
+    @staticmethod
+    def construire_lineaire(frequences: Dict[str, int]) -> NoeudTableau:
+        """
+        Construit l'arbre de Huffman en temps linéaire après un seul tri.
+        
+        Les feuilles triées par fréquence forment une première file ; les
+        nœuds internes, créés avec des fréquences croissantes, forment une
+        seconde file. Les deux plus petits nœuds sont toujours en tête de
+        l'une ou l'autre file : aucun tas n'est nécessaire.
+        
+        Args:
+            frequences: Dictionnaire {caractère: fréquence}
+            
+        Returns:
+            Vue sur la racine d'un ArbreTableau (même interface que NoeudHuffman)
+        """
+        arbre = ArbreTableau()
+        for caractere in sorted(frequences, key=frequences.get):
+            arbre.ajouter(caractere, frequences[caractere])
+        nb_feuilles = len(arbre.frequences)
+        
+        # Cas spécial : un seul caractère
+        if nb_feuilles == 1:
+            arbre.ajouter(None, arbre.frequences[0], gauche=0)
+            return arbre.racine
+        
+        poids = arbre.frequences
+        feuille = 0              # Tête de la file des feuilles
+        interne = nb_feuilles    # Tête de la file des nœuds internes
+        
+        for _ in range(nb_feuilles - 1):
+            enfants = []
+            for _ in range(2):
+                if interne >= len(poids) or (feuille < nb_feuilles and poids[feuille] <= poids[interne]):
+                    enfants.append(feuille)
+                    feuille += 1
+                else:
+                    enfants.append(interne)
+                    interne += 1
+            gauche, droite = enfants
+            arbre.ajouter(None, poids[gauche] + poids[droite], gauche, droite)
+        
+        return arbre.racine
+    
+    @staticmethod
+    def construire_limite(frequences: Dict[str, int], longueur_max: int) -> NoeudHuffman:
+        """
+        Construit un arbre dont aucun code ne dépasse longueur_max bits.
+        
+        Les longueurs sont calculées par longueurs_limitees, puis l'arbre est
+        celui des codes canoniques correspondants.
+        
+        Args:
+            frequences: Dictionnaire {caractère: fréquence}
+            longueur_max: Longueur maximale d'un code (en bits)
+            
+        Returns:
+            La racine de l'arbre de Huffman
+        """
+        longueurs = ConstructeurArbre.longueurs_limitees(frequences, longueur_max)
+        codes = GenerateurCodes.generer_canonique(longueurs)
+        racine = ConstructeurArbre.depuis_codes(codes)
+        
+        # Reporter les fréquences sur chaque nœud du chemin
+        for caractere, code in codes.items():
+            freq = frequences[caractere]
+            noeud = racine
+            noeud.frequence += freq
+            for bit in code:
+                noeud = noeud.gauche if bit == '0' else noeud.droite
+                noeud.frequence += freq
+        return racine
+    
+    @staticmethod
+    def longueurs_limitees(frequences: Dict[str, int], longueur_max: int) -> Dict[str, int]:
+        """
+        Longueurs de codes optimales sous la contrainte longueur <= longueur_max
+        (algorithme package-merge).
+        
+        À chaque niveau, la liste triée des feuilles est fusionnée avec les
+        paquets du niveau précédent, puis regroupée deux par deux en paquets.
+        Les 2n-2 éléments les plus légers du dernier niveau donnent les
+        longueurs : celle d'un caractère est le nombre de fois où il y apparaît.
+        
+        Args:
+            frequences: Dictionnaire {caractère: fréquence}
+            longueur_max: Longueur maximale d'un code (en bits)
+            
+        Returns:
+            Dictionnaire {caractère: longueur du code}
+            
+        Raises:
+            ValueError: si 2^longueur_max < nombre de caractères
+        """
+        symboles = sorted(frequences, key=frequences.get)
+        n = len(symboles)
+        if n == 0:
+            return {}
+        if n == 1:
+            return {symboles[0]: 1}
+        if n > 1 << longueur_max:
+            raise ValueError(
+                f"{n} caractères ne tiennent pas dans des codes de {longueur_max} bits"
+            )
+        
+        # Élément : (poids, contenu) ; contenu = indice d'une feuille
+        # ou couple d'éléments pour un paquet
+        feuilles = [(frequences[symbole], indice) for indice, symbole in enumerate(symboles)]
+        poids = lambda element: element[0]
+        paquets = []
+        for _ in range(longueur_max - 1):
+            liste = list(heapq.merge(feuilles, paquets, key=poids))
+            paquets = [
+                (liste[i][0] + liste[i + 1][0], (liste[i][1], liste[i + 1][1]))
+                for i in range(0, len(liste) - 1, 2)
+            ]
+        selection = list(heapq.merge(feuilles, paquets, key=poids))[:2 * n - 2]
+        
+        # Compter les apparitions de chaque feuille dans la sélection
+        comptes = [0] * n
+        pile = [contenu for _, contenu in selection]
+        while pile:
+            contenu = pile.pop()
+            if isinstance(contenu, tuple):
+                pile.extend(contenu)
+            else:
+                comptes[contenu] += 1
+        
+        longueurs = {symbole: comptes[indice] for indice, symbole in enumerate(symboles)}
+        return {caractere: longueurs[caractere] for caractere in frequences}
+    
+    @staticmethod
+    def depuis_codes(codes: Dict[str, str]) -> NoeudHuffman:
+        """
+        Reconstruit l'arbre de décodage à partir de la table des codes.
+        
+        Les fréquences ne sont pas connues : les nœuds sont créés avec
+        une fréquence nulle.
+        
+        Args:
+            codes: Dictionnaire {caractère: code_binaire}
+            
+        Returns:
+            La racine de l'arbre de Huffman
+        """
+        racine = NoeudHuffman()
+        for caractere, code in codes.items():
+            noeud = racine
+            for bit in code:
+                if bit == '0':
+                    if noeud.gauche is None:
+                        noeud.gauche = NoeudHuffman()
+                    noeud = noeud.gauche
+                else:
+                    if noeud.droite is None:
+                        noeud.droite = NoeudHuffman()
+                    noeud = noeud.droite
+            noeud.caractere = caractere
         return racine
@@ -0,0 +1,539 @@
+import io
+import struct
+import zlib
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+from generateur_codes import GenerateurCodes
+
+
+class ConteneurHuffman:
+    """
+    Format binaire des fichiers .huff (remplace l'ancien fichier pickle).
+
+    Structure du fichier :
+        En-tête : nombre magique, version, drapeaux, nombre de caractères encodés
+        Table   : nombre d'entrées puis, pour chaque caractère,
+                  le caractère en UTF-8, la longueur de son code et les bits du code
+                  (en mode canonique, seules les longueurs sont stockées ;
+                  en mode octets, les symboles sont des octets 0-255 et une table
+                  canonique d'au moins 128 entrées est un tableau de 256 longueurs)
+        Charge  : taille en octets, nombre de bits utiles du dernier octet,
+                  [CRC32 du texte d'origine,] puis le texte encodé (8 bits par octet)
+
+    Fichier par blocs (drapeau BLOCS) :
+        En-tête : en-tête fixe suivi de la position de l'index
+        Blocs   : chaque bloc contient sa propre table et sa propre charge
+                  (avec le CRC32 du texte du bloc)
+        Index   : nombre de blocs puis, pour chaque bloc, sa position dans
+                  le fichier, sa taille et son nombre de caractères,
+                  [puis le CRC32 de tout le texte d'origine]
+
+    Les CRC32 (entre crochets) ne sont présents qu'avec le drapeau CONTROLE.
+    Ils portent sur le texte d'origine en UTF-8 (ou sur les octets bruts en
+    mode octets) et permettent de vérifier la décompression au fil de l'eau.
+
+    Fichier adaptatif (drapeau ADAPTATIF) :
+        En-tête : en-tête fixe seul (aucune table)
+        Charge  : flux Huffman adaptatif jusqu'à sa marque de fin
+
+    Fichier compressé avec un modèle partagé (drapeau MODELE) :
+        En-tête : en-tête fixe suivi de l'identifiant du modèle (pas de table)
+        Échappés: taille puis symboles absents du modèle (UTF-8 ou octets bruts)
+        Charge  : comme un fichier simple
+
+    Fichier modèle (nombre magique HUFM) :
+        En-tête : nombre magique, version, drapeaux, identifiant,
+                  longueur du code d'échappement
+        Table   : table canonique des symboles du modèle
+    """
+
+    MAGIQUE = b'HUFF'
+    MAGIQUE_MODELE = b'HUFM'
+    VERSION = 1
+
+    # Drapeaux de l'en-tête
+    CANONIQUE = 0x01
+    OCTETS = 0x02
+    BLOCS = 0x04
+    ADAPTATIF = 0x08
+    MODELE = 0x10
+    CONTROLE = 0x20
+
+    _EN_TETE = struct.Struct('>4sBBQ')
+    _POSITION_INDEX = struct.Struct('>Q')
+    _ENTREE_INDEX = struct.Struct('>QQQ')
+    _NB_ENTREES = struct.Struct('>I')
+    _CHARGE = struct.Struct('>QB')
+    _CHARGE_CONTROLE = struct.Struct('>QBI')
+    _CONTROLE = struct.Struct('>I')
+    _NB_CARACTERES = struct.Struct('>Q')
+    _IDENTIFIANT = struct.Struct('>Q')
+    _EN_TETE_MODELE = struct.Struct('>4sBBQB')
+
+    @staticmethod
+    def ecrire(flux: BinaryIO, codes: Dict[str, str], charge: bytes,
+               nb_bits_dernier: int, nb_caracteres: int, drapeaux: int = 0,
+               controle: Optional[int] = None):
+        """
+        Écrit un conteneur .huff complet dans un flux binaire.
+
+        Args:
+            flux: Flux binaire ouvert en écriture
+            codes: Dictionnaire {caractère: code_binaire}
+            charge: Texte encodé, regroupé 8 bits par octet
+            nb_bits_dernier: Nombre de bits utiles du dernier octet (0 si vide)
+            nb_caracteres: Nombre de caractères du texte original
+            drapeaux: Options du format (CANONIQUE, OCTETS)
+            controle: CRC32 du texte original (somme_controle) : s'il est
+                      donné, le drapeau CONTROLE est ajouté
+        """
+        if controle is not None:
+            drapeaux |= ConteneurHuffman.CONTROLE
+        ConteneurHuffman._ecrire_debut(flux, codes, nb_caracteres, drapeaux)
+        flux.write(ConteneurHuffman._decrire_charge(len(charge), nb_bits_dernier, controle))
+        flux.write(charge)
+
+    @staticmethod
+    def ecrire_en_tete(flux: BinaryIO, codes: Dict[str, str], nb_caracteres: int,
+                       drapeaux: int = 0) -> int:
+        """
+        Écrit l'en-tête et la table des codes, puis réserve la place de
+        la description de la charge (complétée par terminer_charge).
+        Les octets encodés peuvent ensuite être écrits au fil de l'eau.
+        Avec le drapeau CONTROLE, la place du CRC32 est aussi réservée.
+
+        Returns:
+            Position de la description de la charge dans le flux
+        """
+        ConteneurHuffman._ecrire_debut(flux, codes, nb_caracteres, drapeaux)
+        position = flux.tell()
+        controle = 0 if drapeaux & ConteneurHuffman.CONTROLE else None
+        flux.write(ConteneurHuffman._decrire_charge(0, 0, controle))
+        return position
+
+    @staticmethod
+    def terminer_charge(flux: BinaryIO, position: int, taille_charge: int, nb_bits_dernier: int,
+                        controle: Optional[int] = None, nb_caracteres: Optional[int] = None):
+        """
+        Complète la description de la charge réservée par ecrire_en_tete
+        (controle : CRC32 du texte, obligatoire avec le drapeau CONTROLE ;
+        nb_caracteres : remplace celui de l'en-tête s'il n'était qu'estimé)
+        """
+        fin = flux.tell()
+        flux.seek(position)
+        flux.write(ConteneurHuffman._decrire_charge(taille_charge, nb_bits_dernier, controle))
+        if nb_caracteres is not None:
+            # Le nombre de caractères termine la partie fixe de l'en-tête
+            flux.seek(ConteneurHuffman._EN_TETE.size - ConteneurHuffman._NB_CARACTERES.size)
+            flux.write(ConteneurHuffman._NB_CARACTERES.pack(nb_caracteres))
+        flux.seek(fin)
+
+    @staticmethod
+    def somme_controle(texte: Union[str, bytes], valeur: int = 0) -> int:
+        """
+        CRC32 d'un texte (encodé en UTF-8) ou d'octets bruts.
+
+        Args:
+            texte: Morceau de texte ou d'octets
+            valeur: CRC32 des morceaux précédents, pour un calcul au fil de l'eau
+
+        Returns:
+            Le CRC32 de tous les morceaux jusqu'à celui-ci
+        """
+        if isinstance(texte, str):
+            texte = texte.encode('utf-8')
+        return zlib.crc32(texte, valeur)
+
+    @staticmethod
+    def lire(flux: BinaryIO) -> dict:
+        """
+        Lit un conteneur .huff depuis un flux binaire.
+
+        Returns:
+            Dictionnaire avec 'codes', 'charge', 'nb_bits_dernier',
+            'nb_caracteres', 'drapeaux' et 'version'
+
+        Raises:
+            ValueError: si le fichier n'est pas un conteneur .huff valide
+        """
+        donnees = ConteneurHuffman.lire_en_tete(flux)
+        if 'blocs' in donnees:
+            raise ValueError("Fichier par blocs : à lire bloc par bloc (lire_en_tete)")
+        if donnees['drapeaux'] & ConteneurHuffman.ADAPTATIF:
+            raise ValueError("Fichier adaptatif : aucune table des codes à lire")
+        if donnees['drapeaux'] & ConteneurHuffman.MODELE:
+            raise ValueError("Fichier compressé avec un modèle : la table est dans le modèle")
+        donnees['charge'] = ConteneurHuffman._lire_exact(flux, donnees.pop('taille_charge'))
+        return donnees
+
+    @staticmethod
+    def lire_en_tete(flux: BinaryIO) -> dict:
+        """
+        Lit l'en-tête, la table des codes et la description de la charge.
+        Le flux est laissé au début des octets encodés, qui peuvent ensuite
+        être lus morceau par morceau.
+
+        Pour un fichier par blocs, la table et la charge sont remplacées par
+        'blocs' : la liste (position, taille, nb_caracteres) de chaque bloc.
+        Avec le drapeau CONTROLE, 'controle' est le CRC32 du texte d'origine.
+        Pour un fichier adaptatif, seul l'en-tête fixe est lu.
+        Pour un fichier compressé avec un modèle, la table est remplacée par
+        'modele' (identifiant du modèle) et 'echappes' (symboles hors modèle).
+
+        Returns:
+            Dictionnaire avec 'codes', 'taille_charge', 'nb_bits_dernier'
+            (ou 'blocs'), 'nb_caracteres', 'drapeaux' et 'version'
+
+        Raises:
+            ValueError: si le fichier n'est pas un conteneur .huff valide
+        """
+        magique, version, drapeaux, nb_caracteres = ConteneurHuffman._EN_TETE.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._EN_TETE.size)
+        )
+        if magique != ConteneurHuffman.MAGIQUE:
+            raise ValueError("Ce fichier n'est pas un fichier .huff valide")
+        if version != ConteneurHuffman.VERSION:
+            raise ValueError(f"Version de format non supportée : {version}")
+
+        en_tete = {
+            'version': version,
+            'drapeaux': drapeaux,
+            'nb_caracteres': nb_caracteres
+        }
+        if drapeaux & ConteneurHuffman.BLOCS:
+            en_tete['blocs'] = ConteneurHuffman._lire_index(flux)
+            if drapeaux & ConteneurHuffman.CONTROLE:
+                en_tete['controle'], = ConteneurHuffman._CONTROLE.unpack(
+                    ConteneurHuffman._lire_exact(flux, ConteneurHuffman._CONTROLE.size)
+                )
+        elif drapeaux & ConteneurHuffman.MODELE:
+            en_tete.update(ConteneurHuffman._lire_reference_modele(flux))
+        elif not drapeaux & ConteneurHuffman.ADAPTATIF:
+            en_tete.update(ConteneurHuffman._lire_table_et_charge(flux, drapeaux))
+        return en_tete
+
+    @staticmethod
+    def encoder_bloc(codes: Dict, charge: bytes, nb_bits_dernier: int, drapeaux: int,
+                     controle: Optional[int] = None) -> bytes:
+        """
+        Construit le contenu d'un bloc indépendant : sa table des codes
+        puis sa charge (même structure que dans un fichier sans blocs).
+        Avec le drapeau CONTROLE, controle est le CRC32 du texte du bloc.
+        """
+        flux = io.BytesIO()
+        ConteneurHuffman._ecrire_table(
+            flux,
+            codes,
+            bool(drapeaux & ConteneurHuffman.CANONIQUE),
+            bool(drapeaux & ConteneurHuffman.OCTETS)
+        )
+        if not drapeaux & ConteneurHuffman.CONTROLE:
+            controle = None
+        elif controle is None:
+            raise ValueError("Le drapeau CONTROLE nécessite le CRC32 du bloc")
+        flux.write(ConteneurHuffman._decrire_charge(len(charge), nb_bits_dernier, controle))
+        flux.write(charge)
+        return flux.getvalue()
+
+    @staticmethod
+    def decoder_bloc(bloc: bytes, drapeaux: int) -> dict:
+        """
+        Relit un bloc construit par encoder_bloc.
+
+        Returns:
+            Dictionnaire avec 'codes', 'charge' et 'nb_bits_dernier'
+            (et 'controle' avec le drapeau CONTROLE)
+        """
+        flux = io.BytesIO(bloc)
+        donnees = ConteneurHuffman._lire_table_et_charge(flux, drapeaux)
+        donnees['charge'] = ConteneurHuffman._lire_exact(flux, donnees.pop('taille_charge'))
+        return donnees
+
+    @staticmethod
+    def ecrire_avec_modele(flux: BinaryIO, identifiant: int, charge: bytes, nb_bits_dernier: int,
+                           nb_caracteres: int, echappes: bytes, drapeaux: int = 0):
+        """
+        Écrit un conteneur qui référence un modèle partagé au lieu de
+        stocker sa table des codes.
+
+        Args:
+            identifiant: Identifiant du modèle utilisé
+            echappes: Symboles absents du modèle, dans l'ordre du texte
+            (autres arguments : voir ecrire)
+        """
+        flux.write(ConteneurHuffman._EN_TETE.pack(
+            ConteneurHuffman.MAGIQUE, ConteneurHuffman.VERSION,
+            drapeaux | ConteneurHuffman.MODELE, nb_caracteres
+        ))
+        flux.write(ConteneurHuffman._IDENTIFIANT.pack(identifiant))
+        flux.write(ConteneurHuffman._NB_ENTREES.pack(len(echappes)))
+        flux.write(echappes)
+        flux.write(ConteneurHuffman._CHARGE.pack(len(charge), nb_bits_dernier))
+        flux.write(charge)
+
+    @staticmethod
+    def ecrire_modele(flux: BinaryIO, identifiant: int, codes: Dict, longueur_echappement: int,
+                      drapeaux: int = 0):
+        """
+        Écrit un fichier modèle : identifiant, longueur du code d'échappement
+        et longueurs des codes des symboles (table canonique).
+        """
+        flux.write(ConteneurHuffman._EN_TETE_MODELE.pack(
+            ConteneurHuffman.MAGIQUE_MODELE, ConteneurHuffman.VERSION,
+            drapeaux | ConteneurHuffman.CANONIQUE, identifiant, longueur_echappement
+        ))
+        ConteneurHuffman._ecrire_table(
+            flux, codes, True, bool(drapeaux & ConteneurHuffman.OCTETS)
+        )
+
+    @staticmethod
+    def lire_modele(flux: BinaryIO) -> dict:
+        """
+        Lit un fichier modèle.
+
+        Returns:
+            Dictionnaire avec 'identifiant', 'drapeaux', 'longueur_echappement'
+            et 'longueurs' (longueur du code de chaque symbole)
+
+        Raises:
+            ValueError: si le fichier n'est pas un modèle valide
+        """
+        magique, version, drapeaux, identifiant, longueur_echappement = \
+            ConteneurHuffman._EN_TETE_MODELE.unpack(
+                ConteneurHuffman._lire_exact(flux, ConteneurHuffman._EN_TETE_MODELE.size)
+            )
+        if magique != ConteneurHuffman.MAGIQUE_MODELE:
+            raise ValueError("Ce fichier n'est pas un modèle Huffman valide")
+        if version != ConteneurHuffman.VERSION:
+            raise ValueError(f"Version de format non supportée : {version}")
+
+        codes = ConteneurHuffman._lire_table(
+            flux, True, bool(drapeaux & ConteneurHuffman.OCTETS)
+        )
+        return {
+            'identifiant': identifiant,
+            'drapeaux': drapeaux,
+            'longueur_echappement': longueur_echappement,
+            'longueurs': GenerateurCodes.longueurs(codes)
+        }
+
+    @staticmethod
+    def ecrire_en_tete_adaptatif(flux: BinaryIO, drapeaux: int, nb_caracteres: int = 0):
+        """
+        Écrit l'en-tête d'un fichier adaptatif, suivi directement du flux encodé.
+
+        Le nombre de caractères n'est qu'indicatif (0 si inconnu, par exemple
+        dans un tube) : le décodage s'arrête sur la marque de fin du flux.
+        """
+        flux.write(ConteneurHuffman._EN_TETE.pack(
+            ConteneurHuffman.MAGIQUE, ConteneurHuffman.VERSION,
+            drapeaux | ConteneurHuffman.ADAPTATIF, nb_caracteres
+        ))
+
+    @staticmethod
+    def ecrire_en_tete_blocs(flux: BinaryIO, drapeaux: int):
+        """
+        Écrit l'en-tête d'un fichier par blocs. Le nombre de caractères et
+        la position de l'index sont complétés par terminer_blocs.
+        """
+        flux.write(ConteneurHuffman._EN_TETE.pack(
+            ConteneurHuffman.MAGIQUE, ConteneurHuffman.VERSION,
+            drapeaux | ConteneurHuffman.BLOCS, 0
+        ))
+        flux.write(ConteneurHuffman._POSITION_INDEX.pack(0))
+
+    @staticmethod
+    def terminer_blocs(flux: BinaryIO, index: List[Tuple[int, int, int]], drapeaux: int,
+                       controle: Optional[int] = None):
+        """
+        Écrit l'index à la fin du fichier puis complète l'en-tête.
+
+        Args:
+            flux: Flux positionné après le dernier bloc
+            index: Liste (position, taille, nb_caracteres) de chaque bloc
+            drapeaux: Les drapeaux passés à ecrire_en_tete_blocs
+            controle: CRC32 de tout le texte (obligatoire avec le drapeau CONTROLE)
+        """
+        position_index = flux.tell()
+        morceaux = [ConteneurHuffman._NB_ENTREES.pack(len(index))]
+        for entree in index:
+            morceaux.append(ConteneurHuffman._ENTREE_INDEX.pack(*entree))
+        if drapeaux & ConteneurHuffman.CONTROLE:
+            if controle is None:
+                raise ValueError("Le drapeau CONTROLE nécessite le CRC32 du texte")
+            morceaux.append(ConteneurHuffman._CONTROLE.pack(controle))
+        flux.write(b''.join(morceaux))
+
+        fin = flux.tell()
+        flux.seek(0)
+        flux.write(ConteneurHuffman._EN_TETE.pack(
+            ConteneurHuffman.MAGIQUE, ConteneurHuffman.VERSION,
+            drapeaux | ConteneurHuffman.BLOCS, sum(entree[2] for entree in index)
+        ))
+        flux.write(ConteneurHuffman._POSITION_INDEX.pack(position_index))
+        flux.seek(fin)
+
+    @staticmethod
+    def _ecrire_debut(flux: BinaryIO, codes: Dict[str, str], nb_caracteres: int, drapeaux: int):
+        """Écrit l'en-tête fixe puis la table des codes"""
+        flux.write(ConteneurHuffman._EN_TETE.pack(
+            ConteneurHuffman.MAGIQUE, ConteneurHuffman.VERSION, drapeaux, nb_caracteres
+        ))
+        ConteneurHuffman._ecrire_table(
+            flux,
+            codes,
+            bool(drapeaux & ConteneurHuffman.CANONIQUE),
+            bool(drapeaux & ConteneurHuffman.OCTETS)
+        )
+
+    @staticmethod
+    def _lire_table_et_charge(flux: BinaryIO, drapeaux: int) -> dict:
+        """Lit la table des codes et la description de la charge qui la suit"""
+        codes = ConteneurHuffman._lire_table(
+            flux,
+            bool(drapeaux & ConteneurHuffman.CANONIQUE),
+            bool(drapeaux & ConteneurHuffman.OCTETS)
+        )
+        donnees = ConteneurHuffman._lire_description_charge(flux, drapeaux)
+        donnees['codes'] = codes
+        return donnees
+
+    @staticmethod
+    def _decrire_charge(taille_charge: int, nb_bits_dernier: int, controle: Optional[int]) -> bytes:
+        """Description de la charge, avec le CRC32 du texte s'il est donné"""
+        if controle is None:
+            return ConteneurHuffman._CHARGE.pack(taille_charge, nb_bits_dernier)
+        return ConteneurHuffman._CHARGE_CONTROLE.pack(taille_charge, nb_bits_dernier, controle)
+
+    @staticmethod
+    def _lire_description_charge(flux: BinaryIO, drapeaux: int) -> dict:
+        """Lit la description de la charge (avec le CRC32 si le drapeau CONTROLE est présent)"""
+        if drapeaux & ConteneurHuffman.CONTROLE:
+            taille_charge, nb_bits_dernier, controle = ConteneurHuffman._CHARGE_CONTROLE.unpack(
+                ConteneurHuffman._lire_exact(flux, ConteneurHuffman._CHARGE_CONTROLE.size)
+            )
+            return {
+                'taille_charge': taille_charge,
+                'nb_bits_dernier': nb_bits_dernier,
+                'controle': controle
+            }
+        taille_charge, nb_bits_dernier = ConteneurHuffman._CHARGE.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._CHARGE.size)
+        )
+        return {
+            'taille_charge': taille_charge,
+            'nb_bits_dernier': nb_bits_dernier
+        }
+
+    @staticmethod
+    def _lire_reference_modele(flux: BinaryIO) -> dict:
+        """Lit l'identifiant du modèle, les symboles échappés et la description de la charge"""
+        identifiant, = ConteneurHuffman._IDENTIFIANT.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._IDENTIFIANT.size)
+        )
+        taille_echappes, = ConteneurHuffman._NB_ENTREES.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._NB_ENTREES.size)
+        )
+        echappes = ConteneurHuffman._lire_exact(flux, taille_echappes)
+        taille_charge, nb_bits_dernier = ConteneurHuffman._CHARGE.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._CHARGE.size)
+        )
+        return {
+            'modele': identifiant,
+            'echappes': echappes,
+            'taille_charge': taille_charge,
+            'nb_bits_dernier': nb_bits_dernier
+        }
+
+    @staticmethod
+    def _lire_index(flux: BinaryIO) -> List[Tuple[int, int, int]]:
+        """Lit l'index des blocs (sa position suit l'en-tête fixe)"""
+        position_index, = ConteneurHuffman._POSITION_INDEX.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._POSITION_INDEX.size)
+        )
+        flux.seek(position_index)
+        nb_blocs, = ConteneurHuffman._NB_ENTREES.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._NB_ENTREES.size)
+        )
+        donnees = ConteneurHuffman._lire_exact(flux, nb_blocs * ConteneurHuffman._ENTREE_INDEX.size)
+        return list(ConteneurHuffman._ENTREE_INDEX.iter_unpack(donnees))
+
+    @staticmethod
+    def _ecrire_table(flux: BinaryIO, codes: Dict, canonique: bool, octets: bool):
+        """
+        Écrit la table des codes : caractère, longueur du code, bits du code.
+        En mode canonique, les bits du code ne sont pas écrits.
+        En mode octets, chaque symbole tient sur un octet.
+        """
+        flux.write(ConteneurHuffman._NB_ENTREES.pack(len(codes)))
+        if ConteneurHuffman._table_en_tableau(len(codes), canonique, octets):
+            longueurs = bytearray(256)
+            for octet, code in codes.items():
+                longueurs[octet] = len(code)
+            flux.write(bytes(longueurs))
+            return
+
+        morceaux = []
+        for caractere, code in codes.items():
+            longueur = len(code)
+            if octets:
+                morceaux.append(bytes([caractere]))
+            else:
+                octets_car = caractere.encode('utf-8')
+                morceaux.append(bytes([len(octets_car)]))
+                morceaux.append(octets_car)
+            morceaux.append(bytes([longueur]))
+            if not canonique:
+                morceaux.append(int(code, 2).to_bytes((longueur + 7) // 8, 'big'))
+        flux.write(b''.join(morceaux))
+
+    @staticmethod
+    def _lire_table(flux: BinaryIO, canonique: bool, octets: bool) -> Dict:
+        """
+        Lit la table des codes écrite par _ecrire_table.
+        En mode canonique, les codes sont régénérés à partir des longueurs.
+        """
+        nb_entrees, = ConteneurHuffman._NB_ENTREES.unpack(
+            ConteneurHuffman._lire_exact(flux, ConteneurHuffman._NB_ENTREES.size)
+        )
+        if ConteneurHuffman._table_en_tableau(nb_entrees, canonique, octets):
+            longueurs = ConteneurHuffman._lire_exact(flux, 256)
+            return GenerateurCodes.generer_canonique(
+                {octet: longueur for octet, longueur in enumerate(longueurs) if longueur}
+            )
+
+        codes = {}
+        longueurs = {}
+        for _ in range(nb_entrees):
+            if octets:
+                caractere = ConteneurHuffman._lire_exact(flux, 1)[0]
+            else:
+                taille_car = ConteneurHuffman._lire_exact(flux, 1)[0]
+                caractere = ConteneurHuffman._lire_exact(flux, taille_car).decode('utf-8')
+            longueur = ConteneurHuffman._lire_exact(flux, 1)[0]
+            if canonique:
+                longueurs[caractere] = longueur
+                continue
+            valeur = int.from_bytes(
+                ConteneurHuffman._lire_exact(flux, (longueur + 7) // 8), 'big'
+            )
+            codes[caractere] = format(valeur, f'0{longueur}b')
+
+        if canonique:
+            return GenerateurCodes.generer_canonique(longueurs)
+        return codes
+
+    @staticmethod
+    def _table_en_tableau(nb_entrees: int, canonique: bool, octets: bool) -> bool:
+        """
+        Une table canonique d'octets est stockée comme tableau de 256 longueurs
+        dès que c'est plus court que les paires (octet, longueur).
+        """
+        return canonique and octets and 2 * nb_entrees >= 256
+
+    @staticmethod
+    def _lire_exact(flux: BinaryIO, taille: int) -> bytes:
+        """Lit exactement `taille` octets ou lève une erreur si le fichier est tronqué"""
+        donnees = flux.read(taille)
+        if len(donnees) != taille:
+            raise ValueError("Fichier .huff tronqué ou corrompu")
+        return donnees
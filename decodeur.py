@@ -0,0 +1,252 @@
+from typing import Dict, Iterable, Iterator, Tuple
+from encodeur import Encodeur
+
+
+class DecodeurTable:
+    """
+    Décodeur par tables : au lieu de descendre l'arbre bit par bit, on lit
+    les K prochains bits et une seule recherche donne le caractère et la
+    longueur de son code.
+
+    Table principale : 2^K entrées indexées par les K prochains bits.
+        - code de longueur <= K : toutes les entrées qui commencent par ce
+          code contiennent (caractère, longueur)
+        - code plus long que K : l'entrée du préfixe de K bits renvoie vers
+          une table secondaire indexée par les (au plus K) bits suivants,
+          elle-même renvoyant vers d'autres tables si le code est encore
+          plus long
+
+    Chaque table a au plus 2^K entrées : la taille totale reste
+    proportionnelle au nombre de codes, même avec des codes très longs.
+    """
+
+    def __init__(self, codes: Dict[str, str], k: int = 8, octets: bool = False):
+        """
+        Args:
+            codes: Dictionnaire {caractère: code_binaire}
+                   (ou {octet 0-255: code_binaire} en mode octets)
+            k: Nombre de bits lus à chaque recherche dans la table principale
+            octets: Produire des bytes au lieu d'un texte
+        """
+        if octets:
+            codes = {bytes([octet]): code for octet, code in codes.items()}
+        self.vide = b"" if octets else ""
+        self.k = k
+        self.longueur_max = max((len(code) for code in codes.values()), default=0)
+
+        entrees = [(caractere, len(code), int(code, 2)) for caractere, code in codes.items()]
+        _, self.symboles, self.longueurs, self.secondaires = self._construire_table(entrees, 0, k)
+
+    def _construire_table(self, entrees: list, consommes: int, nb_bits: int) -> Tuple:
+        """
+        Construit la table des codes dont les `consommes` premiers bits ont
+        déjà été lus, indexée par les `nb_bits` bits suivants.
+
+        Args:
+            entrees: Liste de (caractère, longueur du code, valeur du code)
+            consommes: Nombre de bits lus par les tables précédentes
+            nb_bits: Nombre de bits indexant cette table
+
+        Returns:
+            (nb_bits, symboles, longueurs, secondaires) ; pour un code trop
+            long, l'entrée de secondaires est la table des bits suivants
+        """
+        taille = 1 << nb_bits
+        symboles = [None] * taille
+        longueurs = [0] * taille
+        secondaires = [None] * taille
+
+        codes_longs = {}
+        for caractere, longueur, valeur in entrees:
+            reste = longueur - consommes
+            bits = valeur & ((1 << reste) - 1)
+            if reste <= nb_bits:
+                debut = bits << (nb_bits - reste)
+                for indice in range(debut, debut + (1 << (nb_bits - reste))):
+                    symboles[indice] = caractere
+                    longueurs[indice] = longueur
+            else:
+                prefixe = bits >> (reste - nb_bits)
+                codes_longs.setdefault(prefixe, []).append((caractere, longueur, valeur))
+
+        for prefixe, entrees_longues in codes_longs.items():
+            suivants = min(self.k, max(longueur for _, longueur, _ in entrees_longues)
+                           - consommes - nb_bits)
+            secondaires[prefixe] = self._construire_table(
+                entrees_longues, consommes + nb_bits, suivants
+            )
+        return nb_bits, symboles, longueurs, secondaires
+
+    def decoder(self, texte_encode: str) -> str:
+        """
+        Décode une chaîne de 0 et 1 (même résultat que Encodeur.decoder).
+
+        Args:
+            texte_encode: Chaîne de bits (0 et 1)
+
+        Returns:
+            Le texte décodé
+        """
+        donnees, nb_bits_dernier = Encodeur.empaqueter(texte_encode)
+        return self.decoder_octets(donnees, nb_bits_dernier)
+
+    def decoder_octets(self, donnees: bytes, nb_bits_dernier: int) -> str:
+        """
+        Décode directement les octets empaquetés d'un fichier .huff.
+
+        Args:
+            donnees: Texte encodé, 8 bits par octet
+            nb_bits_dernier: Nombre de bits utiles dans le dernier octet
+
+        Returns:
+            Le texte décodé (bytes en mode octets)
+
+        Raises:
+            ValueError: si les bits ne correspondent à aucun code
+        """
+        return self.vide.join(self.decoder_flux([donnees], nb_bits_dernier))
+
+    def decoder_flux(self, morceaux: Iterable[bytes], nb_bits_dernier: int) -> Iterator:
+        """
+        Décode les octets empaquetés fournis morceau par morceau.
+
+        Un code peut être coupé entre deux morceaux : les bits non encore
+        décodés sont conservés et complétés par le morceau suivant.
+
+        Args:
+            morceaux: Morceaux successifs des octets encodés
+            nb_bits_dernier: Nombre de bits utiles dans le dernier octet du flux
+
+        Returns:
+            Itérateur sur le texte décodé de chaque morceau
+        """
+        tampon = b""
+        position = 0
+
+        for morceau in morceaux:
+            # Garder les octets non entièrement décodés du morceau précédent
+            tampon = tampon[position >> 3:] + morceau
+            position &= 7
+            texte, position = self._decoder_partiel(tampon, position, len(tampon) * 8 - self._marge())
+            if texte:
+                yield texte
+
+        if tampon:
+            tampon = tampon[position >> 3:]
+            position &= 7
+            fin = (len(tampon) - 1) * 8 + nb_bits_dernier
+            texte, position = self._decoder_partiel(tampon, position, fin, final=True)
+            if position != fin:
+                raise ValueError("Données encodées corrompues")
+            if texte:
+                yield texte
+
+    def decoder_vue(self, donnees: memoryview, nb_bits_dernier: int,
+                    taille_tranche: int) -> Iterator:
+        """
+        Décode des octets empaquetés déjà accessibles en entier (par exemple
+        une vue sur un fichier projeté en mémoire), tranche par tranche.
+
+        Contrairement à decoder_flux, les octets ne sont jamais recopiés :
+        chaque tranche est décodée en place, seul le texte d'une tranche est
+        produit à la fois.
+
+        Args:
+            donnees: Octets encodés (bytes ou memoryview)
+            nb_bits_dernier: Nombre de bits utiles dans le dernier octet
+            taille_tranche: Nombre d'octets décodés par texte produit
+
+        Returns:
+            Itérateur sur le texte décodé de chaque tranche
+        """
+        if not len(donnees):
+            return
+
+        position = 0
+        pas = taille_tranche * 8
+        # Au-delà, un code peut dépasser la fin des données
+        fin_sure = len(donnees) * 8 - self._marge()
+        while position < fin_sure:
+            texte, position = self._decoder_partiel(donnees, position, min(position + pas, fin_sure))
+            if texte:
+                yield texte
+
+        fin = (len(donnees) - 1) * 8 + nb_bits_dernier
+        texte, position = self._decoder_partiel(donnees, position, fin, final=True)
+        if position != fin:
+            raise ValueError("Données encodées corrompues")
+        if texte:
+            yield texte
+
+    def _marge(self) -> int:
+        """
+        Nombre de bits à avoir devant soi pour lire n'importe quel code.
+
+        Au moins un octet : une passe non finale ne doit jamais entrer dans
+        le dernier octet, dont les bits de bourrage ne sont pas des codes.
+        """
+        return max(self.longueur_max, self.k, 8)
+
+    def _decoder_partiel(self, donnees: bytes, position: int, fin: int,
+                         final: bool = False) -> Tuple:
+        """
+        Décode les codes qui commencent avant le bit `fin`.
+
+        Si final est faux, `fin` laisse assez de bits après lui pour lire un
+        code complet ; sinon les bits manquants après la fin sont lus comme des 0.
+
+        Returns:
+            (texte décodé, position du premier bit non décodé)
+        """
+        k = self.k
+        masque = (1 << k) - 1
+        symboles = self.symboles
+        longueurs = self.longueurs
+        secondaires = self.secondaires
+        # Marge de lecture : un code entier doit tenir dans la fenêtre
+        marge = self._marge()
+        taille_fenetre = max(64, 2 * ((marge + 7) // 8))
+
+        texte_decode = []
+        ajouter = texte_decode.append
+
+        while position < fin:
+            # Fenêtre de quelques octets convertie en entier, complétée par des 0
+            debut = position >> 3
+            octets = donnees[debut:debut + taille_fenetre]
+            fenetre = int.from_bytes(octets, 'big') << marge
+            nb_bits_fenetre = len(octets) * 8 + marge
+
+            p = position - debut * 8
+            if final and debut + len(octets) >= len(donnees):
+                limite = fin - debut * 8
+            else:
+                limite = min(len(octets) * 8 - marge, fin - debut * 8)
+
+            while p < limite:
+                indice = (fenetre >> (nb_bits_fenetre - p - k)) & masque
+                longueur = longueurs[indice]
+                if longueur:
+                    ajouter(symboles[indice])
+                    p += longueur
+                    continue
+
+                # Code long : tables secondaires, K bits de plus à chaque niveau
+                secondaire = secondaires[indice]
+                lus = p + k
+                while True:
+                    if secondaire is None:
+                        raise ValueError("Données encodées corrompues")
+                    nb_bits, symboles_sec, longueurs_sec, secondaires_sec = secondaire
+                    indice = (fenetre >> (nb_bits_fenetre - lus - nb_bits)) & ((1 << nb_bits) - 1)
+                    longueur = longueurs_sec[indice]
+                    if longueur:
+                        break
+                    secondaire = secondaires_sec[indice]
+                    lus += nb_bits
+                ajouter(symboles_sec[indice])
+                p += longueur
+
+            position = debut * 8 + p
+
+        return self.vide.join(texte_decode), position
@@ -0,0 +1,83 @@
+from typing import Dict, Tuple
+
+
+class EcrivainBits:
+    """
+    Écrit des codes binaires directement sous forme d'octets.
+
+    Les bits qui ne remplissent pas encore un octet complet sont gardés dans
+    un petit entier (moins de 8 bits) : on n'accumule jamais une chaîne de
+    0 et 1 de la taille du texte entier.
+    """
+
+    # Nombre de caractères encodés d'un coup par ecrire_texte
+    TAILLE_MORCEAU = 65536
+
+    def __init__(self):
+        self.reste = 0        # Bits en attente (pas encore un octet complet)
+        self.nb_reste = 0     # Nombre de bits en attente (< 8)
+        self.nb_bits = 0      # Nombre total de bits écrits
+
+    def ecrire(self, valeur: int, longueur: int) -> bytes:
+        """
+        Ajoute un code (valeur entière sur `longueur` bits).
+
+        Returns:
+            Les octets complets produits (éventuellement vide)
+        """
+        self.nb_bits += longueur
+        self.reste = (self.reste << longueur) | valeur
+        self.nb_reste += longueur
+        return self._vider()
+
+    def ecrire_texte(self, texte: str, codes: Dict[str, str]) -> bytes:
+        """
+        Encode un texte et retourne les octets complets produits.
+
+        Le texte est traité par morceaux de TAILLE_MORCEAU caractères : les
+        codes d'un morceau sont regroupés puis convertis en octets d'un seul
+        coup, ce qui borne la mémoire temporaire à la taille d'un morceau.
+
+        Args:
+            texte: Le texte (ou un morceau du texte) à encoder
+            codes: Dictionnaire {caractère: code_binaire}
+
+        Returns:
+            Les octets complets produits
+        """
+        code_de = codes.__getitem__
+        sortie = bytearray()
+
+        for debut in range(0, len(texte), EcrivainBits.TAILLE_MORCEAU):
+            bits = ''.join(map(code_de, texte[debut:debut + EcrivainBits.TAILLE_MORCEAU]))
+            if bits:
+                sortie += self.ecrire(int(bits, 2), len(bits))
+
+        return bytes(sortie)
+
+    def terminer(self) -> Tuple[bytes, int]:
+        """
+        Complète le dernier octet avec des 0.
+
+        Returns:
+            (dernier octet ou b"", nombre de bits de bourrage ajoutés)
+        """
+        if self.nb_reste == 0:
+            return b"", 0
+
+        bourrage = 8 - self.nb_reste
+        dernier = bytes([self.reste << bourrage])
+        self.reste = 0
+        self.nb_reste = 0
+        return dernier, bourrage
+
+    def _vider(self) -> bytes:
+        """Extrait les octets complets de l'accumulateur"""
+        nb_octets = self.nb_reste >> 3
+        if nb_octets == 0:
+            return b""
+
+        self.nb_reste &= 7
+        octets = (self.reste >> self.nb_reste).to_bytes(nb_octets, 'big')
+        self.reste &= (1 << self.nb_reste) - 1
+        return octets
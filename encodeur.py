@@ -1,5 +1,6 @@
-from typing import Dict
+from typing import Dict, Tuple
 from noeud import NoeudHuffman
+from ecrivain_bits import EcrivainBits
 
 class Encodeur:
     """Classe pour encoder et décoder le texte"""
@@ -18,6 +19,24 @@ class Encodeur:
         """
         return ''.join(codes[caractere] for caractere in texte)
     
+    @staticmethod
+    def encoder_octets(texte: str, codes: Dict[str, str]) -> Tuple[bytes, int]:
+        """
+        Encode le texte directement en octets, sans construire la chaîne
+        de 0 et 1 complète (environ 8 fois moins de mémoire).
+        
+        Args:
+            texte: Le texte à encoder
+            codes: Dictionnaire {caractère: code_binaire}
+            
+        Returns:
+            (octets encodés, nombre de bits de bourrage dans le dernier octet)
+        """
+        ecrivain = EcrivainBits()
+        octets = ecrivain.ecrire_texte(texte, codes)
+        dernier, bourrage = ecrivain.terminer()
+        return octets + dernier, bourrage
+    
     @staticmethod
     def decoder(texte_encode: str, racine: NoeudHuffman) -> str:
         """
@@ -49,3 +68,92 @@ class Encodeur:
                 noeud_actuel = racine
         
         return ''.join(texte_decode)
+    
+    @staticmethod
+    def decoder_canonique(texte_encode: str, longueurs: Dict[str, int]) -> str:
+        """
+        Décode un texte encodé avec des codes canoniques, sans arbre.
+        
+        Pour chaque longueur L, les codes canoniques de longueur L sont
+        consécutifs à partir de premier[L] : un code lu de L bits est valide
+        si code - premier[L] < compte[L].
+        
+        Args:
+            texte_encode: Chaîne de bits (0 et 1)
+            longueurs: Dictionnaire {caractère: longueur du code}
+            
+        Returns:
+            Le texte décodé
+        """
+        if not texte_encode:
+            return ""
+        
+        longueur_max = max(longueurs.values())
+        symboles = sorted(longueurs, key=lambda c: (longueurs[c], c))
+        
+        compte = [0] * (longueur_max + 1)
+        for longueur in longueurs.values():
+            compte[longueur] += 1
+        
+        premier = [0] * (longueur_max + 1)
+        indice = [0] * (longueur_max + 1)
+        code = 0
+        position = 0
+        for longueur in range(1, longueur_max + 1):
+            premier[longueur] = code
+            indice[longueur] = position
+            position += compte[longueur]
+            code = (code + compte[longueur]) << 1
+        
+        texte_decode = []
+        code = 0
+        longueur = 0
+        
+        for bit in texte_encode:
+            code = (code << 1) | (bit == '1')
+            longueur += 1
+            
+            decalage = code - premier[longueur]
+            if decalage < compte[longueur]:
+                texte_decode.append(symboles[indice[longueur] + decalage])
+                code = 0
+                longueur = 0
+        
+        return ''.join(texte_decode)
+    
+    @staticmethod
+    def empaqueter(texte_encode: str) -> Tuple[bytes, int]:
+        """
+        Regroupe une chaîne de 0 et 1 en octets (8 bits par octet).
+        
+        Args:
+            texte_encode: Chaîne de bits (0 et 1)
+            
+        Returns:
+            (octets, nombre de bits utiles dans le dernier octet)
+        """
+        if not texte_encode:
+            return b"", 0
+        
+        nb_bits_dernier = len(texte_encode) % 8 or 8
+        bits = texte_encode + '0' * (8 - nb_bits_dernier)
+        return int(bits, 2).to_bytes(len(bits) // 8, 'big'), nb_bits_dernier
+    
+    @staticmethod
+    def depaqueter(donnees: bytes, nb_bits_dernier: int) -> str:
+        """
+        Retrouve la chaîne de 0 et 1 à partir des octets empaquetés.
+        
+        Args:
+            donnees: Octets produits par empaqueter
+            nb_bits_dernier: Nombre de bits utiles dans le dernier octet
+            
+        Returns:
+            La chaîne de bits (0 et 1)
+        """
+        if not donnees:
+            return ""
+        
+        nb_bits = (len(donnees) - 1) * 8 + nb_bits_dernier
+        bits = format(int.from_bytes(donnees, 'big'), f'0{len(donnees) * 8}b')
+        return bits[:nb_bits]
@@ -1,5 +1,7 @@
-from typing import Dict
+from typing import Dict, List, Optional
 from noeud import NoeudHuffman
+from arbre_tableau import NoeudTableau
+from parcours import ParcoursArbre
 
 class GenerateurCodes:
     """Classe pour générer les codes de Huffman"""
@@ -16,26 +18,65 @@ class GenerateurCodes:
         Returns:
             Dictionnaire {caractère: code_binaire}
         """
+        # Arbre en tableaux : codes calculés directement sur les tableaux
+        if isinstance(racine, NoeudTableau):
+            return racine.arbre.codes()
+        
         codes = {}
         
-        def parcourir(noeud: NoeudHuffman, code_actuel: str):
-            if noeud is None:
-                return
-            
-            # Si c'est une feuille, on a trouvé un caractère
-            if noeud.est_feuille():
-                codes[noeud.caractere] = code_actuel if code_actuel else '0'
-                return
+        # Le chemin (entier) est converti en texte seulement pour les feuilles :
+        # aller à gauche ajoute 0 au code, aller à droite ajoute 1 au code
+        # (une racine sans caractère est l'arbre d'un texte vide : aucun code)
+        for noeud, profondeur, chemin in ParcoursArbre.prefixe(racine):
+            if noeud.est_feuille() and noeud.caractere is not None:
+                codes[noeud.caractere] = format(chemin, f'0{profondeur}b') if profondeur else '0'
+        
+        return codes
+    
+    @staticmethod
+    def longueurs(codes: Dict[str, str]) -> Dict[str, int]:
+        """Retourne la longueur du code de chaque caractère"""
+        return {caractere: len(code) for caractere, code in codes.items()}
+    
+    @staticmethod
+    def generer_canonique(longueurs: Dict[str, int]) -> Dict[str, str]:
+        """
+        Génère les codes de Huffman canoniques à partir des seules longueurs.
+        
+        Les caractères sont triés par (longueur, caractère) et reçoivent des
+        codes consécutifs : les longueurs suffisent donc à retrouver les codes,
+        sans avoir besoin de l'arbre.
+        
+        Args:
+            longueurs: Dictionnaire {caractère: longueur du code}
             
-            # Sinon, continuer le parcours
-            #aller à gauche ajoute 0 au code,
-            #aller à droite ajoute 1 au code,
-            parcourir(noeud.gauche, code_actuel + '0')
-            parcourir(noeud.droite, code_actuel + '1')
+        Returns:
+            Dictionnaire {caractère: code_binaire}
+        """
+        codes = {}
+        code = 0
+        longueur_precedente = 0
+        
+        for caractere in sorted(longueurs, key=lambda c: (longueurs[c], c)):
+            longueur = longueurs[caractere]
+            code <<= longueur - longueur_precedente
+            codes[caractere] = format(code, f'0{longueur}b')
+            code += 1
+            longueur_precedente = longueur
         
-        parcourir(racine, '')
         return codes
     
+    @staticmethod
+    def en_tableau(codes: Dict[int, str]) -> List[Optional[str]]:
+        """
+        Convertit les codes d'octets en tableau de 256 entrées
+        (indice = valeur de l'octet, None si l'octet n'apparaît pas).
+        """
+        tableau = [None] * 256
+        for octet, code in codes.items():
+            tableau[octet] = code
+        return tableau
+    
     @staticmethod
     def calculer_longueur_moyenne(codes: Dict[str, str], frequences: Dict[str, int]) -> float:
         """Calcule la longueur moyenne des codes pondérée par les fréquences"""
@@ -1,15 +1,49 @@
-import pickle
+import codecs
+import io
+import mmap
 import os
-from typing import Tuple, Optional
+from contextlib import contextmanager, nullcontext
+from typing import BinaryIO, Callable, Iterator, Tuple, Optional
 from huffman import CompressionHuffman
 from affichage import Affichage
+from analyseur import AnalyseurFrequences
+from analyseur_parallele import AnalyseurParallele
+from conteneur import ConteneurHuffman
+from constructeur_arbre import ConstructeurArbre
+from generateur_codes import GenerateurCodes
+from encodeur import Encodeur
+from decodeur import DecodeurTable
+from ecrivain_bits import EcrivainBits
+from statistiques import Statistiques
+from backend_numpy import BackendNumpy
+from blocs import CompressionParBlocs
+from adaptatif import HuffmanAdaptatif
+from modele import ModeleHuffman
+from metriques import MetriquesEtapes
 
 class GestionFichiers:
     """Classe pour gérer la compression et décompression de fichiers"""
     
+    # Taille des morceaux lus en mode flux (en caractères)
+    TAILLE_MORCEAU = 1024 * 1024
+    
+    # Nombre de morceaux régulièrement espacés lus pour estimer les fréquences
+    NB_ECHANTILLONS = 64
+    
     @staticmethod
     def compresser_fichier(fichier_entree: str, fichier_sortie: Optional[str] = None, 
-                          afficher_details: bool = True) -> bool:
+                          afficher_details: bool = True, canonique: bool = True,
+                          flux: bool = False, taille_morceau: int = TAILLE_MORCEAU,
+                          octets: bool = False, backend: str = "python",
+                          taille_bloc: Optional[int] = None,
+                          nb_processus: Optional[int] = None,
+                          longueur_max: Optional[int] = None,
+                          algorithme: str = "statique",
+                          modele: Optional[str] = None,
+                          metriques: Optional[MetriquesEtapes] = None,
+                          projection: bool = False,
+                          echantillon: Optional[float] = None,
+                          analyse_parallele: bool = False) -> bool:
         """
         Compresse un fichier texte en format Huffman.
         
@@ -17,6 +51,48 @@ class GestionFichiers:
             fichier_entree: Chemin du fichier à compresser
             fichier_sortie: Chemin du fichier compressé (optionnel)
             afficher_details: Afficher les statistiques
+            canonique: Utiliser des codes canoniques (seules les longueurs
+                       sont stockées dans le fichier)
+            flux: Compresser en deux passes sur des morceaux de taille fixe
+                  (la mémoire utilisée ne dépend pas de la taille du fichier)
+            taille_morceau: Taille des morceaux en mode flux (en caractères)
+            octets: Compresser les octets bruts (0-255) au lieu des caractères
+                    UTF-8 : utilisable sur n'importe quel fichier, même binaire
+                    (toujours en mode flux)
+            backend: "python" ou "numpy" (fréquences et encodage vectorisés,
+                     "python" est utilisé si NumPy n'est pas installé)
+            taille_bloc: Découper l'entrée en blocs indépendants de cette taille
+                         (en caractères, ou en octets en mode octets), chacun
+                         avec ses propres codes, compressés en parallèle
+            nb_processus: Nombre de processus en mode blocs, et pour l'analyse
+                          des fréquences avec analyse_parallele (None : un par
+                          cœur, 1 : aucun)
+            longueur_max: Longueur maximale des codes en bits (None : pas de
+                          limite), pour garder des tables de décodage petites
+            algorithme: "statique" ou "adaptatif" (une seule passe, arbre mis
+                        à jour à chaque symbole, aucune table stockée)
+            modele: Chemin d'un modèle partagé (ModeleHuffman.sauvegarder) :
+                    seul son identifiant est stocké, le mode texte ou octets
+                    est celui du modèle
+            metriques: Mesures par étape à remplir : lecture, étapes de
+                       CompressionHuffman et sauvegarde pour un fichier lu en
+                       entier, une seule étape "compression" pour les modes
+                       qui lisent, encodent et écrivent au fil de l'eau
+            projection: Projeter le fichier d'entrée en mémoire (mmap) et
+                        encoder directement depuis la projection (toujours en
+                        mode flux ou par blocs ; les morceaux sont alors
+                        comptés en octets du fichier). Sans effet avec un
+                        modèle ou en mode adaptatif
+            echantillon: Estimer les fréquences sur cette fraction du fichier
+                         (ex. 0.01), lue en NB_ECHANTILLONS morceaux
+                         régulièrement espacés, au lieu de lire tout le
+                         fichier une première fois (toujours en mode flux).
+                         Les symboles absents des échantillons reçoivent un
+                         code quand même (voir AnalyseurFrequences.estimer_frequences)
+            analyse_parallele: Répartir le comptage des fréquences d'un grand
+                               fichier sur nb_processus processus
+                               (AnalyseurParallele) ; sinon il reste dans le
+                               processus courant
             
         Returns:
             True si succès, False sinon
@@ -30,28 +106,66 @@ class GestionFichiers:
                 Affichage.titre("🗜️  COMPRESSION DE FICHIER")
                 print(f"\n📄 Fichier d'entrée : {fichier_entree}")
             
-            # Lire le fichier
-            with open(fichier_entree, 'r', encoding='utf-8') as f:
-                texte = f.read()
-            
-            if afficher_details:
-                print(f"✓ Fichier lu : {len(texte)} caractères")
-            
-            # Compresser
-            compression = CompressionHuffman(texte)
-            compression.executer(afficher_details=afficher_details)
+            if algorithme not in ("statique", "adaptatif"):
+                raise ValueError(f"Algorithme inconnu : {algorithme}")
+            if echantillon is not None:
+                if not 0 < echantillon <= 1:
+                    raise ValueError("La fraction échantillonnée doit être comprise entre 0 et 1")
+                if modele or algorithme == "adaptatif" or taille_bloc:
+                    raise ValueError("L'estimation par échantillons ne s'applique qu'au mode flux")
+            # Processus de l'analyse des fréquences (hors mode blocs)
+            nb_processus_analyse = nb_processus if analyse_parallele else 1
+            en_memoire = not (modele or algorithme == "adaptatif" or taille_bloc or flux or octets
+                              or projection or echantillon)
             
-            # Sauvegarder
-            GestionFichiers._sauvegarder_compression(
-                fichier_sortie, 
-                compression.texte_encode,
-                compression.racine,
-                compression.codes
-            )
+            if not en_memoire:
+                # Lecture, encodage et écriture entremêlés : une seule étape
+                with MetriquesEtapes.optionnelles(metriques, 'compression'):
+                    GestionFichiers._compresser_en_continu(
+                        fichier_entree, fichier_sortie, afficher_details, canonique,
+                        taille_morceau, octets, backend, taille_bloc, nb_processus,
+                        longueur_max, algorithme, modele, projection, echantillon,
+                        nb_processus_analyse
+                    )
+            else:
+                # Lire le fichier
+                with MetriquesEtapes.optionnelles(metriques, 'lecture'):
+                    with open(fichier_entree, 'r', encoding='utf-8') as f:
+                        texte = f.read()
+                
+                if afficher_details:
+                    print(f"✓ Fichier lu : {len(texte)} caractères")
+                
+                # Compresser
+                compression = CompressionHuffman(
+                    texte, canonique=canonique, empaqueter=True, backend=backend,
+                    longueur_max=longueur_max, metriques=metriques,
+                    nb_processus=nb_processus_analyse
+                )
+                compression.executer(afficher_details=afficher_details)
+                
+                # Sauvegarder
+                with MetriquesEtapes.optionnelles(metriques, 'sauvegarde'):
+                    GestionFichiers._sauvegarder_compression(
+                        fichier_sortie, 
+                        compression.donnees_encodees,
+                        compression.bits_bourrage,
+                        compression.codes,
+                        len(texte),
+                        canonique,
+                        ConteneurHuffman.somme_controle(texte)
+                    )
             
             # Statistiques fichier
             taille_originale = os.path.getsize(fichier_entree)
             taille_compressee = os.path.getsize(fichier_sortie)
+            if metriques is not None:
+                metriques.contexte.update({
+                    'operation': 'compression',
+                    'fichier': fichier_entree,
+                    'taille_entree': taille_originale,
+                    'taille_sortie': taille_compressee
+                })
             
             if afficher_details:
                 Affichage.section("💾 SAUVEGARDE")
@@ -60,7 +174,8 @@ class GestionFichiers:
                 print("-" * 70)
                 print(f"{'Taille fichier original':<30} {taille_originale:,} octets")
                 print(f"{'Taille fichier compressé':<30} {taille_compressee:,} octets")
-                print(f"{'Ratio de compression':<30} {(taille_compressee/taille_originale)*100:.2f}%")
+                if taille_originale:
+                    print(f"{'Ratio de compression':<30} {(taille_compressee/taille_originale)*100:.2f}%")
                 print(f"{'Espace économisé':<30} {taille_originale - taille_compressee:,} octets")
             
             return True
@@ -74,7 +189,12 @@ class GestionFichiers:
     
     @staticmethod
     def decompresser_fichier(fichier_entree: str, fichier_sortie: Optional[str] = None,
-                            afficher_details: bool = True) -> bool:
+                            afficher_details: bool = True, moteur: str = "table",
+                            taille_morceau: int = TAILLE_MORCEAU,
+                            nb_processus: Optional[int] = None,
+                            modele: Optional[str] = None,
+                            metriques: Optional[MetriquesEtapes] = None,
+                            projection: bool = False) -> bool:
         """
         Décompresse un fichier .huff en fichier texte.
         
@@ -82,6 +202,19 @@ class GestionFichiers:
             fichier_entree: Chemin du fichier .huff
             fichier_sortie: Chemin du fichier décompressé (optionnel)
             afficher_details: Afficher les détails
+            moteur: "table" (recherche par tables, décodage en flux)
+                    ou "arbre" (parcours bit par bit, fichier chargé en entier ;
+                    avec un modèle, le moteur "table" est utilisé)
+            taille_morceau: Taille des morceaux lus en mode "table" (en octets)
+            nb_processus: Nombre de processus pour un fichier par blocs
+                          (None : un par cœur)
+            modele: Chemin du modèle partagé, pour un fichier compressé avec un modèle
+            metriques: Mesures par étape à remplir : chargement, décodage et
+                       écriture avec le moteur "arbre", une seule étape
+                       "decompression" en flux avec le moteur "table"
+            projection: Avec le moteur "table", projeter le fichier .huff en
+                        mémoire (mmap) et décoder la charge en place, sans la
+                        recopier
             
         Returns:
             True si succès, False sinon
@@ -98,26 +231,55 @@ class GestionFichiers:
                 Affichage.titre("🔓 DÉCOMPRESSION DE FICHIER")
                 print(f"\n📄 Fichier compressé : {fichier_entree}")
             
-            # Charger les données
-            texte_encode, racine, codes = GestionFichiers._charger_compression(fichier_entree)
+            if moteur not in ("table", "arbre"):
+                raise ValueError(f"Moteur de décodage inconnu : {moteur}")
             
-            if afficher_details:
-                print(f"✓ Données chargées")
-                print(f"  - Bits encodés : {len(texte_encode)}")
-                print(f"  - Codes dans le dictionnaire : {len(codes)}")
+            if moteur == "table" or modele is not None:
+                # Décodage en flux : la charge est lue et décodée morceau par morceau
+                # (toujours avec un modèle, dont le fichier ne stocke pas de table)
+                with MetriquesEtapes.optionnelles(metriques, 'decompression'):
+                    nb_caracteres = GestionFichiers._decompresser_flux(
+                        fichier_entree, fichier_sortie, taille_morceau, afficher_details,
+                        nb_processus, modele, projection
+                    )
             
-            # Décoder
-            from encodeur import Encodeur
-            texte_decode = Encodeur.decoder(texte_encode, racine)
+            else:
+                # Charger les données
+                with MetriquesEtapes.optionnelles(metriques, 'chargement'):
+                    texte_encode, racine, codes, en_tete = GestionFichiers._charger_compression(fichier_entree)
+                
+                if afficher_details:
+                    print(f"✓ Données chargées")
+                    print(f"  - Bits encodés : {len(texte_encode)}")
+                    print(f"  - Codes dans le dictionnaire : {len(codes)}")
+                
+                # Décoder (sans arbre si les codes sont canoniques)
+                with MetriquesEtapes.optionnelles(metriques, 'decodage'):
+                    if racine is None:
+                        texte_decode = Encodeur.decoder_canonique(texte_encode, GenerateurCodes.longueurs(codes))
+                    else:
+                        texte_decode = Encodeur.decoder(texte_encode, racine)
+                    # CRC32 et nombre de caractères, vérifiés avant d'écrire
+                    texte_decode = "".join(GestionFichiers._controler([texte_decode], en_tete))
+                
+                # Sauvegarder
+                with MetriquesEtapes.optionnelles(metriques, 'ecriture'):
+                    with open(fichier_sortie, 'w', encoding='utf-8') as f:
+                        f.write(texte_decode)
+                nb_caracteres = len(texte_decode)
             
-            # Sauvegarder
-            with open(fichier_sortie, 'w', encoding='utf-8') as f:
-                f.write(texte_decode)
+            if metriques is not None:
+                metriques.contexte.update({
+                    'operation': 'decompression',
+                    'fichier': fichier_entree,
+                    'taille_entree': os.path.getsize(fichier_entree),
+                    'taille_sortie': os.path.getsize(fichier_sortie)
+                })
             
             if afficher_details:
                 Affichage.section("💾 DÉCOMPRESSION RÉUSSIE")
                 print(f"\n✓ Fichier décompressé sauvegardé : {fichier_sortie}")
-                print(f"  Caractères restaurés : {len(texte_decode)}")
+                print(f"  Caractères restaurés : {nb_caracteres}")
             
             return True
             
@@ -129,37 +291,712 @@ class GestionFichiers:
             return False
     
     @staticmethod
-    def _sauvegarder_compression(fichier: str, texte_encode: str, racine, codes: dict):
-        """Sauvegarde les données de compression dans un fichier"""
-        donnees = {
-            'texte_encode': texte_encode,
-            'racine': racine,
-            'codes': codes,
-            'version': '1.0'
-        }
+    def _compresser_en_continu(fichier_entree: str, fichier_sortie: str, afficher_details: bool,
+                               canonique: bool, taille_morceau: int, octets: bool, backend: str,
+                               taille_bloc: Optional[int], nb_processus: Optional[int],
+                               longueur_max: Optional[int], algorithme: str,
+                               modele: Optional[str], projection: bool = False,
+                               echantillon: Optional[float] = None,
+                               nb_processus_analyse: Optional[int] = 1):
+        """Aiguille vers le mode qui lit le fichier au fil de l'eau"""
+        if modele:
+            GestionFichiers._compresser_avec_modele(
+                fichier_entree, fichier_sortie, modele, afficher_details
+            )
+        elif algorithme == "adaptatif":
+            if taille_bloc:
+                raise ValueError("Le mode adaptatif ne se découpe pas en blocs")
+            GestionFichiers._compresser_fichier_adaptatif(
+                fichier_entree, fichier_sortie, octets, taille_morceau, afficher_details
+            )
+        elif taille_bloc:
+            GestionFichiers._compresser_blocs(
+                fichier_entree, fichier_sortie, canonique, taille_bloc, nb_processus,
+                afficher_details, octets, backend, longueur_max, projection
+            )
+        else:
+            GestionFichiers._compresser_flux(
+                fichier_entree, fichier_sortie, canonique, taille_morceau, afficher_details,
+                octets, backend, longueur_max, projection, nb_processus_analyse, echantillon
+            )
+    
+    @staticmethod
+    def _compresser_flux(fichier_entree: str, fichier_sortie: str, canonique: bool,
+                         taille_morceau: int, afficher_details: bool, octets: bool = False,
+                         backend: str = "python", longueur_max: Optional[int] = None,
+                         projection: bool = False, nb_processus: Optional[int] = 1,
+                         echantillon: Optional[float] = None):
+        """
+        Compression en deux passes, sans jamais charger tout le fichier :
+        1. comptage des fréquences morceau par morceau
+        2. encodage de chaque morceau, écrit dans le fichier au fur et à mesure
         
-        with open(fichier, 'wb') as f:
-            pickle.dump(donnees, f)
+        En mode octets, les fréquences et les codes sont des tableaux de
+        256 entrées indexés par la valeur de l'octet. Avec la projection,
+        les deux passes lisent le fichier projeté en mémoire. Avec plusieurs
+        processus, la passe 1 d'un grand fichier est répartie par plages
+        d'octets (AnalyseurParallele).
+        
+        Avec echantillon, la passe 1 ne lit qu'une fraction du fichier et
+        le nombre de caractères de l'en-tête est corrigé après la passe 2.
+        Si un caractère non ASCII manquait aux échantillons, la compression
+        recommence avec une passe 1 complète.
+        """
+        lire = GestionFichiers._lecteur(octets, projection)
+        numpy = backend == "numpy" and BackendNumpy.disponible()
+        
+        # Passe 1 : fréquences
+        parallele = (nb_processus != 1
+                     and os.path.getsize(fichier_entree) >= AnalyseurParallele.TAILLE_MIN)
+        if echantillon:
+            frequences = AnalyseurFrequences.estimer_frequences(
+                GestionFichiers._lire_echantillons(fichier_entree, echantillon, octets),
+                octets, 1 / echantillon
+            )
+        elif parallele:
+            frequences = AnalyseurParallele.calculer_frequences_fichier(
+                fichier_entree, octets, nb_processus, backend
+            )
+            if octets:
+                frequences = {octet: freq for octet, freq in enumerate(frequences) if freq}
+        elif octets:
+            compter = (BackendNumpy.calculer_frequences_octets if numpy
+                       else AnalyseurFrequences.calculer_frequences_octets)
+            tableau_frequences = compter(lire(fichier_entree, taille_morceau))
+            frequences = {octet: freq for octet, freq in enumerate(tableau_frequences) if freq}
+        elif numpy:
+            frequences = AnalyseurFrequences.calculer_frequences_flux(
+                BackendNumpy.calculer_frequences(morceau)
+                for morceau in lire(fichier_entree, taille_morceau)
+            )
+        else:
+            frequences = AnalyseurFrequences.calculer_frequences_flux(
+                lire(fichier_entree, taille_morceau)
+            )
+        nb_caracteres = sum(frequences.values())
+        
+        if afficher_details:
+            unite = "octets" if octets else "caractères"
+            if echantillon:
+                print(f"✓ Passe 1 : fréquences estimées sur {echantillon:.1%} du fichier")
+            else:
+                print(f"✓ Passe 1 : {nb_caracteres} {unite} analysés")
+        
+        codes = {}
+        if frequences:
+            if longueur_max:
+                racine = ConstructeurArbre.construire_limite(frequences, longueur_max)
+            else:
+                racine = ConstructeurArbre.construire(frequences)
+            codes = GenerateurCodes.generer(racine)
+            if canonique:
+                codes = GenerateurCodes.generer_canonique(GenerateurCodes.longueurs(codes))
+            
+            if afficher_details:
+                Affichage.frequences(frequences)
+                Affichage.codes(codes, frequences)
+        
+        # Passe 2 : encodage et écriture au fil de l'eau (avec le CRC32 du texte)
+        drapeaux = CompressionParBlocs.drapeaux(canonique, octets)
+        table = GenerateurCodes.en_tableau(codes) if octets else codes
+        ecrivain = EcrivainBits()
+        taille_charge = 0
+        controle = 0
+        nb_lus = 0
+        
+        try:
+            with open(fichier_sortie, 'wb') as sortie:
+                position = ConteneurHuffman.ecrire_en_tete(sortie, codes, nb_caracteres, drapeaux)
+                
+                for morceau in lire(fichier_entree, taille_morceau):
+                    if numpy:
+                        octets_encodes = BackendNumpy.encoder(morceau, codes, ecrivain)
+                    else:
+                        octets_encodes = ecrivain.ecrire_texte(morceau, table)
+                    sortie.write(octets_encodes)
+                    taille_charge += len(octets_encodes)
+                    controle = ConteneurHuffman.somme_controle(morceau, controle)
+                    nb_lus += len(morceau)
+                
+                dernier, bourrage = ecrivain.terminer()
+                sortie.write(dernier)
+                taille_charge += len(dernier)
+                
+                nb_bits_dernier = 8 - bourrage if taille_charge else 0
+                ConteneurHuffman.terminer_charge(
+                    sortie, position, taille_charge, nb_bits_dernier, controle,
+                    nb_lus if echantillon else None
+                )
+        except KeyError:
+            if not echantillon:
+                raise
+            # Caractère absent des échantillons : fréquences exactes
+            if afficher_details:
+                print("⚠ Caractère absent des échantillons : passe 1 complète")
+            GestionFichiers._compresser_flux(
+                fichier_entree, fichier_sortie, canonique, taille_morceau, afficher_details,
+                octets, backend, longueur_max, projection, nb_processus
+            )
+            return
+        nb_caracteres = nb_lus
+        
+        if afficher_details:
+            print(f"✓ Passe 2 : {taille_charge} octets encodés")
+            Affichage.statistiques(
+                Statistiques.calculer_depuis_tailles(nb_caracteres * 8, ecrivain.nb_bits)
+            )
     
     @staticmethod
-    def _charger_compression(fichier: str) -> Tuple[str, any, dict]:
-        """Charge les données de compression depuis un fichier"""
-        with open(fichier, 'rb') as f:
-            donnees = pickle.load(f)
+    def _compresser_blocs(fichier_entree: str, fichier_sortie: str, canonique: bool,
+                          taille_bloc: int, nb_processus: Optional[int], afficher_details: bool,
+                          octets: bool = False, backend: str = "python",
+                          longueur_max: Optional[int] = None, projection: bool = False):
+        """
+        Compression par blocs : les blocs sont lus au fur et à mesure,
+        compressés en parallèle puis écrits dans l'ordre, et l'index des
+        blocs (position, taille, nombre de caractères) est ajouté à la fin,
+        suivi du CRC32 de tout le texte (chaque bloc porte aussi le sien).
+        """
+        lire = GestionFichiers._lecteur(octets, projection)
+        drapeaux = CompressionParBlocs.drapeaux(canonique, octets)
+        index = []
+        controle = 0
+        
+        def lire_blocs():
+            # CRC32 de tout le texte, calculé pendant la lecture des blocs
+            nonlocal controle
+            for bloc in lire(fichier_entree, taille_bloc):
+                controle = ConteneurHuffman.somme_controle(bloc, controle)
+                # Une tranche de projection ne peut pas être envoyée à un autre processus
+                yield bloc.tobytes() if isinstance(bloc, memoryview) else bloc
+        
+        with open(fichier_sortie, 'wb') as sortie:
+            ConteneurHuffman.ecrire_en_tete_blocs(sortie, drapeaux)
+            
+            blocs = CompressionParBlocs.compresser(
+                lire_blocs(), canonique, octets, nb_processus, backend, longueur_max
+            )
+            for bloc, nb_caracteres in blocs:
+                index.append((sortie.tell(), len(bloc), nb_caracteres))
+                sortie.write(bloc)
+            
+            ConteneurHuffman.terminer_blocs(sortie, index, drapeaux, controle)
         
-        return donnees['texte_encode'], donnees['racine'], donnees['codes']
+        if afficher_details:
+            unite = "octets" if octets else "caractères"
+            print(f"✓ {len(index)} blocs de {taille_bloc} {unite} compressés")
+            print(f"  - {unite.capitalize()} analysés : {sum(entree[2] for entree in index)}")
     
     @staticmethod
-    def comparer_fichiers(fichier_original: str, fichier_decompresse: str) -> bool:
-        """Compare deux fichiers pour vérifier l'intégrité"""
+    def _decompresser_flux(fichier_entree: str, fichier_sortie: Optional[str], taille_morceau: int,
+                           afficher_details: bool, nb_processus: Optional[int] = None,
+                           modele: Optional[str] = None, projection: bool = False) -> int:
+        """
+        Décompression en flux : la charge est lue par morceaux, décodée, et
+        le texte est écrit au fur et à mesure (mémoire constante).
+        Un fichier par blocs est décodé bloc par bloc, en parallèle.
+        Avec la projection, le conteneur est projeté en mémoire et la charge
+        est lue à travers une vue (memoryview) au lieu de read().
+        Le CRC32 et le nombre de caractères sont vérifiés au fil de l'eau ;
+        sans fichier de sortie (None), le texte décodé n'est écrit nulle part.
+        
+        Returns:
+            Nombre de caractères restaurés
+        
+        Raises:
+            ValueError: si le texte décodé ne correspond pas au fichier
+        """
+        nb_caracteres = 0
+        
+        projeter = GestionFichiers._projeter(fichier_entree) if projection else nullcontext()
+        
+        with open(fichier_entree, 'rb') as entree, projeter as vue:
+            en_tete = ConteneurHuffman.lire_en_tete(entree)
+            octets = bool(en_tete['drapeaux'] & ConteneurHuffman.OCTETS)
+            
+            if 'modele' in en_tete:
+                if modele is None:
+                    raise ValueError(f"Ce fichier nécessite le modèle {en_tete['modele']:016x}")
+                modele_huffman = ModeleHuffman.charger(modele)
+                modele_huffman.verifier(en_tete)
+                
+                if afficher_details:
+                    print(f"✓ En-tête chargé (modèle {modele_huffman.identifiant:016x})")
+                
+                charge = b"".join(GestionFichiers._lire_charge(entree, en_tete['taille_charge'], taille_morceau, vue))
+                textes = [modele_huffman.decoder(charge, en_tete['nb_bits_dernier'], en_tete['echappes'])]
+            elif en_tete['drapeaux'] & ConteneurHuffman.ADAPTATIF:
+                if afficher_details:
+                    print(f"✓ En-tête chargé (Huffman adaptatif)")
+                
+                textes = GestionFichiers._decoder_adaptatif(entree, octets, taille_morceau, vue)
+            elif 'blocs' in en_tete:
+                if afficher_details:
+                    print(f"✓ En-tête chargé")
+                    print(f"  - Blocs : {len(en_tete['blocs'])}")
+                
+                textes = CompressionParBlocs.decompresser(
+                    GestionFichiers._lire_blocs(entree, en_tete['blocs'], vue),
+                    en_tete['drapeaux'],
+                    nb_processus
+                )
+            else:
+                codes = en_tete['codes']
+                
+                if afficher_details:
+                    print(f"✓ En-tête chargé")
+                    print(f"  - Octets encodés : {en_tete['taille_charge']}")
+                    print(f"  - Codes dans le dictionnaire : {len(codes)}")
+                
+                decodeur = DecodeurTable(codes, octets=octets)
+                if vue is not None:
+                    # Décodage en place dans la projection, sans copie de la charge
+                    charge = GestionFichiers._tranche(vue, entree.tell(), en_tete['taille_charge'])
+                    textes = decodeur.decoder_vue(charge, en_tete['nb_bits_dernier'], taille_morceau)
+                else:
+                    morceaux = GestionFichiers._lire_charge(entree, en_tete['taille_charge'], taille_morceau)
+                    textes = decodeur.decoder_flux(morceaux, en_tete['nb_bits_dernier'])
+            
+            textes = GestionFichiers._controler(textes, en_tete)
+            if fichier_sortie is None:
+                # Vérification seule : le texte décodé n'est écrit nulle part
+                for texte in textes:
+                    nb_caracteres += len(texte)
+                return nb_caracteres
+            
+            if octets:
+                sortie = open(fichier_sortie, 'wb')
+            else:
+                sortie = open(fichier_sortie, 'w', encoding='utf-8')
+            
+            try:
+                with sortie:
+                    for texte in textes:
+                        sortie.write(texte)
+                        nb_caracteres += len(texte)
+            except Exception:
+                # Ne pas laisser un fichier décompressé faux ou incomplet
+                os.remove(fichier_sortie)
+                raise
+        
+        return nb_caracteres
+    
+    @staticmethod
+    def verifier_fichier(fichier_entree: str, afficher_details: bool = True,
+                         taille_morceau: int = TAILLE_MORCEAU,
+                         nb_processus: Optional[int] = None,
+                         modele: Optional[str] = None,
+                         metriques: Optional[MetriquesEtapes] = None,
+                         projection: bool = False) -> bool:
+        """
+        Vérifie un fichier .huff sans rien écrire : le fichier est décodé
+        morceau par morceau (mémoire constante, aucun espace disque) et le
+        texte décodé est comparé au CRC32 et au nombre de caractères stockés.
+        
+        Un fichier sans CRC32 (ancien format, adaptatif ou avec un modèle)
+        est seulement décodé entièrement et son nombre de caractères contrôlé.
+        
+        Args:
+            fichier_entree: Chemin du fichier .huff
+            afficher_details: Afficher le résultat
+            taille_morceau: Taille des morceaux lus (en octets)
+            nb_processus: Nombre de processus pour un fichier par blocs
+            modele: Chemin du modèle partagé, pour un fichier compressé avec un modèle
+            metriques: Mesures à remplir (une étape "verification")
+            projection: Projeter le fichier .huff en mémoire (mmap) au lieu de le lire
+            
+        Returns:
+            True si le fichier est intact, False sinon
+        """
         try:
-            with open(fichier_original, 'r', encoding='utf-8') as f1:
-                contenu1 = f1.read()
+            with MetriquesEtapes.optionnelles(metriques, 'verification'):
+                nb_caracteres = GestionFichiers._decompresser_flux(
+                    fichier_entree, None, taille_morceau, afficher_details, nb_processus, modele,
+                    projection
+                )
+            if afficher_details:
+                print(f"✓ {fichier_entree} intact ({nb_caracteres} caractères vérifiés)")
+            return True
+        
+        except FileNotFoundError:
+            print(f"❌ Erreur : Fichier '{fichier_entree}' introuvable !")
+            return False
+        except Exception as e:
+            print(f"❌ Erreur lors de la vérification : {e}")
+            return False
+    
+    @staticmethod
+    def _controler(textes: Iterator, en_tete: dict) -> Iterator:
+        """
+        Laisse passer les textes décodés en calculant leur CRC32 et leur
+        nombre de caractères, comparés à l'en-tête une fois le dernier rendu.
+        """
+        attendu = en_tete.get('controle')
+        controle = 0
+        nb_caracteres = 0
+        for texte in textes:
+            if attendu is not None:
+                controle = ConteneurHuffman.somme_controle(texte, controle)
+            nb_caracteres += len(texte)
+            yield texte
+        
+        if attendu is not None and controle != attendu:
+            raise ValueError("Fichier corrompu : somme de contrôle incorrecte")
+        # Un flux adaptatif écrit dans un tube n'indique pas son nombre de caractères
+        inconnu = en_tete['drapeaux'] & ConteneurHuffman.ADAPTATIF and not en_tete['nb_caracteres']
+        if not inconnu and nb_caracteres != en_tete['nb_caracteres']:
+            raise ValueError("Fichier corrompu : nombre de caractères incorrect")
+    
+    @staticmethod
+    def compresser_adaptatif(entree, sortie: BinaryIO, octets: bool = False,
+                             taille_morceau: int = TAILLE_MORCEAU) -> int:
+        """
+        Compression adaptative d'un flux lu une seule fois (fichier, tube,
+        socket) : chaque morceau reçu est encodé et écrit aussitôt.
+        
+        Args:
+            entree: Flux texte, ou flux binaire en mode octets (ex. sys.stdin.buffer)
+            sortie: Flux binaire de sortie
+            octets: Compresser les octets bruts au lieu des caractères
+            taille_morceau: Taille maximale d'un morceau lu
+            
+        Returns:
+            Nombre de caractères (ou d'octets) compressés
+        """
+        # Ne pas attendre un morceau complet : ce qui est disponible est encodé
+        if octets:
+            lire = getattr(entree, 'read1', entree.read)
+            morceaux = iter(lambda: lire(taille_morceau), b"")
+        else:
+            morceaux = GestionFichiers._lire_texte_disponible(entree, taille_morceau)
+        drapeaux = ConteneurHuffman.OCTETS if octets else 0
+        codec = HuffmanAdaptatif(octets)
+        
+        ConteneurHuffman.ecrire_en_tete_adaptatif(sortie, drapeaux)
+        for morceau in morceaux:
+            sortie.write(codec.encoder(morceau))
+            sortie.flush()
+        sortie.write(codec.terminer()[0])
+        sortie.flush()
+        return codec.nb_symboles
+    
+    @staticmethod
+    def _lire_texte_disponible(entree, taille_morceau: int) -> Iterator[str]:
+        """
+        Lit un flux texte par morceaux d'au plus taille_morceau octets, sans
+        attendre de fin de ligne ni de morceau complet : les octets déjà
+        disponibles dans le flux binaire sous-jacent sont décodés aussitôt
+        (fins de ligne converties comme en mode texte).
+        """
+        tampon = getattr(entree, 'buffer', None)
+        if tampon is None:
+            # Flux sans flux binaire sous-jacent (ex. io.StringIO)
+            yield from iter(lambda: entree.read(taille_morceau), "")
+            return
+        
+        decodeur = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(getattr(entree, 'encoding', None) or 'utf-8')(),
+            translate=True
+        )
+        lire = getattr(tampon, 'read1', tampon.read)
+        for donnees in iter(lambda: lire(taille_morceau), b""):
+            morceau = decodeur.decode(donnees)
+            if morceau:
+                yield morceau
+        morceau = decodeur.decode(b"", final=True)
+        if morceau:
+            yield morceau
+    
+    @staticmethod
+    def decompresser_adaptatif(entree: BinaryIO, sortie,
+                               taille_morceau: int = TAILLE_MORCEAU) -> int:
+        """
+        Décompression d'un flux adaptatif au fil de l'eau : le texte de
+        chaque morceau reçu est écrit aussitôt.
+        
+        Args:
+            entree: Flux binaire positionné au début du conteneur
+            sortie: Flux texte, ou flux binaire si le flux est en mode octets
+            taille_morceau: Taille maximale d'un morceau lu
             
-            with open(fichier_decompresse, 'r', encoding='utf-8') as f2:
-                contenu2 = f2.read()
+        Returns:
+            Nombre de caractères (ou d'octets) restaurés
+        """
+        en_tete = ConteneurHuffman.lire_en_tete(entree)
+        if not en_tete['drapeaux'] & ConteneurHuffman.ADAPTATIF:
+            raise ValueError("Ce flux n'est pas un flux Huffman adaptatif")
+        
+        octets = bool(en_tete['drapeaux'] & ConteneurHuffman.OCTETS)
+        nb_caracteres = 0
+        for texte in GestionFichiers._decoder_adaptatif(entree, octets, taille_morceau):
+            sortie.write(texte)
+            sortie.flush()
+            nb_caracteres += len(texte)
+        return nb_caracteres
+    
+    @staticmethod
+    def _compresser_avec_modele(fichier_entree: str, fichier_sortie: str, modele: str,
+                                afficher_details: bool):
+        """Compression avec un modèle partagé : aucune analyse ni table stockée"""
+        modele_huffman = ModeleHuffman.charger(modele)
+        if modele_huffman.octets:
+            with open(fichier_entree, 'rb') as f:
+                texte = f.read()
+        else:
+            with open(fichier_entree, 'r', encoding='utf-8') as f:
+                texte = f.read()
+        
+        with open(fichier_sortie, 'wb') as sortie:
+            sortie.write(modele_huffman.compresser(texte))
+        
+        if afficher_details:
+            print(f"✓ Modèle {modele_huffman.identifiant:016x} : {len(texte)} symboles encodés")
+    
+    @staticmethod
+    def _compresser_fichier_adaptatif(fichier_entree: str, fichier_sortie: str, octets: bool,
+                                      taille_morceau: int, afficher_details: bool):
+        """
+        Compression adaptative d'un fichier. Le fichier de sortie pouvant
+        être relu, le nombre de caractères est complété dans l'en-tête.
+        """
+        if octets:
+            entree = open(fichier_entree, 'rb')
+        else:
+            entree = open(fichier_entree, 'r', encoding='utf-8')
+        
+        with entree, open(fichier_sortie, 'wb') as sortie:
+            nb_caracteres = GestionFichiers.compresser_adaptatif(
+                entree, sortie, octets, taille_morceau
+            )
+            sortie.seek(0)
+            drapeaux = ConteneurHuffman.OCTETS if octets else 0
+            ConteneurHuffman.ecrire_en_tete_adaptatif(sortie, drapeaux, nb_caracteres)
+        
+        if afficher_details:
+            unite = "octets" if octets else "caractères"
+            print(f"✓ Huffman adaptatif : {nb_caracteres} {unite} encodés en une passe")
+    
+    @staticmethod
+    def _decoder_adaptatif(entree: BinaryIO, octets: bool, taille_morceau: int,
+                           vue: Optional[memoryview] = None) -> Iterator:
+        """Décode le flux adaptatif qui suit l'en-tête, morceau par morceau"""
+        codec = HuffmanAdaptatif(octets)
+        if vue is not None:
+            debut = entree.tell()
+            return codec.decoder_flux(
+                vue[position:position + taille_morceau]
+                for position in range(debut, len(vue), taille_morceau)
+            )
+        lire = getattr(entree, 'read1', entree.read)
+        return codec.decoder_flux(iter(lambda: lire(taille_morceau), b""))
+    
+    @staticmethod
+    def _lire_blocs(flux, blocs: list, vue: Optional[memoryview] = None) -> Iterator[bytes]:
+        """
+        Lit les blocs encodés d'un fichier par blocs, dans l'ordre de l'index
+        (copiés depuis la projection si vue est donnée : ils sont envoyés à
+        d'autres processus)
+        """
+        for position, taille, _ in blocs:
+            if vue is not None:
+                yield GestionFichiers._tranche(vue, position, taille).tobytes()
+                continue
+            flux.seek(position)
+            bloc = flux.read(taille)
+            if len(bloc) != taille:
+                raise ValueError("Fichier .huff tronqué ou corrompu")
+            yield bloc
+    
+    @staticmethod
+    def _lire_charge(flux, taille_charge: int, taille_morceau: int,
+                     vue: Optional[memoryview] = None) -> Iterator[bytes]:
+        """
+        Lit les octets encodés d'un conteneur morceau par morceau, à partir
+        de la position courante du flux (tranches de la projection si vue
+        est donnée)
+        """
+        if vue is not None:
+            charge = GestionFichiers._tranche(vue, flux.tell(), taille_charge)
+            for debut in range(0, taille_charge, taille_morceau):
+                yield charge[debut:debut + taille_morceau]
+            return
+        
+        restant = taille_charge
+        while restant > 0:
+            morceau = flux.read(min(taille_morceau, restant))
+            if not morceau:
+                raise ValueError("Fichier .huff tronqué ou corrompu")
+            restant -= len(morceau)
+            yield morceau
+    
+    @staticmethod
+    def _lire_morceaux(fichier: str, taille_morceau: int) -> Iterator[str]:
+        """Lit un fichier texte UTF-8 morceau par morceau"""
+        with open(fichier, 'r', encoding='utf-8') as f:
+            while True:
+                morceau = f.read(taille_morceau)
+                if not morceau:
+                    break
+                yield morceau
+    
+    @staticmethod
+    def _lire_morceaux_octets(fichier: str, taille_morceau: int) -> Iterator[bytes]:
+        """Lit un fichier binaire morceau par morceau"""
+        with open(fichier, 'rb') as f:
+            while True:
+                morceau = f.read(taille_morceau)
+                if not morceau:
+                    break
+                yield morceau
+    
+    @staticmethod
+    def _lire_echantillons(fichier: str, fraction: float, octets: bool = False) -> Iterator:
+        """
+        Lit NB_ECHANTILLONS morceaux régulièrement espacés couvrant environ
+        `fraction` du fichier. En mode texte, les caractères coupés aux bords
+        d'un morceau sont ignorés et les fins de ligne converties comme à la
+        lecture en mode texte.
+        """
+        taille = os.path.getsize(fichier)
+        nb_echantillons = GestionFichiers.NB_ECHANTILLONS
+        taille_echantillon = max(1, round(taille * fraction / nb_echantillons))
+        
+        with open(fichier, 'rb') as f:
+            for i in range(nb_echantillons):
+                f.seek(taille * i // nb_echantillons)
+                donnees = f.read(taille_echantillon)
+                if not donnees:
+                    continue
+                if octets:
+                    yield donnees
+                else:
+                    texte = donnees.decode('utf-8', errors='ignore')
+                    yield texte.replace('\r\n', '\n').replace('\r', '\n')
+    
+    @staticmethod
+    def _lecteur(octets: bool, projection: bool = False) -> Callable:
+        """Fonction de lecture par morceaux (fichier, taille_morceau) du fichier d'entrée"""
+        if projection:
+            return lambda fichier, taille_morceau: GestionFichiers._lire_projection(
+                fichier, taille_morceau, octets
+            )
+        return GestionFichiers._lire_morceaux_octets if octets else GestionFichiers._lire_morceaux
+    
+    @staticmethod
+    def _lire_projection(fichier: str, taille_morceau: int, octets: bool = False) -> Iterator:
+        """
+        Lit un fichier projeté en mémoire par morceaux de taille_morceau octets.
+        
+        En mode octets, chaque morceau est une tranche de la projection
+        (memoryview, sans copie). Sinon les tranches sont décodées en UTF-8
+        au fil de l'eau, avec les fins de ligne converties comme le fait
+        open() en mode texte.
+        """
+        with GestionFichiers._projeter(fichier) as vue:
+            if octets:
+                for debut in range(0, len(vue), taille_morceau):
+                    yield vue[debut:debut + taille_morceau]
+                return
             
-            return contenu1 == contenu2
+            decodeur = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')(), translate=True
+            )
+            for debut in range(0, len(vue), taille_morceau):
+                morceau = decodeur.decode(vue[debut:debut + taille_morceau])
+                if morceau:
+                    yield morceau
+            morceau = decodeur.decode(b"", final=True)
+            if morceau:
+                yield morceau
+    
+    @staticmethod
+    @contextmanager
+    def _projeter(fichier: str) -> Iterator[memoryview]:
+        """
+        Projette un fichier en mémoire (mmap, lecture seule) et donne une vue
+        sur tout son contenu : les pages sont chargées par le noyau à la
+        demande, sans passer par un tampon de lecture Python.
+        
+        Les tranches de la vue encore référencées à la sortie gardent la
+        projection ouverte jusqu'à ce qu'elles soient libérées.
+        """
+        with open(fichier, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuse les fichiers vides
+                yield memoryview(b"")
+                return
+            projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if hasattr(projection, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            projection.madvise(mmap.MADV_SEQUENTIAL)
+        vue = memoryview(projection)
+        try:
+            yield vue
+        finally:
+            vue.release()
+            try:
+                projection.close()
+            except BufferError:
+                pass
+    
+    @staticmethod
+    def _tranche(vue: memoryview, position: int, taille: int) -> memoryview:
+        """Tranche d'un fichier projeté, sans copie"""
+        tranche = vue[position:position + taille]
+        if len(tranche) != taille:
+            raise ValueError("Fichier .huff tronqué ou corrompu")
+        return tranche
+    
+    @staticmethod
+    def _sauvegarder_compression(fichier: str, charge: bytes, bits_bourrage: int, codes: dict,
+                                 nb_caracteres: int, canonique: bool = False,
+                                 controle: Optional[int] = None):
+        """
+        Sauvegarde les données de compression dans un conteneur binaire .huff
+        (controle : CRC32 du texte original, vérifié à la décompression)
+        """
+        nb_bits_dernier = 8 - bits_bourrage if charge else 0
+        drapeaux = ConteneurHuffman.CANONIQUE if canonique else 0
+        
+        with open(fichier, 'wb') as f:
+            ConteneurHuffman.ecrire(f, codes, charge, nb_bits_dernier, nb_caracteres, drapeaux, controle)
+    
+    @staticmethod
+    def _charger_compression(fichier: str) -> Tuple[str, any, dict, dict]:
+        """
+        Charge les données de compression depuis un conteneur binaire .huff.
+        La racine vaut None pour des codes canoniques (décodage sans arbre).
+        
+        Returns:
+            (texte encodé, racine, codes, en-tête : nb_caracteres, drapeaux
+             et controle s'il est présent)
+        """
+        with open(fichier, 'rb') as f:
+            donnees = ConteneurHuffman.lire(f)
+        
+        if donnees['drapeaux'] & ConteneurHuffman.OCTETS:
+            raise ValueError("Fichier en mode octets : utiliser le moteur 'table'")
+        
+        codes = donnees['codes']
+        texte_encode = Encodeur.depaqueter(donnees.pop('charge'), donnees['nb_bits_dernier'])
+        if donnees['drapeaux'] & ConteneurHuffman.CANONIQUE:
+            return texte_encode, None, codes, donnees
+        racine = ConstructeurArbre.depuis_codes(codes)
+        return texte_encode, racine, codes, donnees
+    
+    @staticmethod
+    def comparer_fichiers(fichier_original: str, fichier_decompresse: str,
+                          taille_morceau: int = TAILLE_MORCEAU) -> bool:
+        """Compare deux fichiers pour vérifier l'intégrité (morceau par morceau)"""
+        try:
+            with open(fichier_original, 'r', encoding='utf-8') as f1, \
+                    open(fichier_decompresse, 'r', encoding='utf-8') as f2:
+                while True:
+                    morceau = f1.read(taille_morceau)
+                    if morceau != f2.read(taille_morceau):
+                        return False
+                    if not morceau:
+                        return True
             
         except Exception as e:
             print(f"❌ Erreur lors de la comparaison : {e}")
@@ -170,6 +1007,10 @@ class GestionFichiers:
         """
         Test complet : compression + décompression + vérification
         C'est la fonction principale pour "Tester sur un fichier"
+        
+        La décompression est vérifiée sans écrire de copie du fichier : le
+        texte décodé est comparé au CRC32 stocké, lui-même comparé au CRC32
+        du fichier original (mémoire constante, aucun espace disque).
         """
         Affichage.titre("🧪 TEST COMPLET SUR FICHIER")
         print(f"\n📝 Fichier de test : {fichier}")
@@ -194,17 +1035,12 @@ class GestionFichiers:
         if not succes:
             return False
         
-        # 2. Décompression
+        # 2. Décompression (décodage vérifié, sans écriture)
         print("\n" + "="*70)
         print("ÉTAPE 2 : DÉCOMPRESSION".center(70))
         print("="*70)
         
-        fichier_decompresse = fichier + ".decompresse.txt"
-        succes = GestionFichiers.decompresser_fichier(
-            fichier_compresse,
-            fichier_decompresse,
-            afficher_details=True
-        )
+        succes = GestionFichiers.verifier_fichier(fichier_compresse, afficher_details=True)
         
         if not succes:
             return False
@@ -214,22 +1050,33 @@ class GestionFichiers:
         print("ÉTAPE 3 : VÉRIFICATION".center(70))
         print("="*70)
         
-        identique = GestionFichiers.comparer_fichiers(fichier, fichier_decompresse)
+        with open(fichier_compresse, 'rb') as f:
+            controle = ConteneurHuffman.lire_en_tete(f)['controle']
+        identique = GestionFichiers._somme_controle_fichier(fichier) == controle
         
         if identique:
             print("\n✅ SUCCÈS TOTAL !")
             print("   ✓ Compression réussie")
             print("   ✓ Décompression réussie")
-            print("   ✓ Fichier original et décompressé sont identiques")
-            print(f"\n📊 Fichiers créés :")
+            print(f"   ✓ Texte décompressé identique à l'original (CRC32 {controle:08x})")
+            print(f"\n📊 Fichier créé :")
             print(f"   - Compressé   : {fichier_compresse}")
-            print(f"   - Décompressé : {fichier_decompresse}")
         else:
             print("\n❌ ERREUR : Les fichiers sont différents !")
             return False
         
         return True
     
+    @staticmethod
+    def _somme_controle_fichier(fichier: str, octets: bool = False,
+                                taille_morceau: int = TAILLE_MORCEAU) -> int:
+        """CRC32 du contenu d'un fichier, lu morceau par morceau"""
+        lire = GestionFichiers._lire_morceaux_octets if octets else GestionFichiers._lire_morceaux
+        controle = 0
+        for morceau in lire(fichier, taille_morceau):
+            controle = ConteneurHuffman.somme_controle(morceau, controle)
+        return controle
+    
     @staticmethod
     def lister_fichiers_texte(dossier: str = ".") -> list:
         """Liste tous les fichiers .txt dans un dossier"""
@@ -1,7 +1,16 @@
+from typing import Optional
 from analyseur import AnalyseurFrequences
+from analyseur_parallele import AnalyseurParallele
 from constructeur_arbre import ConstructeurArbre
 from generateur_codes import GenerateurCodes
 from encodeur import Encodeur
+from decodeur import DecodeurTable
+from adaptatif import HuffmanAdaptatif
+from modele import ModeleHuffman
+from cache import CacheHuffman
+from metriques import MetriquesEtapes
+from ecrivain_bits import EcrivainBits
+from backend_numpy import BackendNumpy
 from statistiques import Statistiques
 from visualiseur import Visualiseur
 from affichage import Affichage
@@ -9,52 +18,289 @@ from affichage import Affichage
 class CompressionHuffman:
     """Classe principale pour la compression Huffman"""
     
-    def __init__(self, texte: str):
+    def __init__(self, texte: str, canonique: bool = False, empaqueter: bool = False,
+                 backend: str = "python", longueur_max: Optional[int] = None,
+                 constructeur: str = "tas", algorithme: str = "statique",
+                 modele: Optional[ModeleHuffman] = None,
+                 cache: Optional[CacheHuffman] = None,
+                 metriques: Optional[MetriquesEtapes] = None,
+                 nb_processus: Optional[int] = 1):
+        """
+        Args:
+            texte: Le texte à compresser
+            canonique: Utiliser des codes canoniques
+            empaqueter: Encoder directement en octets (donnees_encodees)
+                        au lieu d'une chaîne de 0 et 1 (texte_encode)
+            backend: "python" ou "numpy" (fréquences et encodage vectorisés,
+                     remplacé par "python" si NumPy n'est pas installé)
+            longueur_max: Longueur maximale des codes en bits (None : pas de limite)
+            constructeur: "tas" (nœuds chaînés, historique de construction)
+                          ou "lineaire" (deux files, arbre en tableaux)
+            algorithme: "statique" (table calculée sur tout le texte) ou
+                        "adaptatif" (arbre mis à jour à chaque symbole, une
+                        seule passe et aucune table stockée)
+            modele: Modèle partagé dont les codes sont utilisés tels quels
+                    (ni analyse des fréquences, ni construction de l'arbre)
+            cache: Cache partagé des arbres, codes et tables de décodage,
+                   indexé par la table des fréquences
+            metriques: Mesures par étape (analyse, construction, codes,
+                       encodage, statistiques) remplies par executer
+            nb_processus: Nombre de processus pour l'analyse des fréquences
+                          d'un grand texte (1 : aucun, None : un par cœur)
+        """
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Backend inconnu : {backend}")
+        if constructeur not in ("tas", "lineaire"):
+            raise ValueError(f"Constructeur inconnu : {constructeur}")
+        if algorithme not in ("statique", "adaptatif"):
+            raise ValueError(f"Algorithme inconnu : {algorithme}")
         self.texte_original = texte
+        self.canonique = canonique
+        self.empaqueter = empaqueter
+        self.backend = backend if BackendNumpy.disponible() else "python"
+        self.longueur_max = longueur_max
+        self.constructeur = constructeur
+        self.algorithme = algorithme
+        self.modele = modele
+        self.echappes = b""
+        self.cache = cache
+        self._entree_cache = None
+        self.metriques = metriques
+        self.nb_processus = nb_processus
         self.frequences = None
         self.racine = None
         self.codes = None
-        self.texte_encode = None
+        self._texte_encode = None
+        self._donnees_encodees = None
+        self._bits_bourrage = 0
+        self._encodage_en_attente = False
         self.statistiques = None
     
-    def executer(self, afficher_details: bool = True):
-        """Exécute tout le processus de compression"""
+    @property
+    def texte_encode(self) -> Optional[str]:
+        """Texte encodé en 0 et 1 (encodé à la première lecture si l'encodage a été différé)"""
+        self._encoder_si_besoin()
+        return self._texte_encode
+    
+    @texte_encode.setter
+    def texte_encode(self, valeur: Optional[str]):
+        self._texte_encode = valeur
+    
+    @property
+    def donnees_encodees(self) -> Optional[bytes]:
+        """Texte encodé en octets (encodé à la première lecture si l'encodage a été différé)"""
+        self._encoder_si_besoin()
+        return self._donnees_encodees
+    
+    @donnees_encodees.setter
+    def donnees_encodees(self, valeur: Optional[bytes]):
+        self._donnees_encodees = valeur
+    
+    @property
+    def bits_bourrage(self) -> int:
+        """Bits de bourrage du dernier octet de donnees_encodees"""
+        self._encoder_si_besoin()
+        return self._bits_bourrage
+    
+    @bits_bourrage.setter
+    def bits_bourrage(self, valeur: int):
+        self._bits_bourrage = valeur
+    
+    def executer(self, afficher_details: bool = True, encoder: bool = True):
+        """
+        Exécute tout le processus de compression.
+        
+        Args:
+            afficher_details: Afficher chaque étape
+            encoder: Encoder le texte tout de suite. Avec False (algorithme
+                     statique sans modèle), seuls les fréquences, l'arbre, les
+                     codes et les statistiques sont calculés : l'encodage a lieu
+                     à la première lecture de texte_encode / donnees_encodees
+                     (ou à l'appel de encoder), ce qui permet de connaître la
+                     taille compressée avant de payer l'encodage.
+        """
         
         if afficher_details:
             Affichage.titre("🗜️  COMPRESSION HUFFMAN")
         
-        # 1. Analyser les fréquences
-        self.frequences = AnalyseurFrequences.calculer_frequences(self.texte_original)
-        if afficher_details:
+        # 1. Analyser les fréquences (inutile avec un modèle)
+        if self.modele is None:
+            with self._etape('analyse'):
+                if self.nb_processus != 1:
+                    self.frequences = AnalyseurParallele.calculer_frequences(
+                        self.texte_original, self.nb_processus, self.backend
+                    )
+                elif self.backend == "numpy":
+                    self.frequences = BackendNumpy.calculer_frequences(self.texte_original)
+                else:
+                    self.frequences = AnalyseurFrequences.calculer_frequences(self.texte_original)
+        if afficher_details and self.frequences is not None:
             Affichage.frequences(self.frequences)
         
+        # 2 à 4. Arbre, codes et encodage
+        if self.modele is not None:
+            with self._etape('encodage'):
+                self._encoder_avec_modele()
+        elif self.algorithme == "adaptatif":
+            with self._etape('encodage'):
+                self._encoder_adaptatif()
+        else:
+            self._encoder_statique(afficher_details, encoder)
+        
+        # 5. Calculer les statistiques (sans le texte encodé si les codes suffisent)
+        with self._etape('statistiques'):
+            if self.modele is None and self.algorithme == "statique":
+                self.statistiques = Statistiques.calculer_depuis_codes(self.frequences, self.codes)
+            elif self.donnees_encodees is not None:
+                self.statistiques = Statistiques.calculer_depuis_tailles(
+                    len(self.texte_original) * 8,
+                    len(self.donnees_encodees) * 8 - self.bits_bourrage + len(self.echappes) * 8
+                )
+            else:
+                self.statistiques = Statistiques.calculer_compression(
+                    self.texte_original, 
+                    self.texte_encode
+                )
+        
+        if afficher_details:
+            Affichage.statistiques(self.statistiques)
+        
+        return self
+    
+    def _encoder_statique(self, afficher_details: bool, encoder: bool = True):
+        """Construit l'arbre et les codes à partir des fréquences, puis encode"""
+        # 2 et 3. Reprendre l'arbre et les codes du cache si la distribution est connue
+        entree = None
+        if self.cache is not None:
+            cle = CacheHuffman.cle(self.frequences, self.canonique, self.longueur_max, self.constructeur)
+            entree = self.cache.obtenir(cle)
+        
+        if entree is not None:
+            self.racine = entree['racine']
+            self.codes = entree['codes']
+            self._entree_cache = entree
+            if afficher_details:
+                Affichage.codes(self.codes, self.frequences)
+        else:
+            self._construire_codes(afficher_details)
+            if self.cache is not None:
+                self._entree_cache = {'racine': self.racine, 'codes': self.codes, 'decodeur': None}
+                self.cache.ajouter(cle, self._entree_cache)
+        
+        # 4. Encoder (tout de suite, ou à la première lecture du résultat)
+        self._encodage_en_attente = True
+        if encoder:
+            self.encoder()
+    
+    def encoder(self):
+        """Encode le texte avec les codes calculés, s'il ne l'est pas déjà"""
+        if not self._encodage_en_attente:
+            return self
+        self._encodage_en_attente = False
+        
+        with self._etape('encodage'):
+            if self.empaqueter and self.backend == "numpy":
+                ecrivain = EcrivainBits()
+                octets = BackendNumpy.encoder(self.texte_original, self.codes, ecrivain)
+                dernier, self.bits_bourrage = ecrivain.terminer()
+                self.donnees_encodees = octets + dernier
+            elif self.empaqueter:
+                self.donnees_encodees, self.bits_bourrage = Encodeur.encoder_octets(
+                    self.texte_original, self.codes
+                )
+            else:
+                self.texte_encode = Encodeur.encoder(self.texte_original, self.codes)
+        return self
+    
+    def _encoder_si_besoin(self):
+        """Effectue l'encodage différé par executer(encoder=False)"""
+        if self._encodage_en_attente:
+            self.encoder()
+    
+    def _construire_codes(self, afficher_details: bool):
+        """Construit l'arbre puis génère les codes"""
         # 2. Construire l'arbre
-        self.racine = ConstructeurArbre.construire(self.frequences)
+        with self._etape('construction'):
+            if self.longueur_max:
+                self.racine = ConstructeurArbre.construire_limite(self.frequences, self.longueur_max)
+            elif self.constructeur == "lineaire":
+                self.racine = ConstructeurArbre.construire_lineaire(self.frequences)
+            else:
+                self.racine = ConstructeurArbre.construire(self.frequences, historique=afficher_details)
         if afficher_details and hasattr(self.racine, 'historique'):
             Affichage.construction_arbre(self.racine.historique)
         
         # 3. Générer les codes
-        self.codes = GenerateurCodes.generer(self.racine)
+        with self._etape('codes'):
+            self.codes = GenerateurCodes.generer(self.racine)
+            if self.canonique:
+                # Mêmes longueurs que l'arbre, codes réattribués dans l'ordre (longueur, caractère)
+                self.codes = GenerateurCodes.generer_canonique(GenerateurCodes.longueurs(self.codes))
         if afficher_details:
             Affichage.codes(self.codes, self.frequences)
+    
+    def _etape(self, nom: str):
+        """Contexte de mesure d'une étape (sans effet sans metriques)"""
+        return MetriquesEtapes.optionnelles(self.metriques, nom)
+    
+    def _decodeur_table(self) -> DecodeurTable:
+        """Table de décodage des codes (reprise du cache si elle y est déjà)"""
+        if self._entree_cache is None:
+            return DecodeurTable(self.codes)
+        if self._entree_cache['decodeur'] is None:
+            self._entree_cache['decodeur'] = DecodeurTable(self.codes)
+        return self._entree_cache['decodeur']
+    
+    def _encoder_avec_modele(self):
+        """Encode avec les codes du modèle (symboles absents échappés)"""
+        self.codes = self.modele.codes
+        self.donnees_encodees, nb_bits_dernier, self.echappes = self.modele.encoder(self.texte_original)
+        self.bits_bourrage = (8 - nb_bits_dernier) % 8
+        if not self.empaqueter:
+            self.texte_encode = Encodeur.depaqueter(self.donnees_encodees, nb_bits_dernier)
+    
+    def _encoder_adaptatif(self):
+        """Encode en une passe : l'arbre final est gardé pour la visualisation"""
+        codec = HuffmanAdaptatif(octets=isinstance(self.texte_original, bytes))
+        octets = codec.encoder(self.texte_original)
+        dernier, self.bits_bourrage = codec.terminer()
+        self.donnees_encodees = octets + dernier
+        self.racine = codec.racine
+        if not self.empaqueter:
+            nb_bits_dernier = 8 - self.bits_bourrage
+            self.texte_encode = Encodeur.depaqueter(self.donnees_encodees, nb_bits_dernier)
+    
+    def decoder(self, moteur: str = "arbre") -> str:
+        """
+        Décode le texte compressé.
         
-        # 4. Encoder
-        self.texte_encode = Encodeur.encoder(self.texte_original, self.codes)
+        Args:
+            moteur: "arbre" (parcours bit par bit) ou "table" (recherche par tables),
+                    sans effet en mode adaptatif ou avec un modèle
+        """
+        if self.modele is not None:
+            nb_bits_dernier = 8 - self.bits_bourrage if self.donnees_encodees else 0
+            return self.modele.decoder(self.donnees_encodees, nb_bits_dernier, self.echappes)
+        if self.algorithme == "adaptatif":
+            codec = HuffmanAdaptatif(octets=isinstance(self.texte_original, bytes))
+            return codec.decoder(self.donnees_encodees)
         
-        # 5. Calculer les statistiques
-        self.statistiques = Statistiques.calculer_compression(
-            self.texte_original, 
-            self.texte_encode
-        )
+        if self.empaqueter and moteur == "table":
+            nb_bits_dernier = 8 - self.bits_bourrage if self.donnees_encodees else 0
+            return self._decodeur_table().decoder_octets(self.donnees_encodees, nb_bits_dernier)
         
-        if afficher_details:
-            Affichage.statistiques(self.statistiques)
+        texte_encode = self.texte_encode
+        if self.empaqueter:
+            nb_bits_dernier = 8 - self.bits_bourrage if self.donnees_encodees else 0
+            texte_encode = Encodeur.depaqueter(self.donnees_encodees, nb_bits_dernier)
         
-        return self
-    
-    def decoder(self) -> str:
-        """Décode le texte compressé"""
-        return Encodeur.decoder(self.texte_encode, self.racine)
+        if moteur == "table":
+            return self._decodeur_table().decoder(texte_encode)
+        if moteur != "arbre":
+            raise ValueError(f"Moteur de décodage inconnu : {moteur}")
+        if self.canonique:
+            return Encodeur.decoder_canonique(texte_encode, GenerateurCodes.longueurs(self.codes))
+        return Encodeur.decoder(texte_encode, self.racine)
     
     def verifier(self) -> bool:
         """Vérifie que la compression/décompression fonctionne"""
@@ -70,14 +316,21 @@ class CompressionHuffman:
         elif format == "graphviz":
             Visualiseur.generer_graphviz(self.racine)
     
-    def get_rapport(self) -> dict:
-        """Retourne un rapport complet"""
+    def get_rapport(self, verifier: bool = True) -> dict:
+        """
+        Retourne un rapport complet.
+        
+        Args:
+            verifier: Décoder le texte pour vérifier l'aller-retour. Avec
+                      False, la vérification vaut None et un encodage différé
+                      n'est pas déclenché (texte_encode vaut alors None).
+        """
         return {
             'texte_original': self.texte_original,
             'frequences': self.frequences,
             'codes': self.codes,
-            'texte_encode': self.texte_encode,
+            'texte_encode': self.texte_encode if verifier else self._texte_encode,
             'statistiques': self.statistiques,
-            'verification': self.verifier()
+            'verification': self.verifier() if verifier else None
         }
 
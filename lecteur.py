@@ -0,0 +1,141 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Optional, Union
+from conteneur import ConteneurHuffman
+from decodeur import DecodeurTable
+from modele import ModeleHuffman
+
+
+class LecteurHuffman:
+    """
+    Lecture d'une plage du texte d'origine sans décompresser tout le fichier.
+
+    Pour un fichier par blocs, l'index du conteneur donne le nombre de
+    caractères de chaque bloc : seuls les blocs qui couvrent la plage
+    demandée sont lus et décodés. Le dernier bloc décodé est gardé, ce qui
+    rend les lectures successives dans le même bloc immédiates. Le CRC32
+    de chaque bloc décodé est vérifié s'il est présent.
+
+    Les positions sont comptées en caractères (en octets pour un fichier
+    compressé en mode octets). Un fichier compressé avec un modèle partagé
+    forme un seul bloc, décodé avec le modèle.
+    """
+
+    def __init__(self, fichier: str, modele: Optional[str] = None):
+        """
+        Args:
+            fichier: Chemin du fichier .huff
+            modele: Chemin du modèle partagé, pour un fichier compressé avec un modèle
+
+        Raises:
+            ValueError: pour un fichier adaptatif, ou compressé avec un
+                        modèle qui n'est pas fourni (ou pas le bon)
+        """
+        self.flux = open(fichier, 'rb')
+        try:
+            self.en_tete = ConteneurHuffman.lire_en_tete(self.flux)
+        except Exception:
+            self.flux.close()
+            raise
+
+        self.drapeaux = self.en_tete['drapeaux']
+        if self.drapeaux & ConteneurHuffman.ADAPTATIF:
+            self.flux.close()
+            raise ValueError("Fichier adaptatif : pas d'accès direct, le flux se lit en entier")
+        self.modele = None
+        if 'modele' in self.en_tete:
+            try:
+                if modele is None:
+                    raise ValueError(f"Ce fichier nécessite le modèle {self.en_tete['modele']:016x}")
+                self.modele = ModeleHuffman.charger(modele)
+                self.modele.verifier(self.en_tete)
+            except Exception:
+                self.flux.close()
+                raise
+        self.octets = bool(self.drapeaux & ConteneurHuffman.OCTETS)
+        self.taille = self.en_tete['nb_caracteres']
+        self.vide = b"" if self.octets else ""
+
+        # Fichier sans blocs : la charge entière forme un seul bloc
+        self.blocs = self.en_tete.get('blocs')
+        if self.blocs is None:
+            debut_charge = self.flux.tell()
+            self.blocs = [(debut_charge, self.en_tete['taille_charge'], self.taille)]
+        # Position (dans le texte d'origine) du début de chaque bloc
+        self.debuts = [0] + list(accumulate(nb for _, _, nb in self.blocs))
+
+        self._bloc_courant = None
+        self._texte_courant = None
+
+    def lire(self, position: int, longueur: int) -> Union[str, bytes]:
+        """
+        Lit `longueur` caractères à partir de `position`.
+
+        Args:
+            position: Position dans le texte d'origine
+            longueur: Nombre de caractères à lire (tronqué à la fin du texte)
+
+        Returns:
+            Le texte de la plage (bytes en mode octets)
+
+        Raises:
+            ValueError: si la position ou la longueur est négative
+        """
+        if position < 0 or longueur < 0:
+            raise ValueError("Position et longueur doivent être positives")
+
+        fin = min(position + longueur, self.taille)
+        morceaux = []
+        numero = bisect_right(self.debuts, position) - 1
+
+        while position < fin:
+            texte = self._decoder_bloc(numero)
+            debut_bloc = self.debuts[numero]
+            morceaux.append(texte[position - debut_bloc:fin - debut_bloc])
+            position = self.debuts[numero + 1]
+            numero += 1
+
+        return self.vide.join(morceaux)
+
+    def fermer(self):
+        """Ferme le fichier"""
+        self.flux.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    def _decoder_bloc(self, numero: int) -> Union[str, bytes]:
+        """Décode un bloc (ou le reprend s'il vient d'être décodé)"""
+        if numero == self._bloc_courant:
+            return self._texte_courant
+
+        position, taille, _ = self.blocs[numero]
+        self.flux.seek(position)
+        donnees = self.flux.read(taille)
+        if len(donnees) != taille:
+            raise ValueError("Fichier .huff tronqué ou corrompu")
+
+        if self.modele is not None:
+            texte = self.modele.decoder(donnees, self.en_tete['nb_bits_dernier'], self.en_tete['echappes'])
+            self._bloc_courant = numero
+            self._texte_courant = texte
+            return texte
+
+        if 'codes' in self.en_tete:
+            codes = self.en_tete['codes']
+            charge, nb_bits_dernier = donnees, self.en_tete['nb_bits_dernier']
+            controle = self.en_tete.get('controle')
+        else:
+            bloc = ConteneurHuffman.decoder_bloc(donnees, self.drapeaux)
+            codes, charge, nb_bits_dernier = bloc['codes'], bloc['charge'], bloc['nb_bits_dernier']
+            controle = bloc.get('controle')
+
+        texte = DecodeurTable(codes, octets=self.octets).decoder_octets(charge, nb_bits_dernier)
+        if controle is not None and ConteneurHuffman.somme_controle(texte) != controle:
+            raise ValueError("Bloc corrompu : somme de contrôle incorrecte")
+        self._bloc_courant = numero
+        self._texte_courant = texte
+        return texte
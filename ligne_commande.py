@@ -0,0 +1,448 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+from affichage import Affichage
+from conteneur import ConteneurHuffman
+from gestion_fichiers import GestionFichiers
+from metriques import MetriquesEtapes
+
+
+class LigneCommande:
+    """
+    Interface en ligne de commande, sans saisie interactive : traite des
+    lots de fichiers (chemins, motifs glob ou dossiers) sur un pool de
+    processus, sans affichage par fichier, puis affiche un bilan de débit.
+
+    Sous-commandes :
+        compresser (compress)      fichier -> fichier.huff
+        decompresser (decompress)  fichier.huff -> fichier décompressé
+        verifier (verify)          compression + décompression vérifiée, ou
+                                   avec --archives : vérification de fichiers .huff
+        bench                      comme verifier, avec le débit de chaque étape
+
+    Exemple :
+        python main.py compresser exemples/ "logs/*.txt" -j 4 --taille-bloc 1048576
+    """
+
+    EXTENSION = ".huff"
+    MEGA_OCTET = 1024 * 1024
+
+    @staticmethod
+    def analyseur() -> argparse.ArgumentParser:
+        """Construit l'analyseur des arguments et de ses sous-commandes"""
+        analyseur = argparse.ArgumentParser(
+            prog="huffman",
+            description="Compression de Huffman de lots de fichiers"
+        )
+        sous_commandes = analyseur.add_subparsers(dest="commande", required=True)
+
+        commun = argparse.ArgumentParser(add_help=False)
+        commun.add_argument("chemins", nargs="+",
+                            help="Fichiers, motifs glob ou dossiers (parcourus récursivement)")
+        commun.add_argument("-j", "--processus", type=int, default=None,
+                            help="Nombre de processus (défaut : un par cœur)")
+        commun.add_argument("-o", "--sortie", default=None,
+                            help="Dossier de sortie (défaut : à côté de chaque fichier ; "
+                                 "dossier temporaire pour verify et bench)")
+        commun.add_argument("-q", "--silencieux", action="store_true",
+                            help="N'afficher que les erreurs (pas de bilan)")
+        commun.add_argument("--metriques", default=None,
+                            help="Ajouter les mesures par étape de chaque fichier à ce "
+                                 "fichier JSON Lines (une ligne par fichier)")
+        commun.add_argument("--metriques-memoire", action="store_true",
+                            help="Mesurer aussi le pic de mémoire de chaque étape (plus lent)")
+        commun.add_argument("--projection", action="store_true",
+                            help="Lire les fichiers par projection en mémoire (mmap)")
+
+        compression = argparse.ArgumentParser(add_help=False)
+        compression.add_argument("--octets", action="store_true",
+                                 help="Compresser les octets bruts (fichiers binaires)")
+        compression.add_argument("--non-canonique", action="store_true",
+                                 help="Stocker les codes complets au lieu des longueurs")
+        compression.add_argument("--taille-bloc", type=int, default=None,
+                                 help="Découper en blocs indépendants de cette taille")
+        compression.add_argument("--longueur-max", type=int, default=None,
+                                 help="Longueur maximale des codes en bits")
+        compression.add_argument("--algorithme", choices=["statique", "adaptatif"],
+                                 default="statique")
+        compression.add_argument("--backend", choices=["python", "numpy"], default="python")
+        compression.add_argument("--echantillon", type=float, default=None, metavar="FRACTION",
+                                 help="Estimer les fréquences sur cette fraction du fichier "
+                                      "(ex. 0.01) au lieu d'une première lecture complète")
+        compression.add_argument("--analyse-parallele", action="store_true",
+                                 help="Compter les fréquences d'un grand fichier sur les "
+                                      "processus de -j")
+
+        modele = argparse.ArgumentParser(add_help=False)
+        modele.add_argument("--modele", default=None, help="Modèle partagé (ModeleHuffman)")
+
+        sous_commandes.add_parser(
+            "compresser", aliases=["compress"], parents=[commun, compression, modele],
+            help="Compresser des fichiers"
+        )
+        sous_commandes.add_parser(
+            "decompresser", aliases=["decompress"], parents=[commun, modele],
+            help="Décompresser des fichiers .huff"
+        )
+        verification = sous_commandes.add_parser(
+            "verifier", aliases=["verify"], parents=[commun, compression, modele],
+            help="Compresser, décompresser et comparer avec l'original"
+        )
+        verification.add_argument("--archives", action="store_true",
+                                  help="Vérifier des fichiers .huff existants (CRC32), "
+                                       "sans rien écrire sur le disque")
+        sous_commandes.add_parser(
+            "bench", parents=[commun, compression, modele],
+            help="Mesurer le débit de compression et de décompression"
+        )
+        return analyseur
+
+    @staticmethod
+    def executer(arguments: Optional[List[str]] = None) -> int:
+        """
+        Point d'entrée : analyse les arguments et traite le lot.
+
+        Args:
+            arguments: Arguments de la ligne de commande (défaut : sys.argv[1:])
+
+        Returns:
+            Code de sortie : 0 si tous les fichiers ont été traités, 1 sinon
+        """
+        args = LigneCommande.analyseur().parse_args(arguments)
+        operation = {
+            "compress": "compresser", "decompress": "decompresser", "verify": "verifier"
+        }.get(args.commande, args.commande)
+        if operation == "verifier" and args.archives:
+            operation = "controler"
+
+        decompression = operation in ("decompresser", "controler")
+        fichiers = list(LigneCommande.lister_fichiers(args.chemins, decompression))
+        if not fichiers:
+            print("❌ Aucun fichier à traiter", file=sys.stderr)
+            return 1
+
+        options = LigneCommande._options(args, operation)
+        taches = [
+            (operation, fichier, LigneCommande._chemin_sortie(fichier, relatif, args.sortie,
+                                                              operation), options)
+            for fichier, relatif in fichiers
+        ]
+        if operation == "controler":
+            taches = [(operation, fichier, None, options) for _, fichier, _, _ in taches]
+        for _, _, sortie, _ in taches:
+            if sortie and os.path.dirname(sortie):
+                os.makedirs(os.path.dirname(sortie), exist_ok=True)
+
+        debut = time.perf_counter()
+        resultats = []
+        for resultat in LigneCommande._executer_taches(taches, args.processus):
+            if not resultat['succes']:
+                print(f"❌ {resultat['fichier']} : {resultat['erreur']}", file=sys.stderr)
+            resultats.append(resultat)
+        duree = time.perf_counter() - debut
+
+        if args.metriques:
+            LigneCommande.exporter_metriques(args.metriques, operation, resultats)
+        if not args.silencieux:
+            LigneCommande.afficher_bilan(operation, resultats, duree)
+        return 0 if all(r['succes'] for r in resultats) else 1
+
+    @staticmethod
+    def lister_fichiers(chemins: List[str], compresses: bool) -> Iterator[Tuple[str, str]]:
+        """
+        Développe les chemins en une liste de fichiers, sans doublons.
+
+        Args:
+            chemins: Fichiers, motifs glob ou dossiers
+            compresses: Ne garder que les fichiers .huff dans les dossiers
+                        (sinon, les ignorer)
+
+        Returns:
+            Itérateur sur (chemin du fichier, chemin relatif à l'argument),
+            le chemin relatif servant à placer la sortie dans --sortie
+        """
+        vus = set()
+        for chemin in chemins:
+            if os.path.isdir(chemin):
+                for dossier, sous_dossiers, noms in os.walk(chemin):
+                    sous_dossiers.sort()
+                    for nom in sorted(noms):
+                        if nom.endswith(LigneCommande.EXTENSION) != compresses:
+                            continue
+                        fichier = os.path.join(dossier, nom)
+                        if fichier not in vus:
+                            vus.add(fichier)
+                            yield fichier, os.path.relpath(fichier, chemin)
+            else:
+                # Un chemin sans caractère spécial est son propre motif
+                trouves = sorted(glob.glob(chemin)) or [chemin]
+                for fichier in trouves:
+                    if os.path.isdir(fichier) or fichier in vus:
+                        continue
+                    vus.add(fichier)
+                    yield fichier, os.path.basename(fichier)
+
+    @staticmethod
+    def afficher_bilan(operation: str, resultats: List[dict], duree: float):
+        """Affiche le nombre de fichiers traités et les débits (fichiers/s, Mo/s)"""
+        reussis = [r for r in resultats if r['succes']]
+        entree = sum(r['taille_entree'] for r in reussis)
+        sortie = sum(r['taille_sortie'] for r in reussis)
+        mo = LigneCommande.MEGA_OCTET
+
+        # Vérification d'archives : rien n'est écrit
+        archives = operation == "controler"
+        Affichage.section(f"📊 BILAN ({'verifier --archives' if archives else operation})")
+        print(f"{'Fichiers traités':<30} {len(reussis)}/{len(resultats)}")
+        print(f"{'Durée totale':<30} {duree:.3f} s")
+        print(f"{'Entrée':<30} {entree:,} octets")
+        if not archives:
+            print(f"{'Sortie':<30} {sortie:,} octets")
+        if entree > 0 and operation not in ("decompresser", "controler"):
+            print(f"{'Ratio de compression':<30} {sortie / entree:.2%}")
+        if duree > 0:
+            print(f"{'Débit (fichiers)':<30} {len(reussis) / duree:.2f} fichiers/s")
+            print(f"{'Débit en entrée':<30} {entree / mo / duree:.2f} Mo/s")
+            if not archives:
+                print(f"{'Débit en sortie':<30} {sortie / mo / duree:.2f} Mo/s")
+
+        if operation == "bench" and reussis:
+            # Débit de chaque étape, temps cumulé des processus
+            for etape, libelle in (('compression', 'compression'),
+                                   ('decompression', 'décompression')):
+                temps = sum(r['durees'][etape] for r in reussis)
+                if temps > 0:
+                    print(f"{'Débit ' + libelle:<30} {entree / mo / temps:.2f} Mo/s par processus")
+
+    @staticmethod
+    def exporter_metriques(fichier: str, operation: str, resultats: List[dict]):
+        """
+        Ajoute une ligne JSON par fichier traité : opération, fichier,
+        succès et mesures par étape (voir MetriquesEtapes.en_dict).
+        """
+        with open(fichier, 'a', encoding='utf-8') as f:
+            for resultat in resultats:
+                ligne = {
+                    'operation': operation,
+                    'fichier': resultat['fichier'],
+                    'succes': resultat['succes'],
+                    'taille_entree': resultat['taille_entree'],
+                    'taille_sortie': resultat['taille_sortie'],
+                }
+                if resultat.get('metriques'):
+                    # Le contexte répète les informations de la ligne
+                    ligne['etapes'] = resultat['metriques']['etapes']
+                    ligne['total'] = resultat['metriques']['total']
+                f.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _options(args: argparse.Namespace, operation: str) -> dict:
+        """
+        Arguments communs à passer à compresser_fichier / decompresser_fichier,
+        plus les clés 'metriques' et 'memoire' retirées par _executer_tache
+        """
+        mesures = {'metriques': bool(args.metriques), 'memoire': args.metriques_memoire,
+                   'projection': args.projection}
+        if operation in ("decompresser", "controler"):
+            return dict(mesures, modele=args.modele)
+        return {
+            **mesures,
+            'canonique': not args.non_canonique,
+            'octets': args.octets,
+            'backend': args.backend,
+            'taille_bloc': args.taille_bloc,
+            'longueur_max': args.longueur_max,
+            'algorithme': args.algorithme,
+            'modele': args.modele,
+            'echantillon': args.echantillon,
+            'analyse_parallele': args.analyse_parallele,
+        }
+
+    @staticmethod
+    def _chemin_sortie(fichier: str, relatif: str, dossier: Optional[str],
+                       operation: str) -> Optional[str]:
+        """
+        Fichier de sortie d'une tâche (None : nom par défaut de GestionFichiers
+        pour une décompression, dossier temporaire pour verifier et bench)
+        """
+        if dossier is None:
+            if operation == "compresser":
+                return fichier + LigneCommande.EXTENSION
+            return None
+        if operation in ("decompresser", "controler"):
+            if relatif.endswith(LigneCommande.EXTENSION):
+                relatif = relatif[:-len(LigneCommande.EXTENSION)]
+            return os.path.join(dossier, relatif)
+        return os.path.join(dossier, relatif + LigneCommande.EXTENSION)
+
+    @staticmethod
+    def _executer_taches(taches: List[tuple], nb_processus: Optional[int]) -> Iterator[dict]:
+        """
+        Traite les tâches sur un ProcessPoolExecutor et rend les résultats
+        dans l'ordre où ils se terminent.
+
+        Avec un seul processus (ou un seul fichier), les tâches s'exécutent
+        dans le processus courant avec le nombre de processus demandé (les
+        blocs d'un fichier découpé gardent leur propre parallélisme, sauf
+        avec -j 1) ; sinon chaque fichier est traité dans un seul processus
+        pour ne pas imbriquer les pools.
+        """
+        demandes = nb_processus
+        nb_processus = min(nb_processus or os.cpu_count() or 1, len(taches))
+        if nb_processus <= 1:
+            for tache in taches:
+                yield LigneCommande._executer_tache(*tache, demandes)
+            return
+
+        with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+            futurs = [
+                executeur.submit(LigneCommande._executer_tache, *tache, 1)
+                for tache in taches
+            ]
+            for futur in as_completed(futurs):
+                yield futur.result()
+
+    @staticmethod
+    def _executer_tache(operation: str, fichier: str, sortie: Optional[str], options: dict,
+                        nb_processus: Optional[int] = None) -> dict:
+        """
+        Traite un fichier. Les messages de GestionFichiers sont capturés :
+        en cas d'échec, ils deviennent le message d'erreur du résultat.
+
+        Returns:
+            Dictionnaire : fichier, succes, erreur, taille_entree,
+            taille_sortie, durees (temps de chaque étape en secondes) et
+            metriques (MetriquesEtapes.en_dict, ou None sans --metriques)
+        """
+        options = dict(options)
+        memoire = options.pop('memoire', False)
+        metriques = MetriquesEtapes(memoire=memoire) if options.pop('metriques', False) else None
+        resultat = {
+            'fichier': fichier, 'succes': False, 'erreur': None,
+            'taille_entree': 0, 'taille_sortie': 0, 'durees': {}, 'metriques': None
+        }
+        messages = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(messages):
+                resultat['taille_entree'] = os.path.getsize(fichier)
+                if operation == "compresser":
+                    resultat['succes'] = LigneCommande._etape(
+                        resultat, 'compression', GestionFichiers.compresser_fichier,
+                        fichier, sortie, afficher_details=False, nb_processus=nb_processus,
+                        metriques=metriques, **options
+                    )
+                    if resultat['succes']:
+                        resultat['taille_sortie'] = os.path.getsize(sortie)
+                elif operation == "decompresser":
+                    if sortie is None:
+                        base = fichier[:-5] if fichier.endswith(LigneCommande.EXTENSION) else fichier
+                        sortie = base + ".decompresse.txt"
+                    resultat['succes'] = LigneCommande._etape(
+                        resultat, 'decompression', GestionFichiers.decompresser_fichier,
+                        fichier, sortie, afficher_details=False, nb_processus=nb_processus,
+                        metriques=metriques, **options
+                    )
+                    if resultat['succes']:
+                        resultat['taille_sortie'] = os.path.getsize(sortie)
+                elif operation == "controler":
+                    resultat['succes'] = LigneCommande._etape(
+                        resultat, 'decompression', GestionFichiers.verifier_fichier,
+                        fichier, afficher_details=False, nb_processus=nb_processus,
+                        metriques=metriques, **options
+                    )
+                else:
+                    LigneCommande._verifier(resultat, fichier, sortie, options, nb_processus,
+                                            metriques)
+        except Exception as e:
+            print(f"{e}", file=messages)
+
+        if metriques is not None:
+            resultat['metriques'] = metriques.en_dict()
+
+        if not resultat['succes'] and resultat['erreur'] is None:
+            erreur = messages.getvalue().strip().replace("❌ ", "")
+            resultat['erreur'] = erreur or "échec"
+        return resultat
+
+    @staticmethod
+    def _verifier(resultat: dict, fichier: str, sortie: Optional[str], options: dict,
+                  nb_processus: Optional[int], metriques: Optional[MetriquesEtapes] = None):
+        """
+        Aller-retour d'un fichier : compression (dans sortie, ou dans un
+        dossier temporaire) puis décodage vérifié par le CRC32 du conteneur,
+        sans écrire le texte décodé. Un conteneur sans CRC32 (adaptatif ou
+        avec un modèle) est décompressé dans un dossier temporaire et comparé
+        avec l'original.
+        """
+        with tempfile.TemporaryDirectory() as temporaire:
+            compresse = sortie or os.path.join(temporaire, "fichier" + LigneCommande.EXTENSION)
+            decompresse = os.path.join(temporaire, "fichier.decompresse")
+
+            if not LigneCommande._etape(
+                    resultat, 'compression', GestionFichiers.compresser_fichier,
+                    fichier, compresse, afficher_details=False, nb_processus=nb_processus,
+                    metriques=metriques, **options):
+                return
+            resultat['taille_sortie'] = os.path.getsize(compresse)
+
+            with open(compresse, 'rb') as f:
+                controle = 'controle' in ConteneurHuffman.lire_en_tete(f)
+            if controle:
+                resultat['succes'] = LigneCommande._etape(
+                    resultat, 'decompression', GestionFichiers.verifier_fichier,
+                    compresse, afficher_details=False, nb_processus=nb_processus,
+                    modele=options.get('modele'), projection=options.get('projection', False),
+                    metriques=metriques)
+                return
+
+            if not LigneCommande._etape(
+                    resultat, 'decompression', GestionFichiers.decompresser_fichier,
+                    compresse, decompresse, afficher_details=False, nb_processus=nb_processus,
+                    modele=options.get('modele'), projection=options.get('projection', False),
+                    metriques=metriques):
+                return
+
+            # En mode texte, les fins de ligne sont normalisées à la lecture :
+            # on compare alors les textes si les octets diffèrent
+            identique = LigneCommande._identiques(fichier, decompresse) or (
+                not options.get('octets')
+                and GestionFichiers.comparer_fichiers(fichier, decompresse)
+            )
+            if not identique:
+                resultat['erreur'] = "le fichier décompressé diffère de l'original"
+                return
+            resultat['succes'] = True
+
+    @staticmethod
+    def _etape(resultat: dict, nom: str, fonction, *args, **kwargs) -> bool:
+        """Exécute une étape et enregistre sa durée dans resultat['durees']"""
+        debut = time.perf_counter()
+        succes = fonction(*args, **kwargs)
+        resultat['durees'][nom] = time.perf_counter() - debut
+        return succes
+
+    @staticmethod
+    def _identiques(fichier_a: str, fichier_b: str,
+                    taille_morceau: int = GestionFichiers.TAILLE_MORCEAU) -> bool:
+        """Compare deux fichiers octet par octet, morceau par morceau"""
+        if os.path.getsize(fichier_a) != os.path.getsize(fichier_b):
+            return False
+        with open(fichier_a, 'rb') as a, open(fichier_b, 'rb') as b:
+            while True:
+                morceau = a.read(taille_morceau)
+                if morceau != b.read(taille_morceau):
+                    return False
+                if not morceau:
+                    return True
+
+
+if __name__ == "__main__":
+    sys.exit(LigneCommande.executer())
@@ -4,7 +4,9 @@ from huffman import CompressionHuffman
 from affichage import Affichage
 from gestion_fichiers import GestionFichiers
 from visualiseur import Visualiseur
+from ligne_commande import LigneCommande
 import os
+import sys
 
 def demander_generation_graphique(compression, nom_fichier="arbre_huffman"):
     """
@@ -249,4 +251,7 @@ def menu_principal():
             print("⚠️  Choix invalide !")
 
 if __name__ == "__main__":
+    # Avec des arguments : ligne de commande (voir ligne_commande.py), sinon menu
+    if len(sys.argv) > 1:
+        sys.exit(LigneCommande.executer())
     menu_principal()
\ No newline at end of file
@@ -0,0 +1,116 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List, Optional
+
+
+class MetriquesEtapes:
+    """
+    Mesures par étape d'une compression ou d'une décompression : durée
+    réelle, temps CPU du processus et, sur demande, pic de mémoire allouée
+    pendant l'étape (tracemalloc, qui ralentit nettement l'exécution).
+
+    Les mesures se lisent dans `etapes` ou s'exportent en dictionnaire ou
+    en JSON. Des rappels peuvent recevoir chaque mesure dès qu'elle est
+    prise (pour l'envoyer à un outil de supervision, par exemple).
+
+    Exemple :
+        metriques = MetriquesEtapes(memoire=True)
+        CompressionHuffman(texte, metriques=metriques).executer(afficher_details=False)
+        print(metriques.en_json())
+    """
+
+    def __init__(self, memoire: bool = False,
+                 rappels: Optional[List[Callable[[dict], None]]] = None):
+        """
+        Args:
+            memoire: Mesurer le pic de mémoire de chaque étape
+            rappels: Fonctions appelées avec chaque mesure terminée
+        """
+        self.memoire = memoire
+        self.rappels = list(rappels or [])
+        self.etapes = []
+        self.contexte = {}
+
+    @staticmethod
+    def optionnelles(metriques: Optional['MetriquesEtapes'], nom: str):
+        """Contexte de mesure d'une étape, ou contexte vide si metriques vaut None"""
+        return nullcontext() if metriques is None else metriques.mesurer(nom)
+
+    def ajouter_rappel(self, rappel: Callable[[dict], None]):
+        """Ajoute une fonction appelée avec chaque mesure terminée"""
+        self.rappels.append(rappel)
+
+    @contextmanager
+    def mesurer(self, nom: str) -> Iterator[dict]:
+        """
+        Mesure le bloc `with` comme une étape.
+
+        La mesure est enregistrée même si le bloc lève une exception
+        (avec erreur=True), puis l'exception est propagée.
+
+        Returns:
+            La mesure (etape, duree, cpu, memoire_pic, erreur), remplie à la
+            sortie du bloc
+        """
+        mesure = {'etape': nom, 'duree': 0.0, 'cpu': 0.0, 'memoire_pic': None, 'erreur': False}
+        demarre = False
+        base = 0
+        if self.memoire:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                demarre = True
+            base = tracemalloc.get_traced_memory()[0]
+
+        debut, debut_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield mesure
+        except BaseException:
+            mesure['erreur'] = True
+            raise
+        finally:
+            mesure['duree'] = time.perf_counter() - debut
+            mesure['cpu'] = time.process_time() - debut_cpu
+            if self.memoire:
+                mesure['memoire_pic'] = max(0, tracemalloc.get_traced_memory()[1] - base)
+                if demarre:
+                    tracemalloc.stop()
+            self.etapes.append(mesure)
+            for rappel in self.rappels:
+                rappel(mesure)
+
+    def total(self, critere: str = 'duree') -> float:
+        """Somme d'un critère ('duree' ou 'cpu') sur toutes les étapes"""
+        return sum(mesure[critere] for mesure in self.etapes)
+
+    def etape(self, nom: str) -> Optional[dict]:
+        """Dernière mesure d'une étape (None si elle n'a pas été mesurée)"""
+        for mesure in reversed(self.etapes):
+            if mesure['etape'] == nom:
+                return mesure
+        return None
+
+    def en_dict(self) -> dict:
+        """Enregistrement structuré : contexte, mesures et totaux"""
+        pics = [m['memoire_pic'] for m in self.etapes if m['memoire_pic'] is not None]
+        return {
+            'contexte': dict(self.contexte),
+            'etapes': [dict(mesure) for mesure in self.etapes],
+            'total': {
+                'duree': self.total('duree'),
+                'cpu': self.total('cpu'),
+                'memoire_pic': max(pics) if pics else None
+            }
+        }
+
+    def en_json(self, **options) -> str:
+        """Enregistrement structuré en JSON (options passées à json.dumps)"""
+        return json.dumps(self.en_dict(), ensure_ascii=False, **options)
+
+    def vider(self):
+        """Oublie les mesures et le contexte"""
+        self.etapes = []
+        self.contexte = {}
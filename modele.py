@@ -0,0 +1,217 @@
+import hashlib
+import io
+from typing import Dict, Iterable, Optional, Tuple, Union
+from analyseur import AnalyseurFrequences
+from constructeur_arbre import ConstructeurArbre
+from generateur_codes import GenerateurCodes
+from conteneur import ConteneurHuffman
+from decodeur import DecodeurTable
+from ecrivain_bits import EcrivainBits
+
+
+class ModeleHuffman:
+    """
+    Table de codes entraînée une fois sur un corpus et partagée par de
+    nombreuses compressions.
+
+    Un texte compressé avec le modèle ne stocke que l'identifiant du modèle :
+    ni analyse des fréquences, ni construction d'arbre, ni table des codes.
+    Un symbole absent du modèle est écrit avec le code d'échappement, et sa
+    valeur est ajoutée à la liste des symboles échappés du conteneur.
+    """
+
+    # Clé du symbole d'échappement dans les longueurs et les codes
+    # (placée avant les autres symboles de même longueur dans l'ordre canonique)
+    ECHAPPEMENT_TEXTE = ''
+    ECHAPPEMENT_OCTETS = 256
+
+    def __init__(self, longueurs: Dict, longueur_echappement: int, octets: bool = False):
+        """
+        Args:
+            longueurs: Longueur du code de chaque symbole du modèle
+            longueur_echappement: Longueur du code d'échappement
+            octets: Modèle de symboles octets (0-255) au lieu de caractères
+        """
+        self.octets = octets
+        self.echappement = self.ECHAPPEMENT_OCTETS if octets else self.ECHAPPEMENT_TEXTE
+
+        tous = dict(longueurs)
+        tous[self.echappement] = longueur_echappement
+        codes = GenerateurCodes.generer_canonique(tous)
+        self.code_echappement = codes.pop(self.echappement)
+        self.codes = codes
+        self.identifiant = ModeleHuffman._calculer_identifiant(longueurs, longueur_echappement, octets)
+
+        self._decodeur = None
+        self._marque = None
+
+    @staticmethod
+    def entrainer(textes: Iterable[Union[str, bytes]], octets: bool = False,
+                  longueur_max: Optional[int] = None) -> 'ModeleHuffman':
+        """
+        Entraîne un modèle sur un corpus d'exemples.
+
+        Args:
+            textes: Textes du corpus (bytes en mode octets)
+            octets: Modèle de symboles octets
+            longueur_max: Longueur maximale des codes (None : pas de limite)
+
+        Returns:
+            Le modèle entraîné
+        """
+        if octets:
+            tableau = AnalyseurFrequences.calculer_frequences_octets(textes)
+            frequences = {octet: freq for octet, freq in enumerate(tableau) if freq}
+        else:
+            frequences = AnalyseurFrequences.calculer_frequences_flux(textes)
+
+        # L'échappement compte comme un symbole rare
+        echappement = ModeleHuffman.ECHAPPEMENT_OCTETS if octets else ModeleHuffman.ECHAPPEMENT_TEXTE
+        frequences[echappement] = 1
+
+        if longueur_max:
+            racine = ConstructeurArbre.construire_limite(frequences, longueur_max)
+        else:
+            racine = ConstructeurArbre.construire_lineaire(frequences)
+        longueurs = GenerateurCodes.longueurs(GenerateurCodes.generer(racine))
+        longueur_echappement = longueurs.pop(echappement)
+        return ModeleHuffman(longueurs, longueur_echappement, octets)
+
+    @staticmethod
+    def charger(fichier: str) -> 'ModeleHuffman':
+        """Charge un modèle sauvegardé par sauvegarder"""
+        with open(fichier, 'rb') as f:
+            donnees = ConteneurHuffman.lire_modele(f)
+        modele = ModeleHuffman(
+            donnees['longueurs'],
+            donnees['longueur_echappement'],
+            bool(donnees['drapeaux'] & ConteneurHuffman.OCTETS)
+        )
+        if modele.identifiant != donnees['identifiant']:
+            raise ValueError("Modèle corrompu : identifiant incorrect")
+        return modele
+
+    def sauvegarder(self, fichier: str):
+        """Sauvegarde le modèle (seules les longueurs des codes sont stockées)"""
+        drapeaux = ConteneurHuffman.OCTETS if self.octets else 0
+        with open(fichier, 'wb') as f:
+            ConteneurHuffman.ecrire_modele(
+                f, self.identifiant, self.codes, len(self.code_echappement), drapeaux
+            )
+
+    def compresser(self, texte: Union[str, bytes]) -> bytes:
+        """
+        Compresse un texte en un conteneur .huff qui référence le modèle.
+
+        Returns:
+            Le contenu du fichier .huff
+        """
+        charge, nb_bits_dernier, echappes = self.encoder(texte)
+        flux = io.BytesIO()
+        ConteneurHuffman.ecrire_avec_modele(
+            flux, self.identifiant, charge, nb_bits_dernier, len(texte), echappes,
+            ConteneurHuffman.OCTETS if self.octets else 0
+        )
+        return flux.getvalue()
+
+    def decompresser(self, donnees: bytes) -> Union[str, bytes]:
+        """
+        Décompresse un conteneur produit par compresser.
+
+        Raises:
+            ValueError: si le conteneur a été compressé avec un autre modèle
+        """
+        flux = io.BytesIO(donnees)
+        en_tete = ConteneurHuffman.lire_en_tete(flux)
+        self.verifier(en_tete)
+        charge = flux.read(en_tete['taille_charge'])
+        if len(charge) != en_tete['taille_charge']:
+            raise ValueError("Fichier .huff tronqué ou corrompu")
+        return self.decoder(charge, en_tete['nb_bits_dernier'], en_tete['echappes'])
+
+    def verifier(self, en_tete: dict):
+        """Vérifie qu'un en-tête lu par lire_en_tete référence bien ce modèle"""
+        if 'modele' not in en_tete:
+            raise ValueError("Ce fichier n'a pas été compressé avec un modèle")
+        if en_tete['modele'] != self.identifiant:
+            raise ValueError(
+                f"Ce fichier nécessite le modèle {en_tete['modele']:016x} "
+                f"(modèle fourni : {self.identifiant:016x})"
+            )
+
+    def encoder(self, texte: Union[str, bytes]) -> Tuple[bytes, int, bytes]:
+        """
+        Encode un texte avec les codes du modèle.
+
+        Returns:
+            (octets encodés, nombre de bits utiles du dernier octet,
+             symboles échappés en UTF-8 ou octets bruts)
+        """
+        absents = set(texte).difference(self.codes)
+        if self.octets:
+            table = GenerateurCodes.en_tableau(self.codes)
+            for octet in absents:
+                table[octet] = self.code_echappement
+            echappes = bytes(octet for octet in texte if octet in absents) if absents else b""
+        else:
+            table = self.codes
+            if absents:
+                table = dict(self.codes)
+                table.update(dict.fromkeys(absents, self.code_echappement))
+            echappes = ''.join(c for c in texte if c in absents).encode('utf-8') if absents else b""
+
+        ecrivain = EcrivainBits()
+        octets = ecrivain.ecrire_texte(texte, table)
+        dernier, bourrage = ecrivain.terminer()
+        charge = octets + dernier
+        nb_bits_dernier = 8 - bourrage if charge else 0
+        return charge, nb_bits_dernier, echappes
+
+    def decoder(self, charge: bytes, nb_bits_dernier: int, echappes: bytes) -> Union[str, bytes]:
+        """
+        Décode une charge produite par encoder.
+
+        Le code d'échappement est décodé comme une marque (un symbole absent
+        du modèle, donc qui n'apparaît qu'à la place des symboles échappés),
+        puis chaque marque est remplacée par le symbole échappé suivant.
+        """
+        texte = self._decodeur_table().decoder_octets(charge, nb_bits_dernier)
+        if not echappes:
+            return texte
+
+        symboles = echappes if self.octets else echappes.decode('utf-8')
+        marque = bytes([self._marque]) if self.octets else self._marque
+        morceaux = texte.split(marque)
+        if len(morceaux) != len(symboles) + 1:
+            raise ValueError("Données encodées corrompues")
+
+        resultat = [morceaux[0]]
+        for i, morceau in enumerate(morceaux[1:]):
+            resultat.append(symboles[i:i + 1])
+            resultat.append(morceau)
+        return (b"" if self.octets else "").join(resultat)
+
+    def _decodeur_table(self) -> DecodeurTable:
+        """Décodeur par tables du modèle, construit une seule fois"""
+        if self._decodeur is None:
+            if self.octets:
+                # Modèle des 256 octets : aucun échappement possible, pas de marque
+                self._marque = next((o for o in range(256) if o not in self.codes), None)
+            else:
+                self._marque = next(chr(p) for p in range(0x110000) if chr(p) not in self.codes)
+            codes = dict(self.codes)
+            if self._marque is not None:
+                codes[self._marque] = self.code_echappement
+            self._decodeur = DecodeurTable(codes, octets=self.octets)
+        return self._decodeur
+
+    @staticmethod
+    def _calculer_identifiant(longueurs: Dict, longueur_echappement: int, octets: bool) -> int:
+        """Identifiant du modèle : empreinte de ses longueurs de codes (64 bits)"""
+        empreinte = hashlib.blake2b(digest_size=8)
+        empreinte.update(b'o' if octets else b't')
+        empreinte.update(bytes([longueur_echappement]))
+        for symbole in sorted(longueurs):
+            valeur = bytes([symbole]) if octets else symbole.encode('utf-8')
+            empreinte.update(bytes([len(valeur)]) + valeur + bytes([longueurs[symbole]]))
+        return int.from_bytes(empreinte.digest(), 'big')
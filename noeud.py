@@ -7,8 +7,14 @@ class NoeudHuffman:
         frequence: La fréquence d'apparition
         gauche: Enfant gauche (pour code 0)
         droite: Enfant droit (pour code 1)
+        historique: Sur la racine seulement, et si demandé à la construction :
+                    liste des fusions (fréquence gauche, fréquence droite)
+    
+    Les attributs sont déclarés dans __slots__ : pas de __dict__ par nœud.
     """
     
+    __slots__ = ('caractere', 'frequence', 'gauche', 'droite', 'historique')
+    
     def __init__(self, caractere=None, frequence=0):
         self.caractere = caractere
         self.frequence = frequence
@@ -0,0 +1,41 @@
+from typing import Iterator, Tuple
+
+
+class ParcoursArbre:
+    """
+    Parcours d'arbre sans récursion, partagé par la génération des codes
+    et la visualisation.
+
+    Une pile explicite remplace la pile d'appels : la profondeur de l'arbre
+    n'est plus limitée par la limite de récursion de Python.
+    """
+
+    @staticmethod
+    def prefixe(racine) -> Iterator[Tuple[object, int, int]]:
+        """
+        Parcourt l'arbre en ordre préfixe (nœud, puis gauche, puis droite).
+
+        Le chemin depuis la racine est accumulé dans un entier : un bit par
+        niveau, 0 à gauche et 1 à droite. Le dernier bit du chemin indique
+        donc de quel côté le nœud est rattaché à son parent.
+
+        Args:
+            racine: La racine de l'arbre (None pour un arbre vide)
+
+        Returns:
+            Itérateur sur (nœud, profondeur, chemin)
+        """
+        if racine is None:
+            return
+
+        pile = [(racine, 0, 0)]
+        while pile:
+            noeud, profondeur, chemin = pile.pop()
+            yield noeud, profondeur, chemin
+
+            if not noeud.est_feuille():
+                # Droite empilée d'abord pour visiter la gauche en premier
+                if noeud.droite is not None:
+                    pile.append((noeud.droite, profondeur + 1, (chemin << 1) | 1))
+                if noeud.gauche is not None:
+                    pile.append((noeud.gauche, profondeur + 1, chemin << 1))
@@ -11,9 +11,17 @@ class Statistiques:
         Returns:
             Dictionnaire avec toutes les statistiques
         """
-        taille_originale = len(texte_original) * 8
-        taille_compressee = len(texte_encode)
+        return Statistiques.calculer_depuis_tailles(len(texte_original) * 8, len(texte_encode))
+    
+    @staticmethod
+    def calculer_depuis_tailles(taille_originale: int, taille_compressee: int) -> dict:
+        """
+        Calcule les statistiques à partir des tailles en bits
+        (utile quand le texte encodé n'existe que sous forme d'octets).
         
+        Returns:
+            Dictionnaire avec toutes les statistiques
+        """
         taux_compression = taille_compressee / taille_originale if taille_originale > 0 else 0
         gain = 1 - taux_compression
         facteur = taille_originale / taille_compressee if taille_compressee > 0 else 0
@@ -30,6 +38,20 @@ class Statistiques:
             'facteur_compression': facteur
         }
     
+    @staticmethod
+    def calculer_depuis_codes(frequences: Dict[str, int], codes: Dict[str, str]) -> dict:
+        """
+        Calcule les statistiques sans encoder le texte : la taille encodée
+        est la somme des fréquence × longueur du code de chaque caractère
+        (temps proportionnel à la taille de l'alphabet, pas du texte).
+        
+        Returns:
+            Dictionnaire avec toutes les statistiques
+        """
+        nb_caracteres = sum(frequences.values())
+        taille_compressee = sum(freq * len(codes[caractere]) for caractere, freq in frequences.items())
+        return Statistiques.calculer_depuis_tailles(nb_caracteres * 8, taille_compressee)
+    
     @staticmethod
     def formater_taille(bits: int) -> str:
         """Formate une taille en bits de manière lisible"""
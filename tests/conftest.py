@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Les modules du projet sont à la racine du dépôt
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
@@ -0,0 +1,36 @@
+import pytest
+from constructeur_arbre import ConstructeurArbre
+from gestion_fichiers import GestionFichiers
+from generateur_codes import GenerateurCodes
+from huffman import CompressionHuffman
+
+
+def test_construire_limite_vide():
+    assert ConstructeurArbre.longueurs_limitees({}, 8) == {}
+    assert GenerateurCodes.generer(ConstructeurArbre.construire_limite({}, 8)) == {}
+
+
+def test_construire_vide():
+    assert GenerateurCodes.generer(ConstructeurArbre.construire({})) == {}
+
+
+@pytest.mark.parametrize("longueur_max", [None, 8])
+def test_compression_texte_vide(longueur_max):
+    compression = CompressionHuffman("", longueur_max=longueur_max).executer(afficher_details=False)
+    assert compression.codes == {}
+
+
+@pytest.mark.parametrize("options", [
+    {}, {'canonique': True}, {'octets': True}, {'taille_bloc': 100},
+], ids=["defaut", "canonique", "octets", "blocs"])
+def test_fichier_vide_longueur_max(tmp_path, options):
+    entree = tmp_path / "vide.txt"
+    entree.write_bytes(b"")
+    compresse = str(tmp_path / "vide.huff")
+    restaure = str(tmp_path / "vide.out")
+
+    assert GestionFichiers.compresser_fichier(str(entree), compresse, afficher_details=False,
+                                              longueur_max=8, **options)
+    assert GestionFichiers.decompresser_fichier(compresse, restaure, afficher_details=False)
+    with open(restaure, 'rb') as f:
+        assert f.read() == b""
@@ -0,0 +1,29 @@
+import pytest
+from decodeur import DecodeurTable
+from encodeur import Encodeur
+
+
+CODES = {'a': '0', 'b': '10', 'c': '110', 'd': '111'}
+TEXTES = ["a", "ab", "abcd", "dcbaabcd" * 37, "abacabad" * 100 + "c"]
+
+
+def test_deux_symboles_k_petit():
+    decodeur = DecodeurTable({'a': '0', 'b': '1'}, k=4)
+    assert decodeur.decoder_octets(b'\x40', 2) == 'ab'
+
+
+@pytest.mark.parametrize("k", range(1, 8))
+@pytest.mark.parametrize("texte", TEXTES, ids=range(len(TEXTES)))
+def test_decoder_flux_k_petit(k, texte):
+    donnees, nb_bits_dernier = Encodeur.empaqueter(Encodeur.encoder(texte, CODES))
+    decodeur = DecodeurTable(CODES, k=k)
+    morceaux = [donnees[i:i + 3] for i in range(0, len(donnees), 3)]
+    assert "".join(decodeur.decoder_flux(morceaux, nb_bits_dernier)) == texte
+
+
+@pytest.mark.parametrize("k", range(1, 8))
+@pytest.mark.parametrize("texte", TEXTES, ids=range(len(TEXTES)))
+def test_decoder_vue_k_petit(k, texte):
+    donnees, nb_bits_dernier = Encodeur.empaqueter(Encodeur.encoder(texte, CODES))
+    decodeur = DecodeurTable(CODES, k=k)
+    assert "".join(decodeur.decoder_vue(memoryview(donnees), nb_bits_dernier, 2)) == texte
@@ -1,6 +1,7 @@
 
 
 from noeud import NoeudHuffman
+from parcours import ParcoursArbre
 from typing import Dict
 import os
 import subprocess
@@ -37,14 +38,13 @@ class Visualiseur:
             dot_content.append('    node [shape=circle, style=filled];')
             dot_content.append('    rankdir=TB;')
             
-            node_id = [0]  # Compteur pour les IDs uniques
+            # ids[p] : ID du dernier nœud rencontré à la profondeur p
+            # (en ordre préfixe, c'est le parent des nœuds de profondeur p + 1)
+            ids = []
             
-            def ajouter_noeud(noeud, parent_id=None, direction=None):
-                if noeud is None:
-                    return
-                
-                current_id = node_id[0]
-                node_id[0] += 1
+            for current_id, (noeud, profondeur, chemin) in enumerate(ParcoursArbre.prefixe(racine)):
+                del ids[profondeur:]
+                ids.append(current_id)
                 
                 # Style du nœud
                 if noeud.est_feuille():
@@ -68,16 +68,11 @@ class Visualiseur:
                 dot_content.append(f'    node{current_id} [label="{label}", fillcolor="{color}"];')
                 
                 # Ajouter l'arête si ce n'est pas la racine
-                if parent_id is not None:
-                    edge_label = direction
+                if profondeur > 0:
+                    parent_id = ids[profondeur - 1]
+                    edge_label = chemin & 1
                     dot_content.append(f'    node{parent_id} -> node{current_id} [label="{edge_label}"];')
-                
-                # Récursion pour les enfants
-                if not noeud.est_feuille():
-                    ajouter_noeud(noeud.gauche, current_id, "0")
-                    ajouter_noeud(noeud.droite, current_id, "1")
             
-            ajouter_noeud(racine)
             dot_content.append("}")
             
             # Écrire le fichier DOT
@@ -142,27 +137,26 @@ class Visualiseur:
     @staticmethod
     def afficher_arbre_ascii(racine: NoeudHuffman, prefixe: str = "", est_gauche: bool = True):
         """Affiche l'arbre en ASCII art dans la console"""
-        if racine is None:
-            return
-        
-        print(prefixe + ("├── " if est_gauche else "└── "), end="")
-        
-        if racine.est_feuille():
-            car = racine.caractere
-            if car == ' ':
-                car = '␣'
-            elif car == '\n':
-                car = '↵'
-            elif car == '\t':
-                car = '⇥'
-            print(f"[{car}:{racine.frequence}]")
-        else:
-            print(f"({racine.frequence})")
+        # prefixes[p] : préfixe des enfants du dernier nœud de profondeur p
+        prefixes = []
         
-        # Récursion pour les enfants
-        if not racine.est_feuille():
-            nouveau_prefixe = prefixe + ("│   " if est_gauche else "    ")
-            if racine.gauche:
-                Visualiseur.afficher_arbre_ascii(racine.gauche, nouveau_prefixe, True)
-            if racine.droite:
-                Visualiseur.afficher_arbre_ascii(racine.droite, nouveau_prefixe, False)
\ No newline at end of file
+        for noeud, profondeur, chemin in ParcoursArbre.prefixe(racine):
+            if profondeur > 0:
+                prefixe = prefixes[profondeur - 1]
+                est_gauche = (chemin & 1) == 0
+            del prefixes[profondeur:]
+            prefixes.append(prefixe + ("│   " if est_gauche else "    "))
+            
+            print(prefixe + ("├── " if est_gauche else "└── "), end="")
+            
+            if noeud.est_feuille():
+                car = noeud.caractere
+                if car == ' ':
+                    car = '␣'
+                elif car == '\n':
+                    car = '↵'
+                elif car == '\t':
+                    car = '⇥'
+                print(f"[{car}:{noeud.frequence}]")
+            else:
+                print(f"({noeud.frequence})")
\ No newline at end of file